@@ -0,0 +1,61 @@
+"""
+Picks the highest bcrypt cost whose verify stays within a target latency
+on this machine, to be set as `BCRYPT_ROUNDS`:
+    python scripts/bcrypt/calibrate_rounds.py --target-ms 250
+"""
+
+import argparse
+import statistics
+from time import perf_counter
+
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.adapters.password_hasher_bcrypt import (
+    BcryptPasswordHasher,
+    BcryptRounds,
+)
+from app.infrastructure.adapters.password_pepper import PasswordPepper
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 31
+
+
+def measure_verify_ms(rounds: int, samples: int) -> float:
+    hasher = BcryptPasswordHasher(PasswordPepper("Calibration"), BcryptRounds(rounds))
+    raw_password = RawPassword("calibration-password")
+    hashed_password = hasher.hash(raw_password)
+
+    timings_ms: list[float] = []
+    for _ in range(samples):
+        started_at = perf_counter()
+        hasher.verify(raw_password=raw_password, hashed_password=hashed_password)
+        timings_ms.append((perf_counter() - started_at) * 1000)
+    return statistics.median(timings_ms)
+
+
+def calibrate(target_ms: float, samples: int) -> int:
+    """
+    Each extra round doubles the work, so the search stops
+    at the first cost over the target.
+    """
+    chosen = MIN_ROUNDS
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        verify_ms = measure_verify_ms(rounds, samples)
+        print(f"rounds {rounds:2d}: {verify_ms:9.1f} ms")
+        if verify_ms > target_ms:
+            break
+        chosen = rounds
+    return chosen
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args()
+
+    rounds = calibrate(args.target_ms, args.samples)
+    print(f"\nBCRYPT_ROUNDS = {rounds}")
+
+
+if __name__ == "__main__":
+    main()
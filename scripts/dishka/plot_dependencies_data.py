@@ -7,7 +7,10 @@ from app.setup.ioc.provider_registry import get_providers
 
 
 def make_plot_data_container(settings: AppSettings) -> AsyncContainer:
-    return make_async_container(*get_providers(), context={AppSettings: settings})
+    return make_async_container(
+        *get_providers(settings),
+        context={AppSettings: settings},
+    )
 
 
 def generate_dependency_graph_d2(container: AsyncContainer) -> str:
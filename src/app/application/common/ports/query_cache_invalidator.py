@@ -0,0 +1,14 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.application.common.query_cache import QueryCacheTag
+
+
+class QueryCacheInvalidator(Protocol):
+    @abstractmethod
+    async def invalidate(self, *tags: QueryCacheTag) -> None:
+        """
+        To be called once a change to the tagged data is committed.
+        Never raises: a failed invalidation leaves results stale
+        until their TTL runs out.
+        """
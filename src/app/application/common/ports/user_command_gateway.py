@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Collection
 from typing import Protocol
 
 from app.domain.entities.user import User
@@ -28,3 +29,15 @@ class UserCommandGateway(Protocol):
         """
         :raises DataMapperError:
         """
+
+    @abstractmethod
+    async def read_by_usernames(
+        self,
+        usernames: Collection[Username],
+        for_update: bool = False,
+    ) -> list[User]:
+        """
+        In a single query; locks rows in username order when `for_update`.
+
+        :raises DataMapperError:
+        """
@@ -0,0 +1,18 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.application.common.query_params.pagination import TotalCountMode
+
+
+class UserCounter(Protocol):
+    @abstractmethod
+    async def count(self, mode: TotalCountMode) -> int:
+        """
+        :raises ReaderError:
+        """
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """
+        To be called once a change to the counted users is committed.
+        """
@@ -1,8 +1,13 @@
 from abc import abstractmethod
+from collections.abc import AsyncGenerator
 from typing import Protocol
 
-from app.application.common.query_models.user import UserQueryModel
-from app.application.common.query_params.user import UserListParams
+from app.application.common.query_models.user import UserQueryModel, UserQueryPage
+from app.application.common.query_params.user import (
+    UserListKeysetParams,
+    UserListParams,
+    UserListSorting,
+)
 
 
 class UserQueryGateway(Protocol):
@@ -14,3 +19,28 @@ class UserQueryGateway(Protocol):
         """
         :raises ReaderError:
         """
+
+    @abstractmethod
+    async def read_page(
+        self,
+        user_read_page_params: UserListKeysetParams,
+    ) -> UserQueryPage | None:
+        """
+        Keyset pagination: resumes right after the cursor's row,
+        so a page costs the same at any depth.
+
+        :raises ReaderError:
+        :raises PaginationError:
+        """
+
+    @abstractmethod
+    async def stream_all(
+        self,
+        sorting: UserListSorting,
+    ) -> AsyncGenerator[list[UserQueryModel]] | None:
+        """
+        All users, in chunks of bounded size, read lazily from the database.
+        The query is started here, so it fails here; iterate to the end or `aclose()`.
+
+        :raises ReaderError:
+        """
@@ -0,0 +1,43 @@
+from collections.abc import Callable
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import timedelta
+from enum import StrEnum
+from typing import Any
+
+from diator.requests import Request
+
+
+class QueryCacheTag(StrEnum):
+    """What a cached result depends on; invalidated as changes to it commit."""
+
+    USERS = "users"
+
+
+# Set per instance, such as a request ID, so never part of a key
+_REQUEST_BASE_FIELDS = (
+    frozenset(field.name for field in fields(Request)) if is_dataclass(Request) else ()
+)
+
+
+def request_fields_key(request: Request) -> str:
+    """Every field of a dataclass request, in declaration order."""
+    return repr(
+        tuple(
+            getattr(request, field.name)
+            for field in fields(request)
+            if field.name not in _REQUEST_BASE_FIELDS
+        ),
+    )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class QueryCachePolicy:
+    """
+    Opts a query in to result caching. Results are kept per role of the
+    subject, so only queries whose result and authorization depend on nothing
+    else about the subject may opt in.
+    """
+
+    ttl: timedelta
+    tags: tuple[QueryCacheTag, ...]
+    key: Callable[[Any], str] = request_fields_key
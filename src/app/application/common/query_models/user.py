@@ -13,5 +13,10 @@ class UserQueryModel(TypedDict):
     is_active: bool
 
 
+class UserQueryPage(TypedDict):
+    users: list[UserQueryModel]
+    next_cursor: str | None
+
+
 class Query[E: Entity[EntityId]](TypedDict):
     pass
@@ -1,8 +1,26 @@
 from dataclasses import dataclass
+from enum import StrEnum
 
 from app.application.common.exceptions.query import PaginationError
 
 
+class PaginationMode(StrEnum):
+    OFFSET = "offset"
+    CURSOR = "cursor"
+
+
+class TotalCountMode(StrEnum):
+    """
+    - Exact: `COUNT(*)`, a full index scan on every request.
+    - Estimate: the planner's row estimate; free, but only as fresh as `ANALYZE`.
+    - Cached: an exact count, recounted in the background.
+    """
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    CACHED = "cached"
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class Pagination:
     """
@@ -17,3 +35,19 @@ class Pagination:
             raise PaginationError(f"Limit must be greater than 0, got {self.limit}")
         if self.offset < 0:
             raise PaginationError(f"Offset must be non-negative, got {self.offset}")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KeysetPagination:
+    """
+    raises PaginationError
+
+    `cursor` is opaque, as returned with the previous page; `None` for the first one.
+    """
+
+    limit: int
+    cursor: str | None = None
+
+    def __post_init__(self):
+        if self.limit <= 0:
+            raise PaginationError(f"Limit must be greater than 0, got {self.limit}")
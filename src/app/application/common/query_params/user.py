@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
-from app.application.common.query_params.pagination import Pagination
+from app.application.common.query_params.pagination import (
+    KeysetPagination,
+    Pagination,
+)
 from app.application.common.query_params.sorting import SortingOrder
 
 
@@ -14,3 +17,9 @@ class UserListSorting:
 class UserListParams:
     pagination: Pagination
     sorting: UserListSorting
+
+
+@dataclass(frozen=True, slots=True)
+class UserListKeysetParams:
+    pagination: KeysetPagination
+    sorting: UserListSorting
@@ -1,7 +1,15 @@
+from datetime import timedelta
+from typing import Any
+
 from diator.events import EventMap
-from diator.requests import RequestMap
+from diator.requests import Request, RequestHandler
 
+from app.application.common.query_cache import QueryCachePolicy, QueryCacheTag
 from app.application.features.user.commands import (
+    ActivateUserCommand,
+    ActivateUserCommandHandler,
+    BatchUserCommand,
+    BatchUserCommandHandler,
     ChangePasswordCommand,
     ChangePasswordCommandHandler,
     CreateUserCommand,
@@ -14,22 +22,40 @@ from app.application.features.user.commands import (
     RevokeAdminCommandHandler,
 )
 from app.application.features.user.queries import (
+    ExportUsersQuery,
+    ExportUsersQueryHandler,
     ListUsersQuery,
     ListUsersQueryHandler,
 )
 
 # Requests
-request_map = RequestMap()
+request_handlers: dict[type[Request], type[RequestHandler[Any, Any]]] = {
+    # Commands
+    CreateUserCommand: CreateUserCommandHandler,
+    ActivateUserCommand: ActivateUserCommandHandler,
+    BatchUserCommand: BatchUserCommandHandler,
+    ChangePasswordCommand: ChangePasswordCommandHandler,
+    DeactivateUserCommand: DeactivateUserCommandHandler,
+    GrantAdminCommand: GrantAdminCommandHandler,
+    RevokeAdminCommand: RevokeAdminCommandHandler,
+    # Queries
+    ListUsersQuery: ListUsersQueryHandler,
+    ExportUsersQuery: ExportUsersQueryHandler,
+}
 
-# Commands
-request_map.bind(CreateUserCommand, CreateUserCommandHandler)
-request_map.bind(ChangePasswordCommand, ChangePasswordCommandHandler)
-request_map.bind(DeactivateUserCommand, DeactivateUserCommandHandler)
-request_map.bind(GrantAdminCommand, GrantAdminCommandHandler)
-request_map.bind(RevokeAdminCommand, RevokeAdminCommandHandler)
+# Most SQL statements a request may issue, authentication included
+statement_budgets: dict[type[Request], int] = {
+    ListUsersQuery: 6,
+    ExportUsersQuery: 4,
+}
 
-# Queries
-request_map.bind(ListUsersQuery, ListUsersQueryHandler)
+# Results cached per role of the subject, see `QueryCachePolicy`
+query_cache_policies: dict[type[Request], QueryCachePolicy] = {
+    ListUsersQuery: QueryCachePolicy(
+        ttl=timedelta(seconds=5),
+        tags=(QueryCacheTag.USERS,),
+    ),
+}
 
 # Events
 event_map = EventMap()
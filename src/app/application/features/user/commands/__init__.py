@@ -1,4 +1,5 @@
 from .activate import ActivateUserCommand, ActivateUserCommandHandler
+from .batch import BatchUserCommand, BatchUserCommandHandler
 from .change_password import ChangePasswordCommand, ChangePasswordCommandHandler
 from .create import CreateUserCommand, CreateUserCommandHandler
 from .deactivate import DeactivateUserCommand, DeactivateUserCommandHandler
@@ -8,6 +9,8 @@ from .revoke_admin import RevokeAdminCommand, RevokeAdminCommandHandler
 __all__ = [
     "ActivateUserCommand",
     "ActivateUserCommandHandler",
+    "BatchUserCommand",
+    "BatchUserCommandHandler",
     "ChangePasswordCommand",
     "ChangePasswordCommandHandler",
     "CreateUserCommand",
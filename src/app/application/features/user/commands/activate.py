@@ -3,8 +3,13 @@ from dataclasses import dataclass
 
 from diator.requests import Request, RequestHandler
 
+from app.application.common.ports.query_cache_invalidator import (
+    QueryCacheInvalidator,
+)
 from app.application.common.ports.uow import AsyncBaseUnitOfWork
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.query_cache import QueryCacheTag
 from app.application.common.services.authorization.authorize import (
     authorize,
 )
@@ -42,12 +47,16 @@ class ActivateUserCommandHandler(RequestHandler[ActivateUserCommand, None]):
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         uow: AsyncBaseUnitOfWork,
+        user_counter: UserCounter,
+        query_cache: QueryCacheInvalidator,
     ):
         super().__init__()
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._uow = uow
+        self._user_counter = user_counter
+        self._query_cache = query_cache
 
     async def handle(self, request_data: ActivateUserCommand) -> None:
         """
@@ -91,6 +100,8 @@ class ActivateUserCommandHandler(RequestHandler[ActivateUserCommand, None]):
 
         self._user_service.toggle_user_activation(user, is_active=True)
         await self._uow.commit()
+        self._user_counter.invalidate()
+        await self._query_cache.invalidate(QueryCacheTag.USERS)
 
         log.info(
             "Activate user: done. Username: '%s'.",
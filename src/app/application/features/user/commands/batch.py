@@ -0,0 +1,325 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TypedDict
+from uuid import UUID
+
+from diator.requests import Request, RequestHandler
+from diator.responses import Response
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.flusher import Flusher
+from app.application.common.ports.query_cache_invalidator import (
+    QueryCacheInvalidator,
+)
+from app.application.common.ports.uow import AsyncBaseUnitOfWork
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.query_cache import QueryCacheTag
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    CanManageSubordinate,
+    RoleManagementContext,
+    UserManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.application.features.user.commands.activate import ActivateUserCommand
+from app.application.features.user.commands.create import CreateUserCommand
+from app.application.features.user.commands.deactivate import DeactivateUserCommand
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.exceptions.base import DomainError, DomainFieldError
+from app.domain.exceptions.user import (
+    UsernameAlreadyExistsError,
+    UserNotFoundByUsernameError,
+)
+from app.domain.services.user import UserService
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.domain.value_objects.username.username import Username
+
+log = logging.getLogger(__name__)
+
+type BatchUserCommandItem = (
+    CreateUserCommand | ActivateUserCommand | DeactivateUserCommand
+)
+
+
+class BatchMode(StrEnum):
+    ALL_OR_NOTHING = "all_or_nothing"
+    BEST_EFFORT = "best_effort"
+
+
+class BatchItemStatus(StrEnum):
+    DONE = "done"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+class BatchItemResult(TypedDict):
+    status: BatchItemStatus
+    id: UUID | None
+    error: str | None
+
+
+@dataclass(kw_only=True)
+class BatchUserCommandResult(Response):
+    committed: bool
+    results: list[BatchItemResult]
+
+
+@dataclass(kw_only=True)
+class BatchUserCommand(Request[BatchUserCommandResult]):
+    """
+    - Open to admins.
+    - Creates, activates and deactivates users in one transaction,
+    under the same rules as each command on its own.
+    - All or nothing by default: an item failing skips every item.
+    Best effort commits every item that does not fail.
+    - A username taken concurrently fails its item, as if taken already;
+    taken concurrently twice in a row, it fails the batch.
+    - Returns a result per item, in order.
+    """
+
+    items: list[BatchUserCommandItem]
+    mode: BatchMode = BatchMode.ALL_OR_NOTHING
+
+
+class BatchUserCommandHandler(RequestHandler[BatchUserCommand, BatchUserCommandResult]):
+    """
+    Authenticates once, reads every user the items refer to in one query
+    and writes them in one flush, so SQLAlchemy inserts and updates
+    many rows per statement.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_service: UserService,
+        user_command_gateway: UserCommandGateway,
+        flusher: Flusher,
+        uow: AsyncBaseUnitOfWork,
+        user_counter: UserCounter,
+        query_cache: QueryCacheInvalidator,
+        access_revoker: AccessRevoker,
+    ):
+        super().__init__()
+        self._current_user_service = current_user_service
+        self._user_service = user_service
+        self._user_command_gateway = user_command_gateway
+        self._flusher = flusher
+        self._uow = uow
+        self._user_counter = user_counter
+        self._query_cache = query_cache
+        self._access_revoker = access_revoker
+
+    async def handle(self, req: BatchUserCommand) -> BatchUserCommandResult:
+        """
+        Items fail on their own with domain and authorization errors.
+
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises UsernameAlreadyExistsError:
+        """
+        log.info(
+            "Batch user commands: started. Items: %d, mode: '%s'.",
+            len(req.items),
+            req.mode,
+        )
+
+        try:
+            return await self._run(req)
+        except UsernameAlreadyExistsError:
+            # Inserted by another request since read. Read again,
+            # so that its item fails on its own.
+            log.info("Batch user commands: username taken concurrently, retrying.")
+            await self._uow.rollback()
+            return await self._run(req)
+
+    async def _run(self, req: BatchUserCommand) -> BatchUserCommandResult:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises UsernameAlreadyExistsError:
+        """
+        current_user = await self._current_user_service.get_current_user()
+
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.USER,
+            ),
+        )
+
+        users = await self._read_referenced_users(req.items)
+        results, created, deactivated = await self._apply_all(
+            current_user,
+            req,
+            users,
+        )
+
+        failed = any(result["status"] == BatchItemStatus.FAILED for result in results)
+        if failed and req.mode == BatchMode.ALL_OR_NOTHING:
+            await self._uow.rollback()
+            log.info("Batch user commands: rolled back. Items: %d.", len(req.items))
+            return BatchUserCommandResult(
+                committed=False,
+                results=[
+                    result if result["status"] == BatchItemStatus.FAILED else _skipped()
+                    for result in results
+                ],
+            )
+
+        if not any(result["status"] == BatchItemStatus.DONE for result in results):
+            log.info("Batch user commands: nothing to commit.")
+            return BatchUserCommandResult(committed=False, results=results)
+
+        await self._commit(created, deactivated)
+
+        log.info("Batch user commands: done. Items: %d.", len(req.items))
+        return BatchUserCommandResult(committed=True, results=results)
+
+    async def _apply_all(
+        self,
+        current_user: User,
+        req: BatchUserCommand,
+        users: dict[str, User],
+    ) -> tuple[list[BatchItemResult], list[User], list[User]]:
+        """
+        :returns: A result per item, created users and deactivated users.
+        """
+        results: list[BatchItemResult] = []
+        created: list[User] = []
+        deactivated: list[User] = []
+        failed = False
+        for item in req.items:
+            if failed and req.mode == BatchMode.ALL_OR_NOTHING:
+                results.append(_skipped())
+                continue
+            try:
+                user = await self._apply(current_user, item, users)
+            except (DomainError, AuthorizationError) as error:
+                failed = True
+                results.append(
+                    BatchItemResult(
+                        status=BatchItemStatus.FAILED,
+                        id=None,
+                        error=str(error),
+                    ),
+                )
+                continue
+
+            if isinstance(item, CreateUserCommand):
+                created.append(user)
+            elif isinstance(item, DeactivateUserCommand):
+                deactivated.append(user)
+            results.append(
+                BatchItemResult(
+                    status=BatchItemStatus.DONE,
+                    id=user.id_.value,
+                    error=None,
+                ),
+            )
+        return results, created, deactivated
+
+    async def _commit(self, created: list[User], deactivated: list[User]) -> None:
+        """
+        :raises DataMapperError:
+        :raises UsernameAlreadyExistsError:
+        """
+        for user in created:
+            self._user_command_gateway.add(user)
+
+        await self._flusher.flush()
+        await self._uow.commit()
+        self._user_counter.invalidate()
+        await self._query_cache.invalidate(QueryCacheTag.USERS)
+        # Unless activated again by a later item
+        for user in {user.id_.value: user for user in deactivated}.values():
+            if not user.is_active:
+                await self._access_revoker.remove_all_user_access(user.id_)
+
+    async def _read_referenced_users(
+        self,
+        items: Sequence[BatchUserCommandItem],
+    ) -> dict[str, User]:
+        """
+        Existing users the items refer to, by username, locked for update.
+        Invalid usernames are left for their items to fail on.
+
+        :raises DataMapperError:
+        """
+        usernames: dict[str, Username] = {}
+        for item in items:
+            try:
+                username = Username(item.username)
+            except DomainFieldError:
+                continue
+            usernames[username.value] = username
+
+        users = await self._user_command_gateway.read_by_usernames(
+            usernames.values(),
+            for_update=True,
+        )
+        return {user.username.value: user for user in users}
+
+    async def _apply(
+        self,
+        current_user: User,
+        item: BatchUserCommandItem,
+        users: dict[str, User],
+    ) -> User:
+        """
+        Changes nothing when raising.
+
+        :raises AuthorizationError:
+        :raises DomainError:
+        """
+        username = Username(item.username)
+        match item:
+            case CreateUserCommand():
+                authorize(
+                    CanManageRole(),
+                    context=RoleManagementContext(
+                        subject=current_user,
+                        target_role=item.role,
+                    ),
+                )
+                password = RawPassword(item.password)
+                if username.value in users:
+                    raise UsernameAlreadyExistsError(username.value)
+                user = await self._user_service.create_user(
+                    username,
+                    password,
+                    item.role,
+                )
+                users[username.value] = user
+                return user
+
+            case ActivateUserCommand() | DeactivateUserCommand():
+                user_or_none = users.get(username.value)
+                if user_or_none is None:
+                    raise UserNotFoundByUsernameError(username)
+                authorize(
+                    CanManageSubordinate(),
+                    context=UserManagementContext(
+                        subject=current_user,
+                        target=user_or_none,
+                    ),
+                )
+                self._user_service.toggle_user_activation(
+                    user_or_none,
+                    is_active=isinstance(item, ActivateUserCommand),
+                )
+                return user_or_none
+
+
+def _skipped() -> BatchItemResult:
+    return BatchItemResult(status=BatchItemStatus.SKIPPED, id=None, error=None)
@@ -81,7 +81,7 @@ class ChangePasswordCommandHandler(RequestHandler[ChangePasswordCommand, None]):
             ),
         )
 
-        self._user_service.change_password(user, password)
+        await self._user_service.change_password(user, password)
         await self._uow.commit()
 
         log.info("Change password: done.")
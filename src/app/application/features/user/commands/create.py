@@ -6,8 +6,13 @@ from diator.requests import Request, RequestHandler
 from diator.responses import Response
 
 from app.application.common.ports.flusher import Flusher
+from app.application.common.ports.query_cache_invalidator import (
+    QueryCacheInvalidator,
+)
 from app.application.common.ports.uow import AsyncBaseUnitOfWork
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.query_cache import QueryCacheTag
 from app.application.common.services.authorization.authorize import (
     authorize,
 )
@@ -53,6 +58,8 @@ class CreateUserCommandHandler(
         user_command_gateway: UserCommandGateway,
         flusher: Flusher,
         uow: AsyncBaseUnitOfWork,
+        user_counter: UserCounter,
+        query_cache: QueryCacheInvalidator,
     ):
         super().__init__()
         self._current_user_service = current_user_service
@@ -60,6 +67,8 @@ class CreateUserCommandHandler(
         self._user_command_gateway = user_command_gateway
         self._flusher = flusher
         self._uow = uow
+        self._user_counter = user_counter
+        self._query_cache = query_cache
 
     async def handle(self, req: CreateUserCommand) -> CreateUserCommandResult:
         """
@@ -87,7 +96,7 @@ class CreateUserCommandHandler(
 
         username = Username(req.username)
         password = RawPassword(req.password)
-        user = self._user_service.create_user(username, password, req.role)
+        user = await self._user_service.create_user(username, password, req.role)
 
         self._user_command_gateway.add(user)
 
@@ -97,6 +106,8 @@ class CreateUserCommandHandler(
             raise
 
         await self._uow.commit()
+        self._user_counter.invalidate()
+        await self._query_cache.invalidate(QueryCacheTag.USERS)
 
         log.info("Create user: done. Username: '%s'.", user.username.value)
         return CreateUserCommandResult(id=user.id_.value)
@@ -3,8 +3,12 @@ from dataclasses import dataclass
 
 from diator.requests import Request, RequestHandler
 
+from app.application.common.ports.query_cache_invalidator import (
+    QueryCacheInvalidator,
+)
 from app.application.common.ports.uow import AsyncBaseUnitOfWork
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.query_cache import QueryCacheTag
 from app.application.common.services.authorization.authorize import authorize
 from app.application.common.services.authorization.permissions import (
     CanManageRole,
@@ -38,12 +42,14 @@ class RevokeAdminCommandHandler(RequestHandler[RevokeAdminCommand, None]):
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         uow: AsyncBaseUnitOfWork,
+        query_cache: QueryCacheInvalidator,
     ):
         super().__init__()
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._uow = uow
+        self._query_cache = query_cache
 
     async def handle(self, request_data: RevokeAdminCommand) -> None:
         """
@@ -79,6 +85,7 @@ class RevokeAdminCommandHandler(RequestHandler[RevokeAdminCommand, None]):
 
         self._user_service.toggle_user_admin_role(user, is_admin=False)
         await self._uow.commit()
+        await self._query_cache.invalidate(QueryCacheTag.USERS)
 
         log.info(
             "Revoke admin: done. Username: '%s'.",
@@ -1,6 +1,10 @@
+from .export import ExportUsersQuery, ExportUsersQueryHandler, ExportUsersQueryResult
 from .list import ListUsersQuery, ListUsersQueryHandler, ListUsersQueryResult
 
 __all__ = [
+    "ExportUsersQuery",
+    "ExportUsersQueryHandler",
+    "ExportUsersQueryResult",
     "ListUsersQuery",
     "ListUsersQueryHandler",
     "ListUsersQueryResult",
@@ -0,0 +1,94 @@
+import logging
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+
+from diator.requests import Request, RequestHandler
+from diator.responses import Response
+
+from app.application.common.exceptions.query import SortingError
+from app.application.common.ports.user_query_gateway import UserQueryGateway
+from app.application.common.query_models.user import UserQueryModel
+from app.application.common.query_params.sorting import SortingOrder
+from app.application.common.query_params.user import UserListSorting
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.enums.user_role import UserRole
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(kw_only=True)
+class ExportUsersQueryResult(Response):
+    """
+    - Open to admins.
+    - Streams all existing users with relevant information, in chunks.
+    """
+
+    users: AsyncGenerator[list[UserQueryModel]]
+
+
+@dataclass(kw_only=True)
+class ExportUsersQuery(Request[ExportUsersQueryResult]):
+    """
+    - Open to admins.
+    - Streams all existing users with relevant information, in chunks,
+    in one response instead of one request per page.
+    """
+
+    sorting_field: str
+    sorting_order: SortingOrder
+
+
+class ExportUsersQueryHandler(
+    RequestHandler[ExportUsersQuery, ExportUsersQueryResult],
+):
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_query_gateway: UserQueryGateway,
+    ):
+        super().__init__()
+        self._current_user_service = current_user_service
+        self._user_query_gateway = user_query_gateway
+
+    async def handle(self, req: ExportUsersQuery) -> ExportUsersQueryResult:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises ReaderError:
+        :raises SortingError:
+        """
+        log.info("Export users: started.")
+
+        current_user = await self._current_user_service.get_current_user()
+
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.USER,
+            ),
+        )
+
+        users = await self._user_query_gateway.stream_all(
+            UserListSorting(
+                sorting_field=req.sorting_field,
+                sorting_order=req.sorting_order,
+            ),
+        )
+        if users is None:
+            log.error(
+                "Export users failed: invalid sorting column '%s'.",
+                req.sorting_field,
+            )
+            raise SortingError("Invalid sorting field.")
+
+        log.info("Export users: streaming.")
+        return ExportUsersQueryResult(users=users)
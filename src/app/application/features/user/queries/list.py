@@ -5,12 +5,18 @@ from diator.requests import Request, RequestHandler
 from diator.responses import Response
 
 from app.application.common.exceptions.query import SortingError
-from app.application.common.ports.uow import AsyncBaseUnitOfWork
+from app.application.common.ports.user_counter import UserCounter
 from app.application.common.ports.user_query_gateway import UserQueryGateway
-from app.application.common.query_models.user import UserQueryModel
-from app.application.common.query_params.pagination import Pagination
+from app.application.common.query_models.user import UserQueryModel, UserQueryPage
+from app.application.common.query_params.pagination import (
+    KeysetPagination,
+    Pagination,
+    PaginationMode,
+    TotalCountMode,
+)
 from app.application.common.query_params.sorting import SortingOrder
 from app.application.common.query_params.user import (
+    UserListKeysetParams,
     UserListParams,
     UserListSorting,
 )
@@ -22,7 +28,6 @@ from app.application.common.services.authorization.permissions import (
     RoleManagementContext,
 )
 from app.application.common.services.current_user import CurrentUserService
-from app.domain.entities.user import User
 from app.domain.enums.user_role import UserRole
 
 log = logging.getLogger(__name__)
@@ -36,6 +41,8 @@ class ListUsersQueryResult(Response):
     """
 
     users: list[UserQueryModel]
+    next_cursor: str | None = None
+    total: int | None = None
 
 
 @dataclass(kw_only=True)
@@ -43,12 +50,18 @@ class ListUsersQuery(Request[ListUsersQueryResult]):
     """
     - Open to admins.
     - Retrieves a paginated list of existing users with relevant information.
+    - Paginates by offset, or by cursor: `next_cursor` of a page fetches the next one,
+    at the same cost at any depth. Pass `pagination=cursor` for the first page.
+    - Counts all users on request: exactly, as estimated by Postgres, or cached.
     """
 
     limit: int
     offset: int
     sorting_field: str
     sorting_order: SortingOrder
+    pagination: PaginationMode = PaginationMode.OFFSET
+    cursor: str | None = None
+    total: TotalCountMode | None = None
 
 
 class ListUsersQueryHandler(RequestHandler[ListUsersQuery, ListUsersQueryResult]):
@@ -56,12 +69,12 @@ class ListUsersQueryHandler(RequestHandler[ListUsersQuery, ListUsersQueryResult]
         self,
         current_user_service: CurrentUserService,
         user_query_gateway: UserQueryGateway,
-        uow: AsyncBaseUnitOfWork,
+        user_counter: UserCounter,
     ):
         super().__init__()
         self._current_user_service = current_user_service
         self._user_query_gateway = user_query_gateway
-        self._uow = uow
+        self._user_counter = user_counter
 
     async def handle(self, req: ListUsersQuery) -> ListUsersQueryResult:
         """
@@ -84,6 +97,9 @@ class ListUsersQueryHandler(RequestHandler[ListUsersQuery, ListUsersQueryResult]
             ),
         )
 
+        if req.cursor is not None or req.pagination == PaginationMode.CURSOR:
+            return await self._handle_by_cursor(req)
+
         log.debug("Retrieving list of users.")
         user_list_params = UserListParams(
             pagination=Pagination(
@@ -96,12 +112,6 @@ class ListUsersQueryHandler(RequestHandler[ListUsersQuery, ListUsersQueryResult]
             ),
         )
 
-        user_repository = self._uow.repository(User)
-        all_users = await user_repository.all(
-            username="diego",
-        )
-        print(all_users)  # noqa: T201
-
         users: list[UserQueryModel] | None = await self._user_query_gateway.read_all(
             user_list_params,
         )
@@ -112,7 +122,50 @@ class ListUsersQueryHandler(RequestHandler[ListUsersQuery, ListUsersQueryResult]
             )
             raise SortingError("Invalid sorting field.")
 
-        response = ListUsersQueryResult(users=users)
+        response = ListUsersQueryResult(users=users, total=await self._count(req))
 
         log.info("List users: done.")
         return response
+
+    async def _handle_by_cursor(self, req: ListUsersQuery) -> ListUsersQueryResult:
+        """
+        :raises ReaderError:
+        :raises PaginationError:
+        :raises SortingError:
+        """
+        log.debug("Retrieving page of users by cursor.")
+        user_list_params = UserListKeysetParams(
+            pagination=KeysetPagination(
+                limit=req.limit,
+                cursor=req.cursor,
+            ),
+            sorting=UserListSorting(
+                sorting_field=req.sorting_field,
+                sorting_order=req.sorting_order,
+            ),
+        )
+
+        page: UserQueryPage | None = await self._user_query_gateway.read_page(
+            user_list_params,
+        )
+        if page is None:
+            log.error(
+                "Retrieving page of users failed: invalid sorting column '%s'.",
+                req.sorting_field,
+            )
+            raise SortingError("Invalid sorting field.")
+
+        log.info("List users: done.")
+        return ListUsersQueryResult(
+            users=page["users"],
+            next_cursor=page["next_cursor"],
+            total=await self._count(req),
+        )
+
+    async def _count(self, req: ListUsersQuery) -> int | None:
+        """
+        :raises ReaderError:
+        """
+        if req.total is None:
+            return None
+        return await self._user_counter.count(req.total)
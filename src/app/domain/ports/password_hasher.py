@@ -5,8 +5,25 @@ from app.domain.value_objects.raw_password.raw_password import RawPassword
 
 
 class PasswordHasher(Protocol):
+    """
+    Hashing is deliberately slow and CPU-bound,
+    so implementations are expected to keep it off the event loop.
+    """
+
+    @abstractmethod
+    async def hash(self, raw_password: RawPassword) -> bytes: ...
+
     @abstractmethod
-    def hash(self, raw_password: RawPassword) -> bytes: ...
+    async def verify(
+        self,
+        *,
+        raw_password: RawPassword,
+        hashed_password: bytes,
+    ) -> bool: ...
 
     @abstractmethod
-    def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool: ...
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        """
+        Whether the hash was made with other parameters than the current ones,
+        e.g. a lower cost, and should be replaced on the next successful verify.
+        """
@@ -1,6 +1,5 @@
 import logging
 from collections.abc import Mapping
-from typing import Any, cast
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
@@ -33,8 +32,13 @@ class SqlaMainFlusher(Flusher):
 
         except IntegrityError as error:
             if "uq_users_username" in str(error):
-                params: Mapping[str, Any] = cast(Mapping[str, Any], error.params)
-                username = str(params.get("username", "unknown"))
+                # Many rows are inserted per statement when flushing several users.
+                params = error.params
+                username = (
+                    str(params.get("username", "unknown"))
+                    if isinstance(params, Mapping)
+                    else "unknown"
+                )
                 raise UsernameAlreadyExistsError(username) from error
 
             raise DataMapperError(DB_CONSTRAINT_VIOLATION) from error
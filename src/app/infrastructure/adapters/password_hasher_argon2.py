@@ -0,0 +1,48 @@
+from argon2 import (
+    PasswordHasher as Argon2Hasher,
+    Type,
+)
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.adapters.password_hasher_dispatching import Argon2Params
+from app.infrastructure.adapters.password_hasher_pooled import (
+    BlockingPasswordHasher,
+)
+from app.infrastructure.adapters.password_pepper import PasswordPepper, add_pepper
+
+ARGON2ID_PREFIX = b"$argon2id$"
+
+
+class Argon2PasswordHasher(BlockingPasswordHasher):
+    """
+    Argon2id: memory-hard, so its cost is bounded by RAM per hash
+    (`memory_cost_kib`) as much as by CPU (`time_cost` passes over it).
+    """
+
+    def __init__(self, pepper: PasswordPepper, params: Argon2Params):
+        self._pepper = pepper
+        self._hasher = Argon2Hasher(
+            time_cost=params.time_cost,
+            memory_cost=params.memory_cost_kib,
+            parallelism=params.parallelism,
+            type=Type.ID,
+        )
+
+    def hash(self, raw_password: RawPassword) -> bytes:
+        return self._hasher.hash(add_pepper(raw_password, self._pepper)).encode()
+
+    def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool:
+        try:
+            return self._hasher.verify(
+                hashed_password,
+                add_pepper(raw_password, self._pepper),
+            )
+        except (InvalidHashError, VerificationError):
+            return False
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        return self._hasher.check_needs_rehash(hashed_password)
+
+    def recognizes(self, hashed_password: bytes) -> bool:
+        return hashed_password.startswith(ARGON2ID_PREFIX)
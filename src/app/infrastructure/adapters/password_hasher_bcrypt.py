@@ -1,19 +1,22 @@
-import base64
-import hashlib
-import hmac
 from typing import NewType
 
 import bcrypt
 
-from app.domain.ports.password_hasher import PasswordHasher
 from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.adapters.password_hasher_pooled import (
+    BlockingPasswordHasher,
+)
+from app.infrastructure.adapters.password_pepper import PasswordPepper, add_pepper
 
-PasswordPepper = NewType("PasswordPepper", str)
+BcryptRounds = NewType("BcryptRounds", int)
 
+BCRYPT_PREFIXES = (b"$2a$", b"$2b$", b"$2y$")
 
-class BcryptPasswordHasher(PasswordHasher):
-    def __init__(self, pepper: PasswordPepper):
+
+class BcryptPasswordHasher(BlockingPasswordHasher):
+    def __init__(self, pepper: PasswordPepper, rounds: BcryptRounds):
         self._pepper = pepper
+        self._rounds = rounds
 
     def hash(self, raw_password: RawPassword) -> bytes:
         """
@@ -26,19 +29,22 @@ class BcryptPasswordHasher(PasswordHasher):
         Salt is added to this string before passing it to `bcrypt` for the final hashing step.
         Inspired by: https://blog.ircmaxell.com/2015/03/security-issue-combining-bcrypt-with.html
         """
-        base64_hmac_password: bytes = self._add_pepper(raw_password, self._pepper)
-        salt: bytes = bcrypt.gensalt()
+        base64_hmac_password: bytes = add_pepper(raw_password, self._pepper)
+        salt: bytes = bcrypt.gensalt(rounds=self._rounds)
         return bcrypt.hashpw(base64_hmac_password, salt)
 
-    @staticmethod
-    def _add_pepper(raw_password: RawPassword, pepper: PasswordPepper) -> bytes:
-        hmac_password: bytes = hmac.new(
-            key=pepper.encode(),
-            msg=raw_password.value.encode(),
-            digestmod=hashlib.sha256,
-        ).digest()
-        return base64.b64encode(hmac_password)
-
     def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool:
-        base64_hmac_password: bytes = self._add_pepper(raw_password, self._pepper)
+        base64_hmac_password: bytes = add_pepper(raw_password, self._pepper)
         return bcrypt.checkpw(base64_hmac_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        """
+        A bcrypt hash is `$<version>$<rounds>$<salt><digest>`,
+        so its cost is read without hashing anything.
+        A higher cost than configured is kept: lowering it would weaken the hash.
+        """
+        _, version, rounds, _ = hashed_password.split(b"$", maxsplit=3)
+        return version != b"2b" or int(rounds) < self._rounds
+
+    def recognizes(self, hashed_password: bytes) -> bool:
+        return hashed_password.startswith(BCRYPT_PREFIXES)
@@ -0,0 +1,110 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.adapters.password_hasher_bcrypt import (
+    BcryptPasswordHasher,
+    BcryptRounds,
+)
+from app.infrastructure.adapters.password_hasher_pooled import (
+    BlockingPasswordHasher,
+)
+from app.infrastructure.adapters.password_hasher_scrypt import (
+    ScryptParams,
+    ScryptPasswordHasher,
+)
+from app.infrastructure.adapters.password_pepper import PasswordPepper
+
+log = logging.getLogger(__name__)
+
+
+class PasswordHashAlgorithm(StrEnum):
+    BCRYPT = "bcrypt"
+    ARGON2ID = "argon2id"
+    SCRYPT = "scrypt"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Argon2Params:
+    """Here rather than next to its adapter, which needs the `argon2` extra."""
+
+    time_cost: int
+    memory_cost_kib: int
+    parallelism: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PasswordHashConfig:
+    algorithm: PasswordHashAlgorithm
+    argon2: Argon2Params
+    scrypt: ScryptParams
+
+
+class DispatchingPasswordHasher(BlockingPasswordHasher):
+    """
+    Hashes with the current algorithm and verifies with whichever one
+    recognizes the stored hash's prefix. Hashes of any other algorithm
+    are reported as outdated, so the table migrates on successful logins.
+    """
+
+    def __init__(
+        self,
+        current: BlockingPasswordHasher,
+        legacy: Sequence[BlockingPasswordHasher],
+    ):
+        self._current = current
+        self._hashers = (current, *legacy)
+
+    def hash(self, raw_password: RawPassword) -> bytes:
+        return self._current.hash(raw_password)
+
+    def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool:
+        for hasher in self._hashers:
+            if hasher.recognizes(hashed_password):
+                return hasher.verify(
+                    raw_password=raw_password,
+                    hashed_password=hashed_password,
+                )
+        log.warning("Password hash of unknown algorithm: '%s'.", hashed_password[:10])
+        return False
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        if not self._current.recognizes(hashed_password):
+            return True
+        return self._current.needs_rehash(hashed_password)
+
+    def recognizes(self, hashed_password: bytes) -> bool:
+        return any(hasher.recognizes(hashed_password) for hasher in self._hashers)
+
+
+def get_dispatching_password_hasher(
+    config: PasswordHashConfig,
+    pepper: PasswordPepper,
+    bcrypt_rounds: BcryptRounds,
+) -> BlockingPasswordHasher:
+    """
+    Argon2 needs the `argon2` extra. Without it, argon2id hashes
+    can neither be made nor verified.
+    """
+    hashers: dict[PasswordHashAlgorithm, BlockingPasswordHasher] = {
+        PasswordHashAlgorithm.BCRYPT: BcryptPasswordHasher(pepper, bcrypt_rounds),
+        PasswordHashAlgorithm.SCRYPT: ScryptPasswordHasher(pepper, config.scrypt),
+    }
+    try:
+        from app.infrastructure.adapters.password_hasher_argon2 import (  # noqa: PLC0415
+            Argon2PasswordHasher,
+        )
+    except ImportError:
+        if config.algorithm == PasswordHashAlgorithm.ARGON2ID:
+            raise
+        log.debug("Argon2 is not installed, argon2id hashes are not supported.")
+    else:
+        hashers[PasswordHashAlgorithm.ARGON2ID] = Argon2PasswordHasher(
+            pepper,
+            config.argon2,
+        )
+
+    current = hashers.pop(config.algorithm)
+    return DispatchingPasswordHasher(current, tuple(hashers.values()))
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import multiprocessing
+from abc import abstractmethod
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import partial
+from time import perf_counter
+from typing import Final, Protocol
+
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.background.worker import BackgroundWorker
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from app.infrastructure.latency_histogram import LatencyHistogram
+
+log = logging.getLogger(__name__)
+
+HASH_LATENCY_BUCKETS_S: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+class BlockingPasswordHasher(Protocol):
+    """
+    Hashing algorithm proper; blocks the calling thread.
+    Must be picklable to run in the process pool.
+    """
+
+    @abstractmethod
+    def hash(self, raw_password: RawPassword) -> bytes: ...
+
+    @abstractmethod
+    def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool: ...
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: bytes) -> bool: ...
+
+    @abstractmethod
+    def recognizes(self, hashed_password: bytes) -> bool:
+        """Whether the hash is in this algorithm's format."""
+
+
+class PasswordHasherExecutor(StrEnum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PasswordHasherPoolConfig:
+    executor: PasswordHasherExecutor
+    max_workers: int
+    max_concurrency: int
+    max_waiting: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PasswordHasherPoolStats:
+    executor: PasswordHasherExecutor
+    waiting: int
+    running: int
+    completed: int
+    rejected: int
+    avg_wait_s: float
+    max_wait_s: float
+    avg_run_s: float
+    wait_latency: LatencyHistogram
+    run_latency: LatencyHistogram
+
+
+def _warm_up_worker() -> None:
+    """Runs in each worker, so it is spawned before the first login needs it."""
+
+
+class PasswordHasherPool(BackgroundWorker):
+    """
+    Bounded pool for hashing, off the event loop.
+
+    - Threads: `bcrypt` releases the GIL, so hashes run in parallel
+    within the worker process, sharing its cores with request handling.
+    - Processes: hashes run in dedicated processes, spawned at startup,
+    so a login burst can use every core without stalling the event loop.
+
+    A semaphore caps hashes in flight. At most `max_waiting` callers
+    may wait on it; any more fail fast with `PasswordHasherBusyError`
+    instead of queueing for longer than a client would wait.
+    """
+
+    def __init__(self, config: PasswordHasherPoolConfig):
+        self._config = config
+        self._executor = self._create_executor(config)
+        self._semaphore = asyncio.Semaphore(config.max_concurrency)
+        self._waiting = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_max_s = 0.0
+        self._wait_latency = LatencyHistogram(HASH_LATENCY_BUCKETS_S)
+        self._run_latency = LatencyHistogram(HASH_LATENCY_BUCKETS_S)
+
+    @property
+    def stats(self) -> PasswordHasherPoolStats:
+        completed = self._completed or 1
+        return PasswordHasherPoolStats(
+            executor=self._config.executor,
+            waiting=self._waiting,
+            running=self._running,
+            completed=self._completed,
+            rejected=self._rejected,
+            avg_wait_s=self._wait_latency.total_s / completed,
+            max_wait_s=self._wait_max_s,
+            avg_run_s=self._run_latency.total_s / completed,
+            wait_latency=self._wait_latency,
+            run_latency=self._run_latency,
+        )
+
+    async def submit[T](self, fn: Callable[[], T]) -> T:
+        """
+        :raises PasswordHasherBusyError:
+        """
+        if self._semaphore.locked() and self._waiting >= self._config.max_waiting:
+            self._rejected += 1
+            raise PasswordHasherBusyError(
+                f"Password hasher is saturated: {self._running} running, "
+                f"{self._waiting} waiting.",
+            )
+
+        queued_at = perf_counter()
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        started_at = perf_counter()
+        wait_s = started_at - queued_at
+        self._running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn)
+        finally:
+            self._running -= 1
+            self._semaphore.release()
+            self._completed += 1
+            self._wait_max_s = max(self._wait_max_s, wait_s)
+            self._wait_latency.observe(wait_s)
+            self._run_latency.observe(perf_counter() - started_at)
+
+    async def run(self) -> None:
+        """Spawns worker processes at startup; threads are cheap to start lazily."""
+        if self._config.executor != PasswordHasherExecutor.PROCESS:
+            return
+
+        started_at = perf_counter()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, _warm_up_worker)
+                for _ in range(self._config.max_workers)
+            )
+        )
+        log.info(
+            "Password hasher processes warmed up: %d in %.2fs.",
+            self._config.max_workers,
+            perf_counter() - started_at,
+        )
+
+    async def shutdown(self) -> None:
+        """Lets hashes in flight finish, so their requests still get a response."""
+        await asyncio.to_thread(self.close)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        log.debug("Password hasher pool is shut down. Stats: %s.", self.stats)
+
+    @staticmethod
+    def _create_executor(config: PasswordHasherPoolConfig) -> Executor:
+        match config.executor:
+            case PasswordHasherExecutor.THREAD:
+                return ThreadPoolExecutor(
+                    max_workers=config.max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+            case PasswordHasherExecutor.PROCESS:
+                # Not forked: the parent runs an event loop and other threads.
+                return ProcessPoolExecutor(
+                    max_workers=config.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+
+
+def get_password_hasher_pool(
+    config: PasswordHasherPoolConfig,
+) -> Iterator[PasswordHasherPool]:
+    pool = PasswordHasherPool(config)
+    log.debug("Password hasher pool created: %s.", config)
+    yield pool
+    pool.close()
+
+
+class PooledPasswordHasher(PasswordHasher):
+    def __init__(self, hasher: BlockingPasswordHasher, pool: PasswordHasherPool):
+        self._hasher = hasher
+        self._pool = pool
+
+    async def hash(self, raw_password: RawPassword) -> bytes:
+        """
+        :raises PasswordHasherBusyError:
+        """
+        return await self._pool.submit(partial(self._hasher.hash, raw_password))
+
+    async def verify(
+        self,
+        *,
+        raw_password: RawPassword,
+        hashed_password: bytes,
+    ) -> bool:
+        """
+        :raises PasswordHasherBusyError:
+        """
+        return await self._pool.submit(
+            partial(
+                self._hasher.verify,
+                raw_password=raw_password,
+                hashed_password=hashed_password,
+            ),
+        )
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        return self._hasher.needs_rehash(hashed_password)
@@ -0,0 +1,116 @@
+import base64
+import hashlib
+import hmac
+import secrets
+from dataclasses import dataclass
+
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.adapters.password_hasher_pooled import (
+    BlockingPasswordHasher,
+)
+from app.infrastructure.adapters.password_pepper import PasswordPepper, add_pepper
+
+SCRYPT_PREFIX = b"$scrypt$"
+SCRYPT_SALT_SIZE = 16
+SCRYPT_KEY_SIZE = 32
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ScryptParams:
+    log2_n: int
+    block_size: int
+    parallelism: int
+
+    @property
+    def memory_bytes(self) -> int:
+        return 128 * self.block_size * ((1 << self.log2_n) + self.parallelism + 2)
+
+
+class ScryptPasswordHasher(BlockingPasswordHasher):
+    """
+    `hashlib.scrypt` stores no parameters of its own, so hashes are encoded as
+    `$scrypt$ln=<log2 N>,r=<r>,p=<p>$<salt>$<key>` (unpadded base64),
+    and each one is verified with the parameters it was made with.
+    """
+
+    def __init__(self, pepper: PasswordPepper, params: ScryptParams):
+        self._pepper = pepper
+        self._params = params
+
+    def hash(self, raw_password: RawPassword) -> bytes:
+        salt = secrets.token_bytes(SCRYPT_SALT_SIZE)
+        key = self._derive(raw_password, salt, self._params)
+        return b"$".join((
+            SCRYPT_PREFIX.rstrip(b"$"),
+            self._encode_params(self._params),
+            _b64encode(salt),
+            _b64encode(key),
+        ))
+
+    def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool:
+        try:
+            params, salt, key = self._decode(hashed_password)
+        except ValueError:
+            return False
+        return hmac.compare_digest(self._derive(raw_password, salt, params), key)
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        try:
+            params, _, _ = self._decode(hashed_password)
+        except ValueError:
+            return True
+        return params != self._params
+
+    def recognizes(self, hashed_password: bytes) -> bool:
+        return hashed_password.startswith(SCRYPT_PREFIX)
+
+    def _derive(
+        self,
+        raw_password: RawPassword,
+        salt: bytes,
+        params: ScryptParams,
+    ) -> bytes:
+        return hashlib.scrypt(
+            add_pepper(raw_password, self._pepper),
+            salt=salt,
+            n=1 << params.log2_n,
+            r=params.block_size,
+            p=params.parallelism,
+            maxmem=params.memory_bytes + 1024 * 1024,
+            dklen=SCRYPT_KEY_SIZE,
+        )
+
+    @staticmethod
+    def _encode_params(params: ScryptParams) -> bytes:
+        return (
+            f"ln={params.log2_n},r={params.block_size},p={params.parallelism}"
+        ).encode()
+
+    @staticmethod
+    def _decode(hashed_password: bytes) -> tuple[ScryptParams, bytes, bytes]:
+        """
+        :raises ValueError:
+        """
+        if not hashed_password.startswith(SCRYPT_PREFIX):
+            raise ValueError("Not a scrypt hash.")
+        _, _, encoded_params, salt, key = hashed_password.split(b"$")
+        params = dict(
+            param.split(b"=", maxsplit=1) for param in encoded_params.split(b",")
+        )
+        try:
+            decoded_params = ScryptParams(
+                log2_n=int(params[b"ln"]),
+                block_size=int(params[b"r"]),
+                parallelism=int(params[b"p"]),
+            )
+        except KeyError as error:
+            raise ValueError(f"Missing scrypt parameter: {error}.") from error
+        return decoded_params, _b64decode(salt), _b64decode(key)
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.b64decode(data + b"=" * (-len(data) % 4))
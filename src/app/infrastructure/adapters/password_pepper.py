@@ -0,0 +1,21 @@
+import base64
+import hashlib
+import hmac
+from typing import NewType
+
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+
+PasswordPepper = NewType("PasswordPepper", str)
+
+
+def add_pepper(raw_password: RawPassword, pepper: PasswordPepper) -> bytes:
+    """
+    `base64(hmac-sha256(password, pepper))`: fixed-length and free of null bytes,
+    so it suits every algorithm, including bcrypt with its 72-byte limit.
+    """
+    hmac_password: bytes = hmac.new(
+        key=pepper.encode(),
+        msg=raw_password.value.encode(),
+        digestmod=hashlib.sha256,
+    ).digest()
+    return base64.b64encode(hmac_password)
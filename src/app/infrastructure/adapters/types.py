@@ -3,3 +3,4 @@ from typing import NewType
 from sqlalchemy.ext.asyncio import AsyncSession
 
 MainAsyncSession = NewType("MainAsyncSession", AsyncSession)
+QueryAsyncSession = NewType("QueryAsyncSession", AsyncSession)
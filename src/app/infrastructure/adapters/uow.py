@@ -24,13 +24,15 @@ from app.infrastructure.adapters.constants import (
 from app.infrastructure.adapters.repository import AsyncSQLAlchemyRepository
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.replica import RequestReadRouting
 
 log = logging.getLogger(__name__)
 
 
 class AsyncSQLAlchemyUnitOfWork(AsyncBaseUnitOfWork):
-    def __init__(self, session: MainAsyncSession):
+    def __init__(self, session: MainAsyncSession, read_routing: RequestReadRouting):
         self._session = session
+        self._read_routing = read_routing
         self._transaction: AsyncSessionTransaction | None = None
 
     @property
@@ -62,6 +64,9 @@ class AsyncSQLAlchemyUnitOfWork(AsyncBaseUnitOfWork):
         except SQLAlchemyError as error:
             raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from error
 
+        # The replica may lag behind this commit; the user reads from the primary.
+        self._read_routing.record_write()
+
     async def flush(self):
         """
         :raises DataMapperError:
@@ -0,0 +1,62 @@
+import asyncio
+from contextlib import suppress
+from datetime import timedelta
+from time import monotonic
+from typing import NewType
+
+UserCountCacheTtl = NewType("UserCountCacheTtl", timedelta)
+
+
+class UserCountCache:
+    """
+    The last exact user count, per worker process.
+    Stale once older than the TTL or invalidated; a stale count is still served,
+    while a refresh is requested from the background refresher.
+    """
+
+    def __init__(self, ttl: UserCountCacheTtl):
+        self._ttl_s = ttl.total_seconds()
+        self._count: int | None = None
+        self._counted_at = 0.0
+        self._invalidated_at = 0.0
+        self._refresh_requested = asyncio.Event()
+
+    @property
+    def ttl_s(self) -> float:
+        return self._ttl_s
+
+    @property
+    def has_count(self) -> bool:
+        return self._count is not None
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self._invalidated_at >= self._counted_at
+            or monotonic() - self._counted_at > self._ttl_s
+        )
+
+    def get(self) -> int | None:
+        if self._count is not None and self.is_stale:
+            self._refresh_requested.set()
+        return self._count
+
+    def set(self, count: int, *, counted_at: float) -> None:
+        """
+        `counted_at` is when counting started: an invalidation
+        during the count leaves the new value stale.
+        """
+        if counted_at < self._counted_at:
+            return
+        self._count = count
+        self._counted_at = counted_at
+
+    def invalidate(self) -> None:
+        self._invalidated_at = monotonic()
+        self._refresh_requested.set()
+
+    async def wait_for_refresh(self) -> None:
+        """Returns on a refresh request, or after the TTL."""
+        with suppress(TimeoutError):
+            await asyncio.wait_for(self._refresh_requested.wait(), self._ttl_s)
+        self._refresh_requested.clear()
@@ -0,0 +1,52 @@
+import logging
+from time import monotonic
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.adapters.user_count_cache import UserCountCache
+from app.infrastructure.adapters.user_counter_sqla import count_users
+from app.infrastructure.background.worker import BackgroundWorker
+from app.infrastructure.exceptions.gateway import ReaderError
+
+log = logging.getLogger(__name__)
+
+
+class SqlaUserCountRefresher(BackgroundWorker):
+    """
+    Recounts users off the request path, in its own session:
+    after an invalidation or a stale read, and at least once per TTL
+    once the cache is in use.
+    """
+
+    def __init__(
+        self,
+        cache: UserCountCache,
+        session_factory: async_sessionmaker[AsyncSession],
+    ):
+        self._cache = cache
+        self._session_factory = session_factory
+
+    async def run(self) -> None:
+        while True:
+            await self._cache.wait_for_refresh()
+            if not self._cache.has_count or not self._cache.is_stale:
+                # Not in use yet, or refreshed meanwhile.
+                continue
+            try:
+                await self.refresh()
+
+            except ReaderError as error:
+                log.warning("User count refresh failed: '%s'.", error)
+
+    async def shutdown(self) -> None:
+        log.debug("User count refresher stopped.")
+
+    async def refresh(self) -> int:
+        """
+        :raises ReaderError:
+        """
+        counted_at = monotonic()
+        async with self._session_factory() as session:
+            count = await count_users(session)
+        self._cache.set(count, counted_at=counted_at)
+        return count
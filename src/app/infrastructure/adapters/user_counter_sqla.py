@@ -0,0 +1,87 @@
+import logging
+from time import monotonic
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.query_params.pagination import TotalCountMode
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import QueryAsyncSession
+from app.infrastructure.adapters.user_count_cache import UserCountCache
+from app.infrastructure.exceptions.gateway import ReaderError
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+
+log = logging.getLogger(__name__)
+
+
+class SqlaUserCounter(UserCounter):
+    def __init__(self, session: QueryAsyncSession, cache: UserCountCache):
+        self._session = session
+        self._cache = cache
+
+    async def count(self, mode: TotalCountMode) -> int:
+        """
+        :raises ReaderError:
+        """
+        match mode:
+            case TotalCountMode.EXACT:
+                return await count_users(self._session)
+            case TotalCountMode.ESTIMATE:
+                return await self._estimate()
+            case TotalCountMode.CACHED:
+                return await self._count_cached()
+
+    def invalidate(self) -> None:
+        self._cache.invalidate()
+
+    async def _estimate(self) -> int:
+        """
+        :raises ReaderError:
+        """
+        try:
+            estimate: float | None = await self._session.scalar(
+                text(
+                    "SELECT reltuples FROM pg_class "
+                    "WHERE oid = CAST(:table AS regclass)",
+                ),
+                {"table": users_table.name},
+            )
+        except SQLAlchemyError as error:
+            raise ReaderError(DB_QUERY_FAILED) from error
+
+        # -1 until the table is first vacuumed or analyzed.
+        if estimate is None or estimate < 0:
+            return await count_users(self._session)
+        return int(estimate)
+
+    async def _count_cached(self) -> int:
+        """
+        :raises ReaderError:
+        """
+        cached = self._cache.get()
+        if cached is not None:
+            return cached
+
+        counted_at = monotonic()
+        count = await count_users(self._session)
+        self._cache.set(count, counted_at=counted_at)
+        return count
+
+
+def build_user_count_select() -> Select[tuple[int]]:
+    return select(func.count()).select_from(users_table)
+
+
+async def count_users(session: AsyncSession) -> int:
+    """
+    :raises ReaderError:
+    """
+    try:
+        count: int | None = await session.scalar(build_user_count_select())
+    except SQLAlchemyError as error:
+        raise ReaderError(DB_QUERY_FAILED) from error
+
+    log.debug("Users counted: %s.", count)
+    return count or 0
@@ -1,3 +1,5 @@
+from collections.abc import Collection
+
 from sqlalchemy import Select, select
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -8,6 +10,7 @@ from app.domain.value_objects.username.username import Username
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.user import users_table
 
 
 class SqlaUserDataMapper(UserCommandGateway):
@@ -26,14 +29,13 @@ class SqlaUserDataMapper(UserCommandGateway):
 
     async def read_by_id(self, user_id: EntityId) -> User | None:
         """
+        Served from the identity map without a query if already loaded,
+        e.g. along with the auth session.
+
         :raises DataMapperError:
         """
-        select_stmt: Select[tuple[User]] = select(User).where(User.id_ == user_id)  # type: ignore
-
         try:
-            user: User | None = (
-                await self._session.execute(select_stmt)
-            ).scalar_one_or_none()
+            user: User | None = await self._session.get(User, user_id.value)
 
             return user
 
@@ -62,3 +64,32 @@ class SqlaUserDataMapper(UserCommandGateway):
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def read_by_usernames(
+        self,
+        usernames: Collection[Username],
+        for_update: bool = False,
+    ) -> list[User]:
+        """
+        In a single query; locks rows in username order when `for_update`,
+        so concurrent callers cannot deadlock on each other.
+
+        :raises DataMapperError:
+        """
+        if not usernames:
+            return []
+
+        select_stmt: Select[tuple[User]] = (
+            select(User)
+            .where(users_table.c.username.in_([u.value for u in usernames]))
+            .order_by(users_table.c.username)
+        )
+
+        if for_update:
+            select_stmt = select_stmt.with_for_update()
+
+        try:
+            return list((await self._session.scalars(select_stmt)).all())
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
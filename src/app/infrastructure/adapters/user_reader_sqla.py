@@ -1,25 +1,44 @@
+import base64
+import binascii
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Sequence
 from uuid import UUID
 
-from sqlalchemy import ColumnElement, Result, Row, Select, select
+import orjson
+from sqlalchemy import ColumnElement, Result, Row, Select, literal, select, tuple_
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncResult
 
+from app.application.common.exceptions.query import PaginationError
 from app.application.common.ports.user_query_gateway import UserQueryGateway
-from app.application.common.query_models.user import UserQueryModel
+from app.application.common.query_models.user import UserQueryModel, UserQueryPage
 from app.application.common.query_params.sorting import SortingOrder
-from app.application.common.query_params.user import UserListParams
+from app.application.common.query_params.user import (
+    UserListKeysetParams,
+    UserListParams,
+    UserListSorting,
+)
 from app.domain.enums.user_role import UserRole
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
-from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.types import QueryAsyncSession
 from app.infrastructure.exceptions.gateway import ReaderError
 from app.infrastructure.persistence_sqla.mappings.user import users_table
 
 log = logging.getLogger(__name__)
 
+type UserRowTuple = tuple[UUID, str, UserRole, bool]
+
+KEYSET_SORTING_FIELDS = frozenset({"id", "username", "role", "is_active"})
+# Unique, so the sort key alone identifies a row; others are paired with `id`,
+# and served by the `(<field>, id)` indexes.
+KEYSET_UNIQUE_FIELDS = frozenset({"id", "username"})
+CURSOR_INVALID = "Invalid cursor."
+# Rows fetched per round trip from the server-side cursor, and per yielded chunk.
+EXPORT_BATCH_SIZE = 1_000
+
 
 class SqlaUserReader(UserQueryGateway):
-    def __init__(self, session: MainAsyncSession):
+    def __init__(self, session: QueryAsyncSession):
         self._session = session
 
     async def read_all(
@@ -45,33 +64,209 @@ class SqlaUserReader(UserQueryGateway):
             else table_sorting_field.desc()
         )
 
-        select_stmt: Select[tuple[UUID, str, UserRole, bool]] = (
-            select(
-                users_table.c.id,
-                users_table.c.username,
-                users_table.c.role,
-                users_table.c.is_active,
-            )
+        select_stmt: Select[UserRowTuple] = (
+            _select_users()
             .order_by(order_by)
             .limit(user_read_all_params.pagination.limit)
             .offset(user_read_all_params.pagination.offset)
         )
 
+        rows = await self._fetch(select_stmt)
+        return [_to_query_model(row) for row in rows]
+
+    async def read_page(
+        self,
+        user_read_page_params: UserListKeysetParams,
+    ) -> UserQueryPage | None:
+        """
+        :raises ReaderError:
+        :raises PaginationError:
+        """
+        sorting = user_read_page_params.sorting
+        if sorting.sorting_field not in KEYSET_SORTING_FIELDS:
+            log.error("Invalid sorting field: '%s'.", sorting.sorting_field)
+            return None
+
+        limit = user_read_page_params.pagination.limit
+        select_stmt = build_keyset_select(
+            sorting,
+            user_read_page_params.pagination.cursor,
+        ).limit(limit + 1)
+
+        rows = await self._fetch(select_stmt)
+        has_next_page = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = (
+            encode_keyset_cursor(
+                sorting,
+                getattr(rows[-1], sorting.sorting_field),
+                rows[-1].id,
+            )
+            if has_next_page
+            else None
+        )
+        return UserQueryPage(
+            users=[_to_query_model(row) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+    async def stream_all(
+        self,
+        sorting: UserListSorting,
+    ) -> AsyncGenerator[list[UserQueryModel]] | None:
+        """
+        :raises ReaderError:
+        """
+        if sorting.sorting_field not in KEYSET_SORTING_FIELDS:
+            log.error("Invalid sorting field: '%s'.", sorting.sorting_field)
+            return None
+
+        # `yield_per` streams from a server-side cursor,
+        # so memory is bounded by the batch, not the table.
+        select_stmt = build_keyset_select(sorting, None).execution_options(
+            yield_per=EXPORT_BATCH_SIZE,
+        )
+        try:
+            result: AsyncResult[UserRowTuple] = await self._session.stream(
+                select_stmt,
+            )
+        except SQLAlchemyError as error:
+            raise ReaderError(DB_QUERY_FAILED) from error
+
+        return _stream_partitions(result)
+
+    async def _fetch(
+        self,
+        select_stmt: Select[UserRowTuple],
+    ) -> Sequence[Row[UserRowTuple]]:
+        """
+        :raises ReaderError:
+        """
         try:
-            result: Result[
-                tuple[UUID, str, UserRole, bool]
-            ] = await self._session.execute(select_stmt)
-            rows: Sequence[Row[tuple[UUID, str, UserRole, bool]]] = result.all()
-
-            return [
-                UserQueryModel(
-                    id_=row.id,
-                    username=row.username,
-                    role=row.role,
-                    is_active=row.is_active,
-                )
-                for row in rows
-            ]
+            result: Result[UserRowTuple] = await self._session.execute(select_stmt)
+            return result.all()
 
         except SQLAlchemyError as error:
             raise ReaderError(DB_QUERY_FAILED) from error
+
+
+def build_keyset_select(
+    sorting: UserListSorting,
+    cursor: str | None,
+) -> Select[UserRowTuple]:
+    """
+    :raises PaginationError:
+    """
+    sorting_column = users_table.c[sorting.sorting_field]
+    id_column = users_table.c.id
+    is_unique = sorting.sorting_field in KEYSET_UNIQUE_FIELDS
+    is_asc = sorting.sorting_order == SortingOrder.ASC
+
+    key_columns = [sorting_column] if is_unique else [sorting_column, id_column]
+    select_stmt = _select_users().order_by(
+        *(column.asc() if is_asc else column.desc() for column in key_columns),
+    )
+    if cursor is None:
+        return select_stmt
+
+    sorting_key, last_id = decode_keyset_cursor(sorting, cursor)
+    if is_unique:
+        return select_stmt.where(
+            sorting_column > sorting_key if is_asc else sorting_column < sorting_key,
+        )
+
+    # A row comparison, so Postgres seeks the `(<field>, id)` index to the cursor.
+    row_key = tuple_(sorting_column, id_column)
+    cursor_key = tuple_(
+        literal(sorting_key, sorting_column.type),
+        literal(last_id, id_column.type),
+    )
+    return select_stmt.where(row_key > cursor_key if is_asc else row_key < cursor_key)
+
+
+def encode_keyset_cursor(
+    sorting: UserListSorting,
+    sorting_key: UUID | str | UserRole | bool,
+    last_id: UUID,
+) -> str:
+    """
+    The sorting is embedded, so a cursor can't be replayed against another one.
+    """
+    payload = orjson.dumps([
+        sorting.sorting_field,
+        sorting.sorting_order,
+        str(sorting_key) if isinstance(sorting_key, UUID) else sorting_key,
+        str(last_id),
+    ])
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_keyset_cursor(
+    sorting: UserListSorting,
+    cursor: str,
+) -> tuple[UUID | str | UserRole | bool, UUID]:
+    """
+    :raises PaginationError:
+    """
+    try:
+        padded = cursor.encode() + b"=" * (-len(cursor) % 4)
+        field, order, raw_key, raw_id = orjson.loads(base64.urlsafe_b64decode(padded))
+        last_id = UUID(raw_id)
+        sorting_key: UUID | str | UserRole | bool
+        match field:
+            case "id":
+                sorting_key = UUID(raw_key)
+            case "role":
+                sorting_key = UserRole(raw_key)
+            case "is_active" if isinstance(raw_key, bool):
+                sorting_key = raw_key
+            case "username" if isinstance(raw_key, str):
+                sorting_key = raw_key
+            case _:
+                raise PaginationError(CURSOR_INVALID)
+
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as error:
+        raise PaginationError(CURSOR_INVALID) from error
+
+    if (field, order) != (sorting.sorting_field, sorting.sorting_order):
+        raise PaginationError("Cursor was issued for a different sorting.")
+    return sorting_key, last_id
+
+
+async def _stream_partitions(
+    result: AsyncResult[UserRowTuple],
+) -> AsyncGenerator[list[UserQueryModel]]:
+    """
+    :raises ReaderError:
+    """
+    streamed = 0
+    try:
+        async for partition in result.partitions():
+            streamed += len(partition)
+            yield [_to_query_model(row) for row in partition]
+
+    except SQLAlchemyError as error:
+        raise ReaderError(DB_QUERY_FAILED) from error
+
+    finally:
+        # Also on cancellation, e.g. the client went away: frees the server-side cursor.
+        await result.close()
+        log.debug("User stream closed after %d rows.", streamed)
+
+
+def _select_users() -> Select[UserRowTuple]:
+    return select(
+        users_table.c.id,
+        users_table.c.username,
+        users_table.c.role,
+        users_table.c.is_active,
+    )
+
+
+def _to_query_model(row: Row[UserRowTuple]) -> UserQueryModel:
+    return UserQueryModel(
+        id_=row.id,
+        username=row.username,
+        role=row.role,
+        is_active=row.is_active,
+    )
@@ -0,0 +1,146 @@
+from datetime import datetime
+from typing import NewType
+from uuid import UUID
+
+import orjson
+
+from app.domain.value_objects.entity_id import EntityId
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.auth.adapters.kv_store import (
+    AuthSessionKeyValueStore,
+    KvAuthSessionWriteBuffer,
+    KvDelete,
+    KvSet,
+    KvSetAdd,
+    KvSetRemove,
+)
+from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.ports.gateway import (
+    AuthSessionGateway,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+AuthSessionKeyPrefix = NewType("AuthSessionKeyPrefix", str)
+
+
+class KvAuthSessionDataMapper(AuthSessionGateway):
+    """
+    Layout:
+    - `{prefix}:{session_id}` holds the session and expires with it.
+    - `{prefix}:user:{user_id}` is the set of the user's session IDs,
+    so `delete_all_for_user` touches only that user's keys.
+
+    Writes are staged and applied on `KvAuthSessionTransactionManager.commit`.
+    """
+
+    def __init__(
+        self,
+        store: AuthSessionKeyValueStore,
+        write_buffer: KvAuthSessionWriteBuffer,
+        key_prefix: AuthSessionKeyPrefix,
+    ):
+        self._store = store
+        self._write_buffer = write_buffer
+        self._key_prefix = key_prefix
+
+    def add(self, auth_session: AuthSession) -> None:
+        """
+        :raises DataMapperError:
+        """
+        self._write_buffer.stage(
+            KvSet(
+                key=self._session_key(auth_session.id_),
+                value=self._encode(auth_session),
+                expire_at=auth_session.expiration,
+            ),
+            KvSetAdd(
+                key=self._user_key(auth_session.user_id),
+                member=auth_session.id_,
+                expire_at=auth_session.expiration,
+            ),
+        )
+
+    async def read_by_id(self, auth_session_id: str) -> AuthSession | None:
+        """
+        :raises DataMapperError:
+        """
+        raw: bytes | None = await self._store.get(self._session_key(auth_session_id))
+        if raw is None:
+            return None
+        return self._decode(auth_session_id, raw)
+
+    async def update(self, auth_session: AuthSession) -> None:
+        """
+        :raises DataMapperError:
+        """
+        self._write_buffer.stage(
+            KvSet(
+                key=self._session_key(auth_session.id_),
+                value=self._encode(auth_session),
+                expire_at=auth_session.expiration,
+                only_if_exists=True,
+            ),
+            KvSetAdd(
+                key=self._user_key(auth_session.user_id),
+                member=auth_session.id_,
+                expire_at=auth_session.expiration,
+            ),
+        )
+
+    async def delete(self, auth_session_id: str) -> None:
+        """
+        :raises DataMapperError:
+        """
+        auth_session = await self.read_by_id(auth_session_id)
+        self._write_buffer.stage(KvDelete(keys=(self._session_key(auth_session_id),)))
+        if auth_session is not None:
+            self._write_buffer.stage(
+                KvSetRemove(
+                    key=self._user_key(auth_session.user_id),
+                    member=auth_session_id,
+                ),
+            )
+
+    async def delete_all_for_user(self, user_id: EntityId) -> None:
+        """
+        :raises DataMapperError:
+        """
+        user_key = self._user_key(user_id)
+        auth_session_ids = await self._store.members(user_key)
+        self._write_buffer.stage(
+            KvDelete(
+                keys=(
+                    *(self._session_key(id_) for id_ in sorted(auth_session_ids)),
+                    user_key,
+                ),
+            ),
+        )
+
+    def _session_key(self, auth_session_id: str) -> str:
+        return f"{self._key_prefix}:{auth_session_id}"
+
+    def _user_key(self, user_id: EntityId) -> str:
+        return f"{self._key_prefix}:user:{user_id.value}"
+
+    @staticmethod
+    def _encode(auth_session: AuthSession) -> bytes:
+        return orjson.dumps({
+            "user_id": str(auth_session.user_id.value),
+            "expiration": auth_session.expiration.isoformat(),
+        })
+
+    @staticmethod
+    def _decode(auth_session_id: str, raw: bytes) -> AuthSession:
+        """
+        :raises DataMapperError:
+        """
+        try:
+            data = orjson.loads(raw)
+            return AuthSession(
+                id_=auth_session_id,
+                user_id=EntityId(UUID(data["user_id"])),
+                expiration=datetime.fromisoformat(data["expiration"]),
+            )
+
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
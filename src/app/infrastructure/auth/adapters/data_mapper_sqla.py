@@ -1,19 +1,58 @@
-from sqlalchemy import Delete, delete
+from datetime import datetime
+
+from sqlalchemy import Select, delete, select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.dml import ReturningDelete
 
+from app.domain.entities.user import User
 from app.domain.value_objects.entity_id import EntityId
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.auth.adapters.types import AuthAsyncSession
+from app.infrastructure.auth.session.extension_buffer import (
+    AuthSessionExtensionBuffer,
+)
 from app.infrastructure.auth.session.model import AuthSession
 from app.infrastructure.auth.session.ports.gateway import (
     AuthSessionGateway,
 )
+from app.infrastructure.auth.session.revocation_list import (
+    AuthSessionRevocationList,
+)
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_sessions_table,
+)
+from app.infrastructure.persistence_sqla.mappings.user import users_table
 
 
 class SqlaAuthSessionDataMapper(AuthSessionGateway):
-    def __init__(self, session: AuthAsyncSession):
+    """
+    Deleted sessions are reported to the process-local revocation list,
+    so signed tokens for them are rejected here before the next sync.
+
+    With the extension buffer enabled, `update` only schedules the new expiration,
+    and reads reflect it until `SqlaAuthSessionExtensionFlusher` writes it.
+
+    Sessions and users share a database, so a session is read joined to its user,
+    who is then handed over to the main session. Resolving the current user
+    finds them in its identity map: one round trip instead of two.
+    """
+
+    def __init__(
+        self,
+        session: AuthAsyncSession,
+        main_session: MainAsyncSession,
+        revocation_list: AuthSessionRevocationList,
+        extension_buffer: AuthSessionExtensionBuffer,
+    ):
         self._session = session
+        self._main_session = main_session
+        self._revocation_list = revocation_list
+        self._extension_buffer = extension_buffer
+        # The identity map only holds weak references to unmodified instances.
+        self._handed_over_users: list[User] = []
 
     def add(self, auth_session: AuthSession) -> None:
         """
@@ -25,30 +64,55 @@ class SqlaAuthSessionDataMapper(AuthSessionGateway):
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
-    async def read_by_id(
-        self,
-        auth_session_id: str,
-        for_update: bool = False,
-    ) -> AuthSession | None:
+    async def read_by_id(self, auth_session_id: str) -> AuthSession | None:
         """
         :raises DataMapperError:
         """
         try:
-            auth_session: AuthSession | None = await self._session.get(
-                AuthSession,
-                auth_session_id,
-                with_for_update=for_update,
-            )
-
-            return auth_session
+            auth_session = await self._read_with_user(auth_session_id)
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
+        if auth_session is not None:
+            pending_expiration = self._extension_buffer.get(auth_session_id)
+            if pending_expiration and pending_expiration > auth_session.expiration:
+                set_committed_value(auth_session, "expiration", pending_expiration)  # type: ignore[no-untyped-call]
+        return auth_session
+
+    async def _read_with_user(self, auth_session_id: str) -> AuthSession | None:
+        select_stmt: Select[tuple[AuthSession, User]] = (
+            select(AuthSession, User)
+            .outerjoin(User, users_table.c.id == auth_sessions_table.c.user_id)
+            .where(auth_sessions_table.c.id == auth_session_id)
+        )
+        row = (await self._session.execute(select_stmt)).one_or_none()
+        if row is None:
+            return None
+
+        auth_session: AuthSession = row[0]
+        # Outer join: a missing user is left for the caller to handle.
+        user: User | None = row[1]
+        if user is not None:
+            self._session.expunge(user)
+            # An instance already loaded there may have pending changes; it stays.
+            if self._main_session.identity_key(instance=user) not in (
+                self._main_session.identity_map
+            ):
+                self._main_session.add(user)
+                self._handed_over_users.append(user)
+        return auth_session
+
     async def update(self, auth_session: AuthSession) -> None:
         """
         :raises DataMapperError:
         """
+        if self._extension_buffer.is_enabled:
+            self._extension_buffer.schedule(auth_session.id_, auth_session.expiration)
+            # Keeps a loaded instance clean, so the next commit does not write it.
+            set_committed_value(auth_session, "expiration", auth_session.expiration)  # type: ignore[no-untyped-call]
+            return
+
         try:
             await self._session.merge(auth_session)
 
@@ -59,26 +123,42 @@ class SqlaAuthSessionDataMapper(AuthSessionGateway):
         """
         :raises DataMapperError:
         """
-        delete_stmt: Delete = delete(AuthSession).where(
-            AuthSession.id_ == auth_session_id,  # type: ignore
+        delete_stmt: ReturningDelete[tuple[str, datetime]] = (
+            delete(AuthSession)
+            .where(
+                AuthSession.id_ == auth_session_id,  # type: ignore
+            )
+            .returning(AuthSession.id_, AuthSession.expiration)
         )
 
         try:
-            await self._session.execute(delete_stmt)
+            deleted_rows = (await self._session.execute(delete_stmt)).all()
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
+        for deleted_id, expiration in deleted_rows:
+            self._extension_buffer.discard(deleted_id)
+            self._revocation_list.add_session(deleted_id, expiration)
+
     async def delete_all_for_user(self, user_id: EntityId) -> None:
         """
         :raises DataMapperError:
         """
-        delete_stmt: Delete = delete(AuthSession).where(
-            AuthSession.user_id == user_id,  # type: ignore
+        delete_stmt: ReturningDelete[tuple[str, datetime]] = (
+            delete(AuthSession)
+            .where(
+                AuthSession.user_id == user_id,  # type: ignore
+            )
+            .returning(AuthSession.id_, AuthSession.expiration)
         )
 
         try:
-            await self._session.execute(delete_stmt)
+            deleted_rows = (await self._session.execute(delete_stmt)).all()
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
+
+        for deleted_id, expiration in deleted_rows:
+            self._extension_buffer.discard(deleted_id)
+            self._revocation_list.add_session(deleted_id, expiration)
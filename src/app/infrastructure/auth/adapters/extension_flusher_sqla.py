@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+from itertools import batched
+
+from sqlalchemy import DateTime, String, Update, column, update, values
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.adapters.constants import DB_COMMIT_FAILED, DB_QUERY_FAILED
+from app.infrastructure.auth.session.extension_buffer import (
+    AuthSessionExtensionBuffer,
+)
+from app.infrastructure.background.worker import BackgroundWorker
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_sessions_table,
+)
+
+log = logging.getLogger(__name__)
+
+EXTENSION_BATCH_SIZE = 1_000
+
+
+class SqlaAuthSessionExtensionFlusher(BackgroundWorker):
+    """
+    Writes buffered session extensions off the request path,
+    in its own session, as one `UPDATE ... FROM (VALUES ...)` per batch.
+    An extension never shortens a session, so late or repeated flushes are safe.
+    """
+
+    def __init__(
+        self,
+        buffer: AuthSessionExtensionBuffer,
+        session_factory: async_sessionmaker[AsyncSession],
+    ):
+        self._buffer = buffer
+        self._session_factory = session_factory
+
+    async def run(self) -> None:
+        if not self._buffer.is_enabled:
+            return
+
+        while True:
+            await asyncio.sleep(self._buffer.flush_interval_s)
+            try:
+                await self.flush()
+
+            except DataMapperError as error:
+                log.warning(
+                    "Auth session extension flush failed, %d pending: '%s'.",
+                    len(self._buffer),
+                    error,
+                )
+
+    async def shutdown(self) -> None:
+        try:
+            await self.flush()
+
+        except DataMapperError as error:
+            log.error(
+                "Auth session extension flush on shutdown failed, %d dropped: '%s'.",
+                len(self._buffer),
+                error,
+            )
+
+    async def flush(self) -> int:
+        """
+        :raises DataMapperError:
+        """
+        pending = self._buffer.drain()
+        if not pending:
+            return 0
+
+        try:
+            async with self._session_factory() as session:
+                for batch in batched(
+                    pending.items(), EXTENSION_BATCH_SIZE, strict=False
+                ):
+                    await session.execute(build_bulk_extension_update(batch))
+                await session.commit()
+
+        except SQLAlchemyError as error:
+            self._buffer.requeue(pending)
+            raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from error
+
+        log.debug("Auth session extensions flushed: %d.", len(pending))
+        return len(pending)
+
+
+def build_bulk_extension_update(
+    expirations: Iterable[tuple[str, datetime]],
+) -> Update:
+    extensions = values(
+        column("id", String),
+        column("expiration", DateTime(timezone=True)),
+        name="extensions",
+    ).data(list(expirations))
+
+    return (
+        update(auth_sessions_table)
+        .where(
+            auth_sessions_table.c.id == extensions.c.id,
+            auth_sessions_table.c.expiration < extensions.c.expiration,
+        )
+        .values(expiration=extensions.c.expiration)
+    )
@@ -0,0 +1,70 @@
+import logging
+
+from app.domain.value_objects.entity_id import EntityId
+from app.infrastructure.auth.adapters.data_mapper_sqla import (
+    SqlaAuthSessionDataMapper,
+)
+from app.infrastructure.auth.session.cache import AuthSessionCache
+from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.ports.gateway import (
+    AuthSessionGateway,
+)
+
+log = logging.getLogger(__name__)
+
+
+class CachedAuthSessionGateway(AuthSessionGateway):
+    """
+    Read-through decorator over the storage gateway.
+    Writes always reach storage; the cache is invalidated before delegating,
+    so logout and deactivation take effect on the next request.
+    """
+
+    def __init__(
+        self,
+        gateway: SqlaAuthSessionDataMapper,
+        cache: AuthSessionCache,
+    ):
+        self._gateway = gateway
+        self._cache = cache
+
+    def add(self, auth_session: AuthSession) -> None:
+        """
+        :raises DataMapperError:
+        """
+        self._gateway.add(auth_session)
+
+    async def read_by_id(self, auth_session_id: str) -> AuthSession | None:
+        """
+        :raises DataMapperError:
+        """
+        cached: AuthSession | None = self._cache.get(auth_session_id)
+        if cached is not None:
+            log.debug("Auth session cache hit. Auth session ID: '%s'.", auth_session_id)
+            return cached
+
+        auth_session = await self._gateway.read_by_id(auth_session_id)
+        if auth_session is not None:
+            self._cache.put(auth_session)
+        return auth_session
+
+    async def update(self, auth_session: AuthSession) -> None:
+        """
+        :raises DataMapperError:
+        """
+        self._cache.discard(auth_session.id_)
+        await self._gateway.update(auth_session)
+
+    async def delete(self, auth_session_id: str) -> None:
+        """
+        :raises DataMapperError:
+        """
+        self._cache.invalidate(auth_session_id)
+        await self._gateway.delete(auth_session_id)
+
+    async def delete_all_for_user(self, user_id: EntityId) -> None:
+        """
+        :raises DataMapperError:
+        """
+        self._cache.invalidate_user(user_id)
+        await self._gateway.delete_all_for_user(user_id)
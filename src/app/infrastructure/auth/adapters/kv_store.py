@@ -0,0 +1,123 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from math import inf
+from typing import NewType, Protocol
+
+AuthSessionRedisUrl = NewType("AuthSessionRedisUrl", str)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KvSet:
+    key: str
+    value: bytes
+    expire_at: datetime
+    only_if_exists: bool = False
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KvDelete:
+    keys: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KvSetAdd:
+    """
+    Adds a member to a set. The set expiry is only ever extended,
+    so it outlives the longest-living member.
+    """
+
+    key: str
+    member: str
+    expire_at: datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KvSetRemove:
+    key: str
+    member: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KvSortedSetAdd:
+    """
+    Adds a scored member to a sorted set.
+    The set expiry is only ever extended, as with `KvSetAdd`.
+    """
+
+    key: str
+    member: str
+    score: float
+    expire_at: datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KvSortedSetRemove:
+    key: str
+    members: tuple[str, ...]
+
+
+KvCommand = (
+    KvSet | KvDelete | KvSetAdd | KvSetRemove | KvSortedSetAdd | KvSortedSetRemove
+)
+
+
+class AuthSessionKeyValueStore(Protocol):
+    """
+    Minimal subset of a Redis-compatible key-value store
+    required to keep auth sessions with native TTL expiry.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def members(self, key: str) -> set[str]:
+        """
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def range_by_score(
+        self,
+        key: str,
+        *,
+        above: float,
+        up_to: float = inf,
+    ) -> list[str]:
+        """
+        Members of a sorted set scored within `(above, up_to]`,
+        lowest score first.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def execute(self, commands: Sequence[KvCommand]) -> None:
+        """
+        Applies all commands atomically.
+
+        :raises DataMapperError:
+        """
+
+
+class KvAuthSessionWriteBuffer:
+    """
+    Request-scoped buffer of pending writes,
+    shared by the data mapper and the transaction manager.
+    Mirrors the ORM session: writes become visible on commit only.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[KvCommand] = []
+
+    def stage(self, *commands: KvCommand) -> None:
+        self._pending.extend(commands)
+
+    def drain(self) -> list[KvCommand]:
+        pending, self._pending = self._pending, []
+        return pending
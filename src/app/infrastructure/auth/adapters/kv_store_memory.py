@@ -0,0 +1,128 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from math import inf
+
+from app.infrastructure.auth.adapters.kv_store import (
+    AuthSessionKeyValueStore,
+    KvCommand,
+    KvDelete,
+    KvSet,
+    KvSetAdd,
+    KvSetRemove,
+    KvSortedSetAdd,
+    KvSortedSetRemove,
+)
+
+
+class InMemoryAuthSessionKeyValueStore(AuthSessionKeyValueStore):
+    """
+    Process-local store with the same semantics as the Redis one.
+    Intended for tests, benchmarks and single-process local runs.
+    Expired keys are dropped lazily on access.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[bytes, datetime]] = {}
+        self._sets: dict[str, tuple[set[str], datetime]] = {}
+        self._sorted_sets: dict[str, tuple[dict[str, float], datetime]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        item = self._values.get(key)
+        if item is None:
+            return None
+        value, expire_at = item
+        if expire_at <= self._now():
+            del self._values[key]
+            return None
+        return value
+
+    async def members(self, key: str) -> set[str]:
+        item = self._sets.get(key)
+        if item is None:
+            return set()
+        members, expire_at = item
+        if expire_at <= self._now():
+            del self._sets[key]
+            return set()
+        return set(members)
+
+    async def range_by_score(
+        self,
+        key: str,
+        *,
+        above: float,
+        up_to: float = inf,
+    ) -> list[str]:
+        item = self._sorted_sets.get(key)
+        if item is None:
+            return []
+        scores, expire_at = item
+        if expire_at <= self._now():
+            del self._sorted_sets[key]
+            return []
+        return [
+            member
+            for member, score in sorted(scores.items(), key=lambda entry: entry[1])
+            if above < score <= up_to
+        ]
+
+    async def execute(self, commands: Sequence[KvCommand]) -> None:
+        # No awaits below: commands are applied atomically within the event loop.
+        for command in commands:
+            self._apply(command)
+
+    def _apply(self, command: KvCommand) -> None:
+        match command:
+            case KvSet(
+                key=key,
+                value=value,
+                expire_at=expire_at,
+                only_if_exists=only_if_exists,
+            ):
+                current = self._values.get(key)
+                if only_if_exists and (current is None or current[1] <= self._now()):
+                    return
+                self._values[key] = (value, expire_at)
+            case KvDelete(keys=keys):
+                for key in keys:
+                    self._values.pop(key, None)
+                    self._sets.pop(key, None)
+                    self._sorted_sets.pop(key, None)
+            case KvSetAdd(key=key, member=member, expire_at=expire_at):
+                item = self._sets.get(key)
+                if item is None or item[1] <= self._now():
+                    # An expired set is gone, as in Redis: start a fresh one.
+                    item = (set(), expire_at)
+                members, current_expire_at = item
+                members.add(member)
+                self._sets[key] = (members, max(current_expire_at, expire_at))
+            case KvSetRemove(key=key, member=member):
+                item = self._sets.get(key)
+                if item is not None:
+                    item[0].discard(member)
+            case KvSortedSetAdd() | KvSortedSetRemove():
+                self._apply_sorted(command)
+
+    def _apply_sorted(self, command: KvSortedSetAdd | KvSortedSetRemove) -> None:
+        match command:
+            case KvSortedSetAdd(
+                key=key,
+                member=member,
+                score=score,
+                expire_at=expire_at,
+            ):
+                item = self._sorted_sets.get(key)
+                if item is None or item[1] <= self._now():
+                    item = ({}, expire_at)
+                scores, current_expire_at = item
+                scores[member] = score
+                self._sorted_sets[key] = (scores, max(current_expire_at, expire_at))
+            case KvSortedSetRemove(key=key, members=members):
+                item = self._sorted_sets.get(key)
+                if item is not None:
+                    for member in members:
+                        item[0].pop(member, None)
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(tz=UTC)
@@ -0,0 +1,128 @@
+"""
+Requires the optional `redis` dependency: `pip install -e '.[redis]'`.
+Imported lazily by the IoC setup only when the Redis backend is selected.
+"""
+
+import logging
+from collections.abc import AsyncIterator, Sequence
+from math import inf
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.infrastructure.adapters.constants import (
+    DB_COMMIT_FAILED,
+    DB_QUERY_FAILED,
+)
+from app.infrastructure.auth.adapters.kv_store import (
+    AuthSessionKeyValueStore,
+    AuthSessionRedisUrl,
+    KvCommand,
+    KvDelete,
+    KvSet,
+    KvSetAdd,
+    KvSetRemove,
+    KvSortedSetAdd,
+    KvSortedSetRemove,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+log = logging.getLogger(__name__)
+
+
+class RedisAuthSessionKeyValueStore(AuthSessionKeyValueStore):
+    def __init__(self, client: Redis):
+        self._client = client
+
+    async def get(self, key: str) -> bytes | None:
+        """
+        :raises DataMapperError:
+        """
+        try:
+            value: bytes | None = await self._client.get(key)
+            return value
+
+        except RedisError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def members(self, key: str) -> set[str]:
+        """
+        :raises DataMapperError:
+        """
+        try:
+            members: set[bytes] = await self._client.smembers(key)
+            return {member.decode() for member in members}
+
+        except RedisError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def range_by_score(
+        self,
+        key: str,
+        *,
+        above: float,
+        up_to: float = inf,
+    ) -> list[str]:
+        """
+        :raises DataMapperError:
+        """
+        try:
+            members: list[bytes] = await self._client.zrangebyscore(
+                key,
+                f"({above}",
+                up_to,
+            )
+            return [member.decode() for member in members]
+
+        except RedisError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def execute(self, commands: Sequence[KvCommand]) -> None:
+        """
+        Runs all commands in a single MULTI/EXEC round trip.
+
+        :raises DataMapperError:
+        """
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                for command in commands:
+                    match command:
+                        case KvSet():
+                            pipe.set(
+                                command.key,
+                                command.value,
+                                exat=int(command.expire_at.timestamp()),
+                                xx=command.only_if_exists,
+                            )
+                        case KvDelete():
+                            pipe.delete(*command.keys)
+                        case KvSetAdd():
+                            expire_at = int(command.expire_at.timestamp())
+                            pipe.sadd(command.key, command.member)
+                            # NX covers a fresh set, GT only ever extends it.
+                            pipe.expireat(command.key, expire_at, nx=True)
+                            pipe.expireat(command.key, expire_at, gt=True)
+                        case KvSetRemove():
+                            pipe.srem(command.key, command.member)
+                        case KvSortedSetAdd():
+                            expire_at = int(command.expire_at.timestamp())
+                            pipe.zadd(command.key, {command.member: command.score})
+                            pipe.expireat(command.key, expire_at, nx=True)
+                            pipe.expireat(command.key, expire_at, gt=True)
+                        case KvSortedSetRemove():
+                            pipe.zrem(command.key, *command.members)
+                await pipe.execute()
+
+        except RedisError as error:
+            raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from error
+
+
+async def get_redis_auth_session_store(
+    url: AuthSessionRedisUrl,
+) -> AsyncIterator[AuthSessionKeyValueStore]:
+    client: Redis = Redis.from_url(url, socket_connect_timeout=5)
+    log.debug("Redis auth session store created.")
+    yield RedisAuthSessionKeyValueStore(client)
+    log.debug("Closing Redis auth session store...")
+    await client.aclose()
+    log.debug("Redis auth session store is closed.")
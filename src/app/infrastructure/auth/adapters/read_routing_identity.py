@@ -0,0 +1,14 @@
+from app.domain.value_objects.entity_id import EntityId
+from app.infrastructure.auth.session.service import AuthSessionService
+from app.infrastructure.persistence_sqla.replica import ReadRoutingIdentity
+
+
+class AuthSessionReadRoutingIdentity(ReadRoutingIdentity):
+    def __init__(
+        self,
+        auth_session_service: AuthSessionService,
+    ):
+        self._auth_session_service = auth_session_service
+
+    def get_user_id(self) -> EntityId | None:
+        return self._auth_session_service.authenticated_user_id
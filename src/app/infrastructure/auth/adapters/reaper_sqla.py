@@ -0,0 +1,152 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from sqlalchemy import ColumnElement, Delete, Table, delete, func, select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.adapters.constants import DB_COMMIT_FAILED, DB_QUERY_FAILED
+from app.infrastructure.background.worker import BackgroundWorker
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_session_revocations_table,
+    auth_sessions_table,
+)
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthSessionReaperConfig:
+    interval: timedelta
+    batch_size: int
+
+
+@dataclass(slots=True)
+class AuthSessionReaperStats:
+    runs: int = 0
+    failed_runs: int = 0
+    deleted_sessions: int = 0
+    deleted_revocations: int = 0
+    last_run_deleted: int = 0
+    last_run_duration_s: float = 0.0
+
+
+class SqlaAuthSessionReaper(BackgroundWorker):
+    """
+    Deletes expired auth sessions (and expired revocations) off the request path.
+
+    Each batch is a separate short transaction deleting at most `batch_size` rows
+    picked with `FOR UPDATE SKIP LOCKED`, so it never waits on request traffic
+    and several workers can reap concurrently without overlapping.
+    """
+
+    def __init__(
+        self,
+        config: AuthSessionReaperConfig,
+        session_factory: async_sessionmaker[AsyncSession],
+    ):
+        self._interval_s = config.interval.total_seconds()
+        self._batch_size = config.batch_size
+        self._session_factory = session_factory
+        self._stats = AuthSessionReaperStats()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._interval_s > 0 and self._batch_size > 0
+
+    @property
+    def stats(self) -> AuthSessionReaperStats:
+        return self._stats
+
+    async def run(self) -> None:
+        if not self.is_enabled:
+            return
+
+        while True:
+            await asyncio.sleep(self._interval_s)
+            try:
+                await self.reap()
+
+            except DataMapperError as error:
+                self._stats.failed_runs += 1
+                log.warning("Auth session reaping failed: '%s'.", error)
+
+    async def shutdown(self) -> None:
+        log.debug("Auth session reaper stopped. Stats: %s.", self._stats)
+
+    async def reap(self) -> int:
+        """
+        :raises DataMapperError:
+        """
+        started_at = perf_counter()
+
+        deleted_sessions = await self._reap_table(
+            auth_sessions_table,
+            auth_sessions_table.c.expiration,
+        )
+        deleted_revocations = await self._reap_table(
+            auth_session_revocations_table,
+            auth_session_revocations_table.c.expires_at,
+        )
+
+        self._stats.runs += 1
+        self._stats.deleted_sessions += deleted_sessions
+        self._stats.deleted_revocations += deleted_revocations
+        self._stats.last_run_deleted = deleted_sessions + deleted_revocations
+        self._stats.last_run_duration_s = perf_counter() - started_at
+
+        log.info(
+            "Auth session reaping done: %d sessions, %d revocations in %.3fs.",
+            deleted_sessions,
+            deleted_revocations,
+            self._stats.last_run_duration_s,
+        )
+        return deleted_sessions
+
+    async def _reap_table(
+        self,
+        table: Table,
+        expires_at_column: ColumnElement[datetime],
+    ) -> int:
+        """
+        :raises DataMapperError:
+        """
+        delete_stmt = self._build_batch_delete(table, expires_at_column)
+        deleted_total = 0
+        while True:
+            try:
+                async with self._session_factory() as session:
+                    result = await session.execute(delete_stmt)
+                    await session.commit()
+
+            except SQLAlchemyError as error:
+                raise DataMapperError(
+                    f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}",
+                ) from error
+
+            deleted: int = result.rowcount
+            deleted_total += deleted
+            if deleted < self._batch_size:
+                return deleted_total
+            # Lets request handlers run between batches.
+            await asyncio.sleep(0)
+
+    def _build_batch_delete(
+        self,
+        table: Table,
+        expires_at_column: ColumnElement[datetime],
+    ) -> Delete:
+        primary_key = tuple(table.primary_key.columns)
+        expired_rows = (
+            select(*primary_key)
+            .where(expires_at_column < func.now())
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return delete(table).where(
+            tuple_(*primary_key).in_(expired_rows),
+        )
@@ -0,0 +1,113 @@
+from datetime import UTC, datetime
+from math import inf
+
+import orjson
+
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.auth.adapters.data_mapper_kv import AuthSessionKeyPrefix
+from app.infrastructure.auth.adapters.kv_store import (
+    AuthSessionKeyValueStore,
+    KvAuthSessionWriteBuffer,
+    KvSortedSetAdd,
+    KvSortedSetRemove,
+)
+from app.infrastructure.auth.session.model import (
+    AuthSessionRevocation,
+    AuthSessionRevocationKind,
+)
+from app.infrastructure.auth.session.ports.revocation_gateway import (
+    AuthSessionRevocationGateway,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+
+class KvAuthSessionRevocationGateway(AuthSessionRevocationGateway):
+    """
+    Layout:
+    - `{prefix}:revocations:by_time` scores revocations by revocation time,
+    so a sync reads only those made since the previous one.
+    - `{prefix}:revocations:by_expiry` holds the same members scored by expiry,
+    so pruning touches only expired ones.
+
+    Both sets expire with their longest-living member.
+    """
+
+    def __init__(
+        self,
+        store: AuthSessionKeyValueStore,
+        write_buffer: KvAuthSessionWriteBuffer,
+        key_prefix: AuthSessionKeyPrefix,
+    ):
+        self._store = store
+        self._write_buffer = write_buffer
+        self._by_time_key = f"{key_prefix}:revocations:by_time"
+        self._by_expiry_key = f"{key_prefix}:revocations:by_expiry"
+
+    async def add(self, revocation: AuthSessionRevocation) -> None:
+        """
+        :raises DataMapperError:
+        """
+        member = self._encode(revocation)
+        self._write_buffer.stage(
+            KvSortedSetAdd(
+                key=self._by_time_key,
+                member=member,
+                score=revocation.revoked_at.timestamp(),
+                expire_at=revocation.expires_at,
+            ),
+            KvSortedSetAdd(
+                key=self._by_expiry_key,
+                member=member,
+                score=revocation.expires_at.timestamp(),
+                expire_at=revocation.expires_at,
+            ),
+        )
+
+    async def read_since(self, since: datetime) -> list[AuthSessionRevocation]:
+        """
+        :raises DataMapperError:
+        """
+        now = datetime.now(tz=UTC)
+        expired_members = await self._store.range_by_score(
+            self._by_expiry_key,
+            above=-inf,
+            up_to=now.timestamp(),
+        )
+        if expired_members:
+            await self._store.execute([
+                KvSortedSetRemove(key=key, members=tuple(expired_members))
+                for key in (self._by_time_key, self._by_expiry_key)
+            ])
+
+        members = await self._store.range_by_score(
+            self._by_time_key,
+            above=since.timestamp(),
+        )
+        revocations = [self._decode(member) for member in members]
+        return [revocation for revocation in revocations if revocation.expires_at > now]
+
+    @staticmethod
+    def _encode(revocation: AuthSessionRevocation) -> str:
+        return orjson.dumps({
+            "key": revocation.key,
+            "kind": revocation.kind.value,
+            "revoked_at": revocation.revoked_at.isoformat(),
+            "expires_at": revocation.expires_at.isoformat(),
+        }).decode()
+
+    @staticmethod
+    def _decode(member: str) -> AuthSessionRevocation:
+        """
+        :raises DataMapperError:
+        """
+        try:
+            data = orjson.loads(member)
+            return AuthSessionRevocation(
+                key=data["key"],
+                kind=AuthSessionRevocationKind(data["kind"]),
+                revoked_at=datetime.fromisoformat(data["revoked_at"]),
+                expires_at=datetime.fromisoformat(data["expires_at"]),
+            )
+
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
@@ -0,0 +1,82 @@
+from datetime import datetime
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.auth.adapters.types import AuthAsyncSession
+from app.infrastructure.auth.session.model import (
+    AuthSessionRevocation,
+    AuthSessionRevocationKind,
+)
+from app.infrastructure.auth.session.ports.revocation_gateway import (
+    AuthSessionRevocationGateway,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_session_revocations_table,
+)
+
+
+class SqlaAuthSessionRevocationGateway(AuthSessionRevocationGateway):
+    def __init__(self, session: AuthAsyncSession):
+        self._session = session
+
+    async def add(self, revocation: AuthSessionRevocation) -> None:
+        """
+        :raises DataMapperError:
+        """
+        insert_stmt: Insert = insert(auth_session_revocations_table).values(
+            key=revocation.key,
+            kind=revocation.kind.value,
+            revoked_at=revocation.revoked_at,
+            expires_at=revocation.expires_at,
+        )
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=(
+                auth_session_revocations_table.c.key,
+                auth_session_revocations_table.c.kind,
+            ),
+            set_={
+                "revoked_at": insert_stmt.excluded.revoked_at,
+                "expires_at": insert_stmt.excluded.expires_at,
+            },
+        )
+
+        try:
+            await self._session.execute(upsert_stmt)
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def read_since(self, since: datetime) -> list[AuthSessionRevocation]:
+        """
+        :raises DataMapperError:
+        """
+        table = auth_session_revocations_table
+        select_stmt: Select[tuple[str, str, datetime, datetime]] = select(
+            table.c.key,
+            table.c.kind,
+            table.c.revoked_at,
+            table.c.expires_at,
+        ).where(
+            table.c.revoked_at > since,
+            table.c.expires_at > func.now(),
+        )
+
+        try:
+            rows = (await self._session.execute(select_stmt)).all()
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+        return [
+            AuthSessionRevocation(
+                key=row.key,
+                kind=AuthSessionRevocationKind(row.kind),
+                revoked_at=row.revoked_at,
+                expires_at=row.expires_at,
+            )
+            for row in rows
+        ]
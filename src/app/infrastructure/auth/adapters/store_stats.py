@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from app.infrastructure.auth.adapters.reaper_sqla import AuthSessionReaperStats
+from app.infrastructure.auth.session.cache import AuthSessionCacheStats
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionStoreStats:
+    """Only the SQLA store has a cache and a reaper."""
+
+    cache: AuthSessionCacheStats | None = None
+    reaper: AuthSessionReaperStats | None = None
@@ -0,0 +1,33 @@
+import logging
+
+from app.infrastructure.adapters.constants import DB_COMMIT_DONE
+from app.infrastructure.auth.adapters.kv_store import (
+    AuthSessionKeyValueStore,
+    KvAuthSessionWriteBuffer,
+)
+from app.infrastructure.auth.session.ports.transaction_manager import (
+    AuthSessionTransactionManager,
+)
+
+log = logging.getLogger(__name__)
+
+
+class KvAuthSessionTransactionManager(AuthSessionTransactionManager):
+    def __init__(
+        self,
+        store: AuthSessionKeyValueStore,
+        write_buffer: KvAuthSessionWriteBuffer,
+    ):
+        self._store = store
+        self._write_buffer = write_buffer
+
+    async def commit(self) -> None:
+        """
+        :raises DataMapperError:
+        """
+        commands = self._write_buffer.drain()
+        if not commands:
+            return
+
+        await self._store.execute(commands)
+        log.debug("%s Auth session (key-value store).", DB_COMMIT_DONE)
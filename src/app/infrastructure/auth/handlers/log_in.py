@@ -1,6 +1,7 @@
 import logging
 from dataclasses import dataclass
 
+from app.application.common.ports.uow import AsyncBaseUnitOfWork
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.services.current_user import CurrentUserService
 from app.domain.entities.user import User
@@ -18,6 +19,7 @@ from app.infrastructure.auth.handlers.constants import (
 )
 from app.infrastructure.auth.session.constants import AUTH_INVALID_PASSWORD
 from app.infrastructure.auth.session.service import AuthSessionService
+from app.infrastructure.exceptions.gateway import DataMapperError
 
 log = logging.getLogger(__name__)
 
@@ -36,6 +38,8 @@ class LogInHandler:
     and creates a session.
     - A logged-in user cannot log in again
     until the session expires or is terminated.
+    - A password hash made with outdated parameters is replaced
+    with a fresh one, since the raw password is at hand.
     - Authentication renews automatically
     when accessing protected routes before expiration.
     - If the JWT is invalid, expired, or the session is terminated,
@@ -48,11 +52,13 @@ class LogInHandler:
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         auth_session_service: AuthSessionService,
+        uow: AsyncBaseUnitOfWork,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._auth_session_service = auth_session_service
+        self._uow = uow
 
     async def execute(self, request_data: LogInRequest) -> None:
         """
@@ -78,17 +84,42 @@ class LogInHandler:
         if user is None:
             raise UserNotFoundByUsernameError(username)
 
-        if not self._user_service.is_password_valid(user, password):
+        if not await self._user_service.is_password_valid(user, password):
             raise AuthenticationError(AUTH_INVALID_PASSWORD)
 
         if not user.is_active:
             raise AuthenticationError(AUTH_ACCOUNT_INACTIVE)
 
-        await self._auth_session_service.issue_session(user.id_)
+        # Read first: rolling back a failed rehash expires the user's attributes.
+        user_id, role = user.id_, user.role
+        await self._rehash_password_if_outdated(user, password)
+
+        await self._auth_session_service.issue_session(user_id)
 
         log.info(
             "Log in: done. User, ID: '%s', username '%s', role '%s'.",
-            user.id_.value,
-            user.username.value,
-            user.role.value,
+            user_id.value,
+            username.value,
+            role.value,
         )
+
+    async def _rehash_password_if_outdated(
+        self,
+        user: User,
+        password: RawPassword,
+    ) -> None:
+        """
+        :raises PasswordHasherBusyError:
+        """
+        if not await self._user_service.rehash_password_if_outdated(user, password):
+            return
+
+        try:
+            await self._uow.commit()
+        except DataMapperError as error:
+            # Not worth failing the login; it is retried on the next one.
+            await self._uow.rollback()
+            log.warning("Log in: password rehash not saved: '%s'.", error)
+            return
+
+        log.info("Log in: password rehashed. User ID: '%s'.", user.id_.value)
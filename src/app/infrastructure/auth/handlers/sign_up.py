@@ -4,8 +4,13 @@ from typing import TypedDict
 from uuid import UUID
 
 from app.application.common.ports.flusher import Flusher
+from app.application.common.ports.query_cache_invalidator import (
+    QueryCacheInvalidator,
+)
 from app.application.common.ports.uow import AsyncBaseUnitOfWork
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.query_cache import QueryCacheTag
 from app.application.common.services.current_user import CurrentUserService
 from app.domain.exceptions.user import UsernameAlreadyExistsError
 from app.domain.services.user import UserService
@@ -47,12 +52,16 @@ class SignUpHandler:
         user_command_gateway: UserCommandGateway,
         flusher: Flusher,
         uow: AsyncBaseUnitOfWork,
+        user_counter: UserCounter,
+        query_cache: QueryCacheInvalidator,
     ):
         self._current_user_service = current_user_service
         self._user_service = user_service
         self._user_command_gateway = user_command_gateway
         self._flusher = flusher
         self._uow = uow
+        self._user_counter = user_counter
+        self._query_cache = query_cache
 
     async def execute(self, request_data: SignUpRequest) -> SignUpResponse:
         """
@@ -74,7 +83,7 @@ class SignUpHandler:
         username = Username(request_data.username)
         password = RawPassword(request_data.password)
 
-        user = self._user_service.create_user(username, password)
+        user = await self._user_service.create_user(username, password)
 
         self._user_command_gateway.add(user)
 
@@ -84,6 +93,8 @@ class SignUpHandler:
             raise
 
         await self._uow.commit()
+        self._user_counter.invalidate()
+        await self._query_cache.invalidate(QueryCacheTag.USERS)
 
         log.info("Sign up: done. Username: '%s'.", user.username.value)
         return SignUpResponse(id=user.id_.value)
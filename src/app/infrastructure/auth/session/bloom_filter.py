@@ -0,0 +1,54 @@
+import hashlib
+import math
+from collections.abc import Iterator
+
+
+class BloomFilter:
+    """
+    Fixed-size probabilistic set of strings.
+    Never yields false negatives; false positives stay around `error_rate`
+    until more than `capacity` keys are added.
+
+    Memory is allocated once, and keys cannot be removed,
+    so the filter is rebuilt rather than shrunk.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._capacity = capacity
+        self._num_bits = max(num_bits, 8)
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def is_saturated(self) -> bool:
+        return self._count > self._capacity
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    def _positions(self, key: str) -> Iterator[int]:
+        """Double hashing (Kirsch-Mitzenmacher) over one 128-bit digest."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
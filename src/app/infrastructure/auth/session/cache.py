@@ -0,0 +1,164 @@
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Any, NewType
+
+from app.domain.value_objects.entity_id import EntityId
+from app.infrastructure.auth.session.model import AuthSession
+
+log = logging.getLogger(__name__)
+
+AuthSessionCacheMaxSize = NewType("AuthSessionCacheMaxSize", int)
+AuthSessionCacheTtl = NewType("AuthSessionCacheTtl", timedelta)
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    user_id: EntityId
+    expiration: datetime
+    stored_until: float
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionCacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class AuthSessionCache:
+    """
+    Process-wide LRU cache of auth sessions with per-entry TTL.
+
+    Entries are stored as plain values, so cached sessions are never shared
+    between ORM sessions: every hit returns a fresh `AuthSession`.
+    Invalidated session and user IDs are remembered for one TTL window,
+    so a stale row read by a concurrent request before the deleting
+    transaction commits cannot be put back into the cache.
+
+    Invalidation is local to the process; the TTL bounds staleness
+    across workers.
+    """
+
+    def __init__(
+        self,
+        max_size: AuthSessionCacheMaxSize,
+        ttl: AuthSessionCacheTtl,
+    ):
+        self._max_size = max_size
+        self._ttl_s = ttl.total_seconds()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._ids_by_user: dict[EntityId, set[str]] = {}
+        # Ordered by expiry, as every revocation is remembered for the same TTL
+        self._revoked_ids: OrderedDict[str, float] = OrderedDict()
+        self._revoked_users: OrderedDict[EntityId, float] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._max_size > 0 and self._ttl_s > 0
+
+    @property
+    def stats(self) -> AuthSessionCacheStats:
+        return AuthSessionCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries),
+            max_size=self._max_size,
+        )
+
+    def get(self, auth_session_id: str) -> AuthSession | None:
+        entry = self._entries.get(auth_session_id)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.stored_until <= monotonic():
+            self._evict(auth_session_id)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(auth_session_id)
+        self._hits += 1
+        return AuthSession(
+            id_=auth_session_id,
+            user_id=entry.user_id,
+            expiration=entry.expiration,
+        )
+
+    def put(self, auth_session: AuthSession) -> None:
+        if not self.is_enabled:
+            return
+
+        now = monotonic()
+        if self._is_revoked(auth_session.id_, auth_session.user_id, now):
+            log.debug(
+                "Auth session cache: skipped revoked session. Auth session ID: '%s'.",
+                auth_session.id_,
+            )
+            return
+
+        self._evict(auth_session.id_)
+        self._entries[auth_session.id_] = _CacheEntry(
+            user_id=auth_session.user_id,
+            expiration=auth_session.expiration,
+            stored_until=now + self._ttl_s,
+        )
+        self._ids_by_user.setdefault(auth_session.user_id, set()).add(
+            auth_session.id_,
+        )
+
+        while len(self._entries) > self._max_size:
+            oldest_id = next(iter(self._entries))
+            self._evict(oldest_id)
+
+    def invalidate(self, auth_session_id: str) -> None:
+        self._evict(auth_session_id)
+        self._remember_revocation(self._revoked_ids, auth_session_id)
+
+    def invalidate_user(self, user_id: EntityId) -> None:
+        for auth_session_id in self._ids_by_user.pop(user_id, set()):
+            self._entries.pop(auth_session_id, None)
+        self._remember_revocation(self._revoked_users, user_id)
+
+    def discard(self, auth_session_id: str) -> None:
+        """Drops an entry without blocking it from being cached again."""
+        self._evict(auth_session_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._ids_by_user.clear()
+        self._revoked_ids.clear()
+        self._revoked_users.clear()
+
+    def _evict(self, auth_session_id: str) -> None:
+        entry = self._entries.pop(auth_session_id, None)
+        if entry is None:
+            return
+        user_session_ids = self._ids_by_user.get(entry.user_id)
+        if user_session_ids is not None:
+            user_session_ids.discard(auth_session_id)
+            if not user_session_ids:
+                del self._ids_by_user[entry.user_id]
+
+    def _is_revoked(self, auth_session_id: str, user_id: EntityId, now: float) -> bool:
+        self._purge_revocations(now)
+        return auth_session_id in self._revoked_ids or user_id in self._revoked_users
+
+    def _purge_revocations(self, now: float) -> None:
+        """Pops expired revocations from the front; costs nothing otherwise."""
+        for revoked in (self._revoked_ids, self._revoked_users):
+            while revoked and next(iter(revoked.values())) <= now:
+                revoked.popitem(last=False)
+
+    def _remember_revocation(
+        self,
+        revoked: OrderedDict[Any, float],
+        key: object,
+    ) -> None:
+        revoked.pop(key, None)
+        revoked[key] = monotonic() + self._ttl_s
@@ -0,0 +1,53 @@
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from typing import NewType
+
+AuthSessionExtensionFlushInterval = NewType(
+    "AuthSessionExtensionFlushInterval",
+    timedelta,
+)
+
+
+class AuthSessionExtensionBuffer:
+    """
+    Process-wide buffer of pending expiration extensions, coalesced per session ID:
+    parallel requests extending the same session leave a single entry
+    with the latest expiration, written by the next periodic flush.
+
+    A zero flush interval disables it, and extensions are written synchronously.
+    """
+
+    def __init__(self, flush_interval: AuthSessionExtensionFlushInterval):
+        self._flush_interval_s = flush_interval.total_seconds()
+        self._pending: dict[str, datetime] = {}
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._flush_interval_s > 0
+
+    @property
+    def flush_interval_s(self) -> float:
+        return self._flush_interval_s
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get(self, auth_session_id: str) -> datetime | None:
+        return self._pending.get(auth_session_id)
+
+    def schedule(self, auth_session_id: str, expiration: datetime) -> None:
+        current = self._pending.get(auth_session_id)
+        if current is None or current < expiration:
+            self._pending[auth_session_id] = expiration
+
+    def discard(self, auth_session_id: str) -> None:
+        self._pending.pop(auth_session_id, None)
+
+    def drain(self) -> dict[str, datetime]:
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def requeue(self, expirations: Mapping[str, datetime]) -> None:
+        """Returns a failed batch without overriding newer extensions."""
+        for auth_session_id, expiration in expirations.items():
+            self.schedule(auth_session_id, expiration)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from enum import StrEnum
 
 from app.domain.value_objects.entity_id import EntityId
 
@@ -17,3 +18,38 @@ class AuthSession:
     id_: str
     user_id: EntityId
     expiration: datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SignedAuthSession:
+    """
+    Auth session as asserted by a valid signed token.
+    Trusted without a storage lookup in stateless mode,
+    as long as it is not revoked.
+    """
+
+    id_: str
+    user_id: EntityId
+    expiration: datetime
+    issued_at: datetime
+
+
+class AuthSessionRevocationKind(StrEnum):
+    SESSION = "session"
+    USER = "user"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionRevocation:
+    """
+    - `SESSION`: the session with ID `key` is revoked.
+    - `USER`: every session of the user with ID `key`
+    issued not later than `revoked_at` is revoked.
+
+    Kept until `expires_at`, after which every revoked token has expired anyway.
+    """
+
+    key: str
+    kind: AuthSessionRevocationKind
+    revoked_at: datetime
+    expires_at: datetime
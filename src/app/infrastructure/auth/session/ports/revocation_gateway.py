@@ -0,0 +1,28 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Protocol
+
+from app.infrastructure.auth.session.model import AuthSessionRevocation
+
+
+class AuthSessionRevocationGateway(Protocol):
+    """
+    Shared storage of revocations, so every worker
+    learns about sessions terminated by the others.
+    """
+
+    @abstractmethod
+    async def add(self, revocation: AuthSessionRevocation) -> None:
+        """
+        Staged in the current auth transaction.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def read_since(self, since: datetime) -> list[AuthSessionRevocation]:
+        """
+        Returns unexpired revocations made after `since`.
+
+        :raises DataMapperError:
+        """
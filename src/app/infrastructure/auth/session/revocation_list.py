@@ -0,0 +1,247 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from time import monotonic
+from typing import NewType
+from uuid import UUID
+
+from app.domain.value_objects.entity_id import EntityId
+from app.infrastructure.auth.session.bloom_filter import BloomFilter
+from app.infrastructure.auth.session.model import (
+    AuthSessionRevocation,
+    AuthSessionRevocationKind,
+    SignedAuthSession,
+)
+from app.infrastructure.auth.session.ports.revocation_gateway import (
+    AuthSessionRevocationGateway,
+)
+
+log = logging.getLogger(__name__)
+
+AuthSessionStateless = NewType("AuthSessionStateless", bool)
+
+_EPOCH = datetime.min.replace(tzinfo=UTC)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthSessionRevocationListConfig:
+    sync_interval: timedelta
+    compaction_interval: timedelta
+    bloom_capacity: int
+    bloom_error_rate: float
+    exact_max_size: int
+
+
+class AuthSessionRevocationStatus(StrEnum):
+    NOT_REVOKED = "not_revoked"
+    REVOKED = "revoked"
+    UNKNOWN = "unknown"
+
+
+class AuthSessionRevocationList:
+    """
+    Process-wide snapshot of revoked sessions and users,
+    used to reject signed sessions without reading them from storage.
+
+    Revoked session IDs go into a bloom filter sized for `bloom_capacity`,
+    which answers the common "not revoked" case in constant time.
+    Once more IDs are live, compaction sizes the next one for twice as many.
+    Hits are confirmed against an exact set capped at `exact_max_size`;
+    once it overflows, a hit missing from it is reported as `UNKNOWN`,
+    and the caller is expected to consult storage.
+
+    Storage is queried at most once per sync interval per process,
+    for revocations newer than the previous sync only.
+    Every compaction interval the filter is rebuilt from live entries
+    (or reloaded from storage after an overflow), dropping expired ones.
+    """
+
+    def __init__(
+        self,
+        config: AuthSessionRevocationListConfig,
+        stateless: AuthSessionStateless,
+    ):
+        self._config = config
+        self._is_enabled = stateless
+        self._sync_interval_s = config.sync_interval.total_seconds()
+        self._bloom = self._new_bloom(config.bloom_capacity)
+        self._revoked_sessions: OrderedDict[str, datetime] = OrderedDict()
+        self._revoked_users: dict[EntityId, AuthSessionRevocation] = {}
+        self._is_overflowed = False
+        self._synced_at: datetime | None = None
+        self._next_sync_at: float = 0.0
+        self._next_compaction_at: float = 0.0
+        self._sync_lock = asyncio.Lock()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._is_enabled
+
+    @property
+    def size(self) -> int:
+        return self._bloom.count + len(self._revoked_users)
+
+    def check(self, signed_session: SignedAuthSession) -> AuthSessionRevocationStatus:
+        user_revocation = self._revoked_users.get(signed_session.user_id)
+        if (
+            user_revocation is not None
+            and signed_session.issued_at <= user_revocation.revoked_at
+        ):
+            return AuthSessionRevocationStatus.REVOKED
+
+        if signed_session.id_ not in self._bloom:
+            return AuthSessionRevocationStatus.NOT_REVOKED
+        if signed_session.id_ in self._revoked_sessions:
+            return AuthSessionRevocationStatus.REVOKED
+        if self._is_overflowed:
+            return AuthSessionRevocationStatus.UNKNOWN
+        return AuthSessionRevocationStatus.NOT_REVOKED
+
+    def add(self, revocation: AuthSessionRevocation) -> None:
+        if not self._is_enabled:
+            return
+
+        match revocation.kind:
+            case AuthSessionRevocationKind.SESSION:
+                self._add_session(revocation.key, revocation.expires_at)
+            case AuthSessionRevocationKind.USER:
+                user_id = EntityId(UUID(revocation.key))
+                current = self._revoked_users.get(user_id)
+                if current is None or current.revoked_at < revocation.revoked_at:
+                    self._revoked_users[user_id] = revocation
+
+    def add_session(self, auth_session_id: str, expiration: datetime) -> None:
+        if self._is_enabled:
+            self._add_session(auth_session_id, expiration)
+
+    async def sync_if_stale(self, gateway: AuthSessionRevocationGateway) -> None:
+        """
+        :raises DataMapperError:
+        """
+        if not self._is_enabled or monotonic() < self._next_sync_at:
+            return
+
+        async with self._sync_lock:
+            if monotonic() < self._next_sync_at:
+                return
+
+            now = datetime.now(tz=UTC)
+            if monotonic() >= self._next_compaction_at or self._bloom.is_saturated:
+                await self._compact(gateway, now)
+            else:
+                await self._refresh(gateway, now)
+
+            # Overlap protects against revocations committed out of order.
+            self._synced_at = now - self._config.sync_interval
+            self._next_sync_at = monotonic() + self._sync_interval_s
+
+    async def _refresh(
+        self,
+        gateway: AuthSessionRevocationGateway,
+        now: datetime,
+    ) -> None:
+        """
+        :raises DataMapperError:
+        """
+        revocations = await gateway.read_since(self._synced_at or _EPOCH)
+        for revocation in revocations:
+            self.add(revocation)
+        self._purge_expired(now)
+
+        log.debug(
+            "Auth session revocations synced: %d new, %d total.",
+            len(revocations),
+            self.size,
+        )
+
+    async def _compact(
+        self,
+        gateway: AuthSessionRevocationGateway,
+        now: datetime,
+    ) -> None:
+        """
+        Evicted entries exist only in the old filter,
+        so after an overflow the new one is reloaded from storage.
+
+        :raises DataMapperError:
+        """
+        is_full_reload = self._synced_at is None or self._is_overflowed
+        revocations = await gateway.read_since(
+            _EPOCH if is_full_reload else (self._synced_at or _EPOCH),
+        )
+
+        # No awaits below: the swap is atomic for concurrent readers.
+        live_sessions = (
+            []
+            if is_full_reload
+            else [
+                (key, expires_at)
+                for key, expires_at in self._revoked_sessions.items()
+                if expires_at > now
+            ]
+        )
+        live_users = [
+            revocation
+            for revocation in self._revoked_users.values()
+            if revocation.expires_at > now
+        ]
+        live_session_count = len(live_sessions) + sum(
+            revocation.kind == AuthSessionRevocationKind.SESSION
+            and revocation.expires_at > now
+            for revocation in revocations
+        )
+        # Grown ahead of saturation, which would compact it again on every sync.
+        bloom_capacity = max(self._config.bloom_capacity, 2 * live_session_count)
+        if bloom_capacity > self._config.bloom_capacity:
+            log.info(
+                "Auth session revocation filter grown for %d live sessions.",
+                live_session_count,
+            )
+        self._bloom = self._new_bloom(bloom_capacity)
+        self._revoked_sessions = OrderedDict()
+        self._revoked_users = {}
+        self._is_overflowed = False
+        for key, expires_at in live_sessions:
+            self._add_session(key, expires_at)
+        for revocation in (*live_users, *revocations):
+            if revocation.expires_at > now:
+                self.add(revocation)
+
+        self._next_compaction_at = (
+            monotonic() + self._config.compaction_interval.total_seconds()
+        )
+
+        log.debug(
+            "Auth session revocations compacted (%s): %d total, %d bytes of filter.",
+            "reloaded" if is_full_reload else "rebuilt",
+            self.size,
+            self._bloom.size_bytes,
+        )
+
+    def _add_session(self, auth_session_id: str, expiration: datetime) -> None:
+        self._bloom.add(auth_session_id)
+        self._revoked_sessions[auth_session_id] = expiration
+        self._revoked_sessions.move_to_end(auth_session_id)
+        while len(self._revoked_sessions) > self._config.exact_max_size:
+            self._revoked_sessions.popitem(last=False)
+            self._is_overflowed = True
+
+    def _new_bloom(self, capacity: int) -> BloomFilter:
+        return BloomFilter(
+            capacity=capacity,
+            error_rate=self._config.bloom_error_rate,
+        )
+
+    def _purge_expired(self, now: datetime) -> None:
+        """Expired IDs stay in the filter until compaction, but are never confirmed."""
+        for key, expires_at in list(self._revoked_sessions.items()):
+            if expires_at <= now:
+                del self._revoked_sessions[key]
+        self._revoked_users = {
+            user_id: revocation
+            for user_id, revocation in self._revoked_users.items()
+            if revocation.expires_at > now
+        }
@@ -14,14 +14,27 @@ from app.infrastructure.auth.session.constants import (
 from app.infrastructure.auth.session.id_generator_str import (
     StrAuthSessionIdGenerator,
 )
-from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.model import (
+    AuthSession,
+    AuthSessionRevocation,
+    AuthSessionRevocationKind,
+    SignedAuthSession,
+)
 from app.infrastructure.auth.session.ports.gateway import (
     AuthSessionGateway,
 )
+from app.infrastructure.auth.session.ports.revocation_gateway import (
+    AuthSessionRevocationGateway,
+)
 from app.infrastructure.auth.session.ports.transaction_manager import (
     AuthSessionTransactionManager,
 )
 from app.infrastructure.auth.session.ports.transport import AuthSessionTransport
+from app.infrastructure.auth.session.revocation_list import (
+    AuthSessionRevocationList,
+    AuthSessionRevocationStatus,
+    AuthSessionStateless,
+)
 from app.infrastructure.auth.session.timer_utc import UtcAuthSessionTimer
 from app.infrastructure.exceptions.gateway import DataMapperError
 
@@ -36,14 +49,27 @@ class AuthSessionService:
         auth_transaction_manager: AuthSessionTransactionManager,
         auth_session_id_generator: StrAuthSessionIdGenerator,
         auth_session_timer: UtcAuthSessionTimer,
+        auth_session_revocation_gateway: AuthSessionRevocationGateway,
+        auth_session_revocation_list: AuthSessionRevocationList,
+        stateless: AuthSessionStateless,
     ):
         self._auth_session_gateway = auth_session_gateway
         self._auth_session_transport = auth_session_transport
         self._auth_transaction_manager = auth_transaction_manager
         self._auth_session_id_generator = auth_session_id_generator
         self._auth_session_timer = auth_session_timer
+        self._auth_session_revocation_gateway = auth_session_revocation_gateway
+        self._auth_session_revocation_list = auth_session_revocation_list
+        self._stateless = stateless
         self._cached_auth_session: AuthSession | None = None
 
+    @property
+    def authenticated_user_id(self) -> EntityId | None:
+        """Known once the request is authenticated; no storage access."""
+        if self._cached_auth_session is None:
+            return None
+        return self._cached_auth_session.user_id
+
     async def issue_session(self, user_id: EntityId) -> None:
         """
         :raises AuthenticationError:
@@ -79,6 +105,22 @@ class AuthSessionService:
         """
         log.debug("Get authenticated user ID: started.")
 
+        if self._stateless and self._cached_auth_session is None:
+            signed_auth_session = await self._get_valid_signed_session()
+            if signed_auth_session is not None:
+                self._cached_auth_session = AuthSession(
+                    id_=signed_auth_session.id_,
+                    user_id=signed_auth_session.user_id,
+                    expiration=signed_auth_session.expiration,
+                )
+                log.debug(
+                    "Get authenticated user ID: done (signed session). "
+                    "Auth session ID: '%s'. User ID: '%s'.",
+                    signed_auth_session.id_,
+                    signed_auth_session.user_id.value,
+                )
+                return signed_auth_session.user_id
+
         raw_auth_session = await self._get_current_auth_session()
         valid_auth_session = await self._validate_and_extend_session(raw_auth_session)
         self._cached_auth_session = valid_auth_session
@@ -94,8 +136,10 @@ class AuthSessionService:
         log.debug("Terminate current session: started. Auth session ID: unknown.")
 
         auth_session_id: str | None
+        expiration: datetime | None = None
         if self._cached_auth_session is not None:
             auth_session_id = self._cached_auth_session.id_
+            expiration = self._cached_auth_session.expiration
             log.debug(
                 "Terminate current session: using ID from cache. "
                 "Auth session ID: '%s'.",
@@ -120,6 +164,12 @@ class AuthSessionService:
 
         try:
             await self._auth_session_gateway.delete(auth_session_id)
+            if self._stateless:
+                await self._revoke(
+                    auth_session_id,
+                    AuthSessionRevocationKind.SESSION,
+                    expiration,
+                )
             await self._auth_transaction_manager.commit()
             log.debug(
                 "Terminate current session: done (transport cleared, storage deleted). "
@@ -147,6 +197,8 @@ class AuthSessionService:
         )
 
         await self._auth_session_gateway.delete_all_for_user(user_id)
+        if self._stateless:
+            await self._revoke(str(user_id.value), AuthSessionRevocationKind.USER)
         await self._auth_transaction_manager.commit()
 
         if self._cached_auth_session and self._cached_auth_session.user_id == user_id:
@@ -158,6 +210,70 @@ class AuthSessionService:
             user_id.value,
         )
 
+    async def _get_valid_signed_session(self) -> SignedAuthSession | None:
+        """
+        Returns the session asserted by the token if it can be trusted
+        without reading storage. `None` means storage must be consulted:
+        the token has no stateless claims, the revocation list cannot be
+        synced or confirm the session, or the session is due for extension.
+
+        :raises AuthenticationError:
+        """
+        signed_auth_session = self._auth_session_transport.extract_signed_session()
+        if signed_auth_session is None:
+            return None
+
+        try:
+            await self._auth_session_revocation_list.sync_if_stale(
+                self._auth_session_revocation_gateway,
+            )
+
+        except DataMapperError as error:
+            log.warning("Auth session revocations sync failed: '%s'.", error)
+            return None
+
+        match self._auth_session_revocation_list.check(signed_auth_session):
+            case AuthSessionRevocationStatus.REVOKED:
+                log.debug(
+                    "Signed auth session is revoked. Auth session ID: '%s'.",
+                    signed_auth_session.id_,
+                )
+                raise AuthenticationError(AUTH_NOT_AUTHENTICATED)
+            case AuthSessionRevocationStatus.UNKNOWN:
+                return None
+            case AuthSessionRevocationStatus.NOT_REVOKED:
+                pass
+
+        now = self._auth_session_timer.current_time
+        if (
+            signed_auth_session.expiration - now
+            <= self._auth_session_timer.refresh_trigger_interval
+        ):
+            return None
+
+        return signed_auth_session
+
+    async def _revoke(
+        self,
+        key: str,
+        kind: AuthSessionRevocationKind,
+        expiration: datetime | None = None,
+    ) -> None:
+        """
+        Without a known expiration, the revocation is kept for a full session TTL,
+        which outlives any token issued so far.
+
+        :raises DataMapperError:
+        """
+        revocation = AuthSessionRevocation(
+            key=key,
+            kind=kind,
+            revoked_at=self._auth_session_timer.current_time,
+            expires_at=expiration or self._auth_session_timer.auth_session_expiration,
+        )
+        await self._auth_session_revocation_gateway.add(revocation)
+        self._auth_session_revocation_list.add(revocation)
+
     async def _get_current_auth_session(self) -> AuthSession:
         """
         :raises AuthenticationError:
@@ -0,0 +1,25 @@
+from abc import abstractmethod
+from typing import NewType, Protocol
+
+
+class BackgroundWorker(Protocol):
+    """
+    Periodic job started with the application and stopped on shutdown.
+    Keeps maintenance work off the request path.
+    """
+
+    @abstractmethod
+    async def run(self) -> None:
+        """
+        Runs until cancelled. Failures of a single iteration
+        are logged and must not end the loop.
+        """
+
+    @abstractmethod
+    async def shutdown(self) -> None:
+        """
+        Called once `run` is cancelled, e.g. to flush pending writes.
+        """
+
+
+BackgroundWorkers = NewType("BackgroundWorkers", list[BackgroundWorker])
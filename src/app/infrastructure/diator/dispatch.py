@@ -0,0 +1,84 @@
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+from diator.events import EventMap
+from diator.requests import Request, RequestHandler
+from dishka import DEFAULT_COMPONENT, AsyncContainer, DependencyKey, Scope
+from dishka.registry import Registry
+
+from app.infrastructure.exceptions.mediator import (
+    HandlerNotBoundError,
+    HandlerNotProvidedError,
+)
+
+
+class HandlerDispatchTable:
+    """
+    Request types mapped straight to their handler types, compiled at startup.
+    A handler is then built by the factory dishka compiled for it,
+    with its dependency graph resolved when the container was built.
+    """
+
+    def __init__(
+        self,
+        request_handlers: Mapping[type[Request], type[RequestHandler[Any, Any]]],
+        event_map: EventMap,
+    ):
+        self._request_handlers = dict(request_handlers)
+        self._event_handlers = [
+            handler_type
+            for event_type in event_map.get_events()
+            for handler_type in event_map.get(event_type)
+        ]
+
+    def handler_for(
+        self, request_type: type[Request]
+    ) -> type[RequestHandler[Any, Any]]:
+        """
+        :raises HandlerNotBoundError:
+        """
+        try:
+            return self._request_handlers[request_type]
+        except KeyError:
+            raise HandlerNotBoundError(
+                f"No handler is bound to {request_type.__name__}.",
+            ) from None
+
+    def validate(self, container: AsyncContainer) -> None:
+        """
+        Checks that every handler has a factory reachable from the request scope.
+        Their dependencies are checked by dishka as the container is built.
+
+        :raises HandlerNotProvidedError:
+        """
+        registries = list(_registries_up_to(container, Scope.REQUEST))
+        missing = sorted(
+            handler_type.__name__
+            for handler_type in {
+                *self._request_handlers.values(),
+                *self._event_handlers,
+            }
+            if not any(
+                registry.get_factory(DependencyKey(handler_type, DEFAULT_COMPONENT))
+                for registry in registries
+            )
+        )
+        if missing:
+            raise HandlerNotProvidedError(
+                f"Handlers not provided in the request scope: {', '.join(missing)}.",
+            )
+
+
+def _registries_up_to(container: AsyncContainer, scope: Scope) -> Iterator[Registry]:
+    parent: AsyncContainer | None = container
+    while parent is not None:
+        yield parent.registry
+        parent = parent.parent_container
+    if container.registry.scope is scope:
+        return
+
+    child_registries: Iterable[Registry] = container.child_registries
+    for registry in child_registries:
+        yield registry
+        if registry.scope is scope:
+            return
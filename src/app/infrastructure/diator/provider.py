@@ -1,6 +1,5 @@
 import logging
 
-from diator.containers.dishka import DishkaContainer
 from diator.events import EventEmitter
 from diator.mediator import Mediator
 from diator.middlewares import MiddlewareChain
@@ -8,34 +7,86 @@ from dishka import AsyncContainer
 
 # from redis import asyncio as redis  # noqa: ERA001
 # from diator.message_brokers.redis import RedisMessageBroker  # noqa: ERA001
-from app.application.cqrs import event_map, request_map
+from app.application.cqrs import (
+    event_map,
+    query_cache_policies,
+    request_handlers,
+    statement_budgets,
+)
+from app.infrastructure.diator.dispatch import HandlerDispatchTable
+from app.infrastructure.diator.query_budget import (
+    QueryBudgetMiddleware,
+    QueryBudgetMode,
+)
+from app.infrastructure.diator.query_cache import (
+    QueryCacheMiddleware,
+    QueryCacheStore,
+)
+from app.infrastructure.diator.request_scope import (
+    AppMediator,
+    RequestMediator,
+    RequestScopedContainer,
+)
+from app.infrastructure.diator.telemetry import (
+    MediatorMetrics,
+    MediatorTelemetryMiddleware,
+)
+from app.infrastructure.diator.tracing import SpanExporterKind, create_span_exporter
+from app.setup.config.query_cache import QueryCacheBackend
 from app.setup.config.settings import AppSettings
 
 log = logging.getLogger(__name__)
 
 
 def get_mediator(
+    settings: AppSettings,
     container: AsyncContainer,
-    settings: AppSettings,  # noqa: ARG001
-) -> Mediator:
-    dishka = DishkaContainer()
-    dishka.attach_external_container(container)
+    metrics: MediatorMetrics,
+    query_cache_store: QueryCacheStore,
+) -> AppMediator:
+    """
+    Built once per app; handlers are resolved per request.
+
+    :raises HandlerNotProvidedError:
+    """
+    dispatch_table = HandlerDispatchTable(request_handlers, event_map)
+    dispatch_table.validate(container)
 
     # Middlewares
     m_chain = MiddlewareChain()
+    # Added first to be outermost, so its timing covers the other middlewares.
+    if settings.mediator.telemetry:
+        span_exporter = create_span_exporter(
+            SpanExporterKind(settings.mediator.span_exporter),
+        )
+        m_chain.add(MediatorTelemetryMiddleware(metrics, span_exporter))
+    # Outside the budget: a hit runs no handler statements to check.
+    if settings.query_cache.backend != QueryCacheBackend.OFF:
+        m_chain.add(QueryCacheMiddleware(query_cache_policies, query_cache_store))
+    budget_mode = QueryBudgetMode(settings.queries.statement_budget)
+    if budget_mode != QueryBudgetMode.OFF:
+        m_chain.add(QueryBudgetMiddleware(statement_budgets, budget_mode))
 
     # Events
     # redis_client: redis.Redis = redis.Redis.from_url("redis://localhost:6379/0")  # noqa: E501, ERA001
     # message_broker = RedisMessageBroker(redis_client)  # noqa: ERA001
 
     event_emitter = EventEmitter(
-        event_map=event_map, container=dishka, message_broker=None
+        event_map=event_map,
+        container=RequestScopedContainer(),
+        message_broker=None,
     )
 
     log.debug("Mediator initialized.")
-    return Mediator(
-        request_map=request_map,
-        event_emitter=event_emitter,
-        container=dishka,
+    return AppMediator(
+        dispatch_table=dispatch_table,
         middleware_chain=m_chain,
+        event_emitter=event_emitter,
     )
+
+
+def get_request_mediator(
+    mediator: AppMediator,
+    container: AsyncContainer,
+) -> Mediator:
+    return RequestMediator(mediator, container)
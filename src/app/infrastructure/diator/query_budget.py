@@ -0,0 +1,61 @@
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from enum import StrEnum
+from typing import Any
+
+from diator.requests import Request
+
+from app.infrastructure.exceptions.query_budget import QueryBudgetExceededError
+from app.infrastructure.persistence_sqla.statement_counter import count_statements
+
+log = logging.getLogger(__name__)
+
+
+class QueryBudgetMode(StrEnum):
+    OFF = "off"
+    WARN = "warn"
+    FAIL = "fail"
+
+
+class QueryBudgetMiddleware:
+    """
+    Counts SQL statements per mediator request against the budget
+    declared for its type; requests without one are not checked.
+
+    Meant for debug and tests: an extra query on a hot path, or one per row,
+    shows up as soon as the handler runs rather than under production load.
+    """
+
+    def __init__(
+        self,
+        budgets: Mapping[type[Request], int],
+        mode: QueryBudgetMode,
+    ):
+        self._budgets = budgets
+        self._mode = mode
+
+    async def __call__(
+        self,
+        request: Request,
+        handle: Callable[[Request], Awaitable[Any]],
+    ) -> Any:
+        """
+        :raises QueryBudgetExceededError:
+        """
+        budget = self._budgets.get(type(request))
+        if budget is None:
+            return await handle(request)
+
+        with count_statements() as count:
+            response = await handle(request)
+
+        if count.statements > budget:
+            message = (
+                f"{type(request).__name__} issued {count.statements} SQL statements, "
+                f"budget is {budget}."
+            )
+            if self._mode == QueryBudgetMode.FAIL:
+                raise QueryBudgetExceededError(message)
+            log.warning(message)
+
+        return response
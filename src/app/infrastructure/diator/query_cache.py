@@ -0,0 +1,192 @@
+import logging
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from datetime import timedelta
+from hashlib import blake2b
+from time import monotonic
+from typing import Any, NewType, Protocol
+
+from diator.requests import Request
+
+from app.application.common.ports.query_cache_invalidator import (
+    QueryCacheInvalidator,
+)
+from app.application.common.query_cache import QueryCachePolicy, QueryCacheTag
+from app.application.common.services.current_user import CurrentUserService
+from app.infrastructure.diator.request_scope import current_request_container
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+log = logging.getLogger(__name__)
+
+QueryCacheMaxEntries = NewType("QueryCacheMaxEntries", int)
+QueryCacheKeyPrefix = NewType("QueryCacheKeyPrefix", str)
+QueryCacheRedisUrl = NewType("QueryCacheRedisUrl", str)
+
+
+class QueryCacheStore(Protocol):
+    """
+    Cached query results, and a version per tag. Invalidating a tag
+    bumps its version, which is part of the key of every result under it:
+    results cached before the bump are never read again, even if stored
+    after it by a request that started before.
+    """
+
+    @abstractmethod
+    async def tag_versions(self, tags: Sequence[str]) -> list[int]:
+        """
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: timedelta) -> None:
+        """
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def bump(self, tags: Sequence[str]) -> None:
+        """
+        :raises DataMapperError:
+        """
+
+
+class InMemoryQueryCacheStore(QueryCacheStore):
+    """
+    Per worker process, least recently used entries evicted first.
+    Results are served as the very objects the handler returned,
+    so nothing may mutate them. Invalidations reach this worker only;
+    others serve stale results until their TTL runs out.
+    """
+
+    def __init__(self, max_entries: QueryCacheMaxEntries):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._tag_versions: dict[str, int] = {}
+
+    async def tag_versions(self, tags: Sequence[str]) -> list[int]:
+        return [self._tag_versions.get(tag, 0) for tag in tags]
+
+    async def get(self, key: str) -> Any | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: timedelta) -> None:
+        self._entries[key] = (value, monotonic() + ttl.total_seconds())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def bump(self, tags: Sequence[str]) -> None:
+        for tag in tags:
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+
+
+class StoreQueryCacheInvalidator(QueryCacheInvalidator):
+    def __init__(self, store: QueryCacheStore):
+        self._store = store
+
+    async def invalidate(self, *tags: QueryCacheTag) -> None:
+        try:
+            await self._store.bump(tags)
+        except DataMapperError:
+            log.warning(
+                "Query cache: invalidation failed, results stay stale until "
+                "their TTL runs out. Tags: %s.",
+                ", ".join(tags),
+                exc_info=True,
+            )
+
+
+async def get_current_subject_role() -> str:
+    """
+    :raises AuthenticationError:
+    :raises DataMapperError:
+    :raises AuthorizationError:
+    """
+    current_user_service = await current_request_container().get(CurrentUserService)
+    current_user = await current_user_service.get_current_user()
+    return current_user.role.value
+
+
+class QueryCacheMiddleware:
+    """
+    Serves results of the queries that opted in from the cache,
+    keyed by the query, the role of the subject and the versions of its tags.
+    Queries without a policy are not cached.
+
+    The subject is authenticated on hits too, so a result is only ever served
+    to an active user with the role it was computed for. A failing store
+    is bypassed rather than failing the query.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[type[Request], QueryCachePolicy],
+        store: QueryCacheStore,
+        subject_role: Callable[[], Awaitable[str]] = get_current_subject_role,
+    ):
+        self._policies = policies
+        self._store = store
+        self._subject_role = subject_role
+
+    async def __call__(
+        self,
+        request: Request,
+        handle: Callable[[Request], Awaitable[Any]],
+    ) -> Any:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        """
+        policy = self._policies.get(type(request))
+        if policy is None:
+            return await handle(request)
+
+        role = await self._subject_role()
+        try:
+            versions = await self._store.tag_versions(policy.tags)
+            key = self._key(request, policy, role, versions)
+            cached = await self._store.get(key)
+        except DataMapperError:
+            log.warning("Query cache: read failed, bypassed.", exc_info=True)
+            return await handle(request)
+
+        if cached is not None:
+            log.debug("Query cache: hit. Key: '%s'.", key)
+            return cached
+
+        response = await handle(request)
+        if response is not None:
+            try:
+                await self._store.set(key, response, policy.ttl)
+            except DataMapperError:
+                log.warning("Query cache: write failed.", exc_info=True)
+        return response
+
+    @staticmethod
+    def _key(
+        request: Request,
+        policy: QueryCachePolicy,
+        role: str,
+        versions: Sequence[int],
+    ) -> str:
+        digest = blake2b(
+            f"{role}\0{versions}\0{policy.key(request)}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        return f"{type(request).__name__}:{digest}"
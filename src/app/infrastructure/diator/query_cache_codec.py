@@ -0,0 +1,83 @@
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any, Final
+from uuid import UUID
+
+import orjson
+
+from app.application.common.query_models.user import UserQueryModel
+from app.application.features.user.queries.list import ListUsersQueryResult
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+type _Encode = Callable[[Any], dict[str, Any]]
+type _Decode = Callable[[dict[str, Any]], Any]
+
+
+def _encode_list_users(result: ListUsersQueryResult) -> dict[str, Any]:
+    return {
+        "users": [
+            {
+                "id_": str(user["id_"]),
+                "username": user["username"],
+                "role": user["role"].value,
+                "is_active": user["is_active"],
+            }
+            for user in result.users
+        ],
+        "next_cursor": result.next_cursor,
+        "total": result.total,
+    }
+
+
+def _decode_list_users(data: dict[str, Any]) -> ListUsersQueryResult:
+    return ListUsersQueryResult(
+        users=[
+            UserQueryModel(
+                id_=UUID(user["id_"]),
+                username=user["username"],
+                role=UserRole(user["role"]),
+                is_active=user["is_active"],
+            )
+            for user in data["users"]
+        ],
+        next_cursor=data["next_cursor"],
+        total=data["total"],
+    )
+
+
+# Results of the queries with a `QueryCachePolicy`, by type name.
+# Nothing else is ever decoded from the store.
+_CODECS: Final[Mapping[str, tuple[type, _Encode, _Decode]]] = MappingProxyType({
+    ListUsersQueryResult.__name__: (
+        ListUsersQueryResult,
+        _encode_list_users,
+        _decode_list_users,
+    ),
+})
+
+
+def encode_query_result(result: Any) -> bytes:
+    """
+    :raises DataMapperError:
+    """
+    result_type = type(result).__name__
+    codec = _CODECS.get(result_type)
+    if codec is None or codec[0] is not type(result):
+        raise DataMapperError(f"No query cache codec for '{result_type}'.")
+    _, encode, _ = codec
+    return orjson.dumps({"type": result_type, "result": encode(result)})
+
+
+def decode_query_result(raw: bytes) -> Any:
+    """
+    :raises DataMapperError:
+    """
+    try:
+        data = orjson.loads(raw)
+        _, _, decode = _CODECS[data["type"]]
+        return decode(data["result"])
+
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as error:
+        raise DataMapperError(DB_QUERY_FAILED) from error
@@ -0,0 +1,109 @@
+"""
+Requires the optional `redis` dependency: `pip install -e '.[redis]'`.
+Imported lazily by the IoC setup only when the Redis backend is selected.
+"""
+
+import logging
+from collections.abc import AsyncIterator, Sequence
+from datetime import timedelta
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.infrastructure.adapters.constants import DB_COMMIT_FAILED, DB_QUERY_FAILED
+from app.infrastructure.diator.query_cache import (
+    QueryCacheKeyPrefix,
+    QueryCacheRedisUrl,
+    QueryCacheStore,
+)
+from app.infrastructure.diator.query_cache_codec import (
+    decode_query_result,
+    encode_query_result,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+log = logging.getLogger(__name__)
+
+
+class RedisQueryCacheStore(QueryCacheStore):
+    """
+    Shared by every worker, along with the tag versions,
+    so an invalidation reaches all of them at once.
+    Results are stored as JSON, and only the result types registered
+    in `query_cache_codec` are ever decoded.
+    """
+
+    def __init__(self, client: Redis, key_prefix: QueryCacheKeyPrefix):
+        self._client = client
+        self._key_prefix = key_prefix
+
+    async def tag_versions(self, tags: Sequence[str]) -> list[int]:
+        """
+        :raises DataMapperError:
+        """
+        if not tags:
+            return []
+        try:
+            versions: list[bytes | None] = await self._client.mget(
+                [self._tag_key(tag) for tag in tags],
+            )
+        except RedisError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+        return [int(version) if version is not None else 0 for version in versions]
+
+    async def get(self, key: str) -> Any | None:
+        """
+        :raises DataMapperError:
+        """
+        try:
+            value: bytes | None = await self._client.get(self._entry_key(key))
+        except RedisError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+        return decode_query_result(value) if value is not None else None
+
+    async def set(self, key: str, value: Any, ttl: timedelta) -> None:
+        """
+        :raises DataMapperError:
+        """
+        encoded = encode_query_result(value)
+        try:
+            await self._client.set(
+                self._entry_key(key),
+                encoded,
+                px=int(ttl.total_seconds() * 1000),
+            )
+        except RedisError as error:
+            raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from error
+
+    async def bump(self, tags: Sequence[str]) -> None:
+        """
+        :raises DataMapperError:
+        """
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                for tag in tags:
+                    pipe.incr(self._tag_key(tag))
+                await pipe.execute()
+        except RedisError as error:
+            raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from error
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self._key_prefix}:entry:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._key_prefix}:tag:{tag}"
+
+
+async def get_redis_query_cache_store(
+    url: QueryCacheRedisUrl,
+    key_prefix: QueryCacheKeyPrefix,
+) -> AsyncIterator[QueryCacheStore]:
+    client: Redis = Redis.from_url(url, socket_connect_timeout=5)
+    log.debug("Redis query cache store created.")
+    yield RedisQueryCacheStore(client, key_prefix)
+    log.debug("Closing Redis query cache store...")
+    await client.aclose()
+    log.debug("Redis query cache store is closed.")
@@ -0,0 +1,111 @@
+from contextvars import ContextVar
+from typing import Any
+
+from diator.events import EventEmitter
+from diator.mediator import Mediator
+from diator.middlewares import MiddlewareChain
+from diator.requests import Request
+from dishka import AsyncContainer
+
+from app.infrastructure.diator.dispatch import HandlerDispatchTable
+
+_request_container: ContextVar[AsyncContainer] = ContextVar(
+    "mediator_request_container",
+)
+
+
+def current_request_container() -> AsyncContainer:
+    """
+    The container of the request being sent, as bound by `AppMediator`
+    for its middlewares, handler and events.
+
+    :raises RuntimeError:
+    """
+    try:
+        return _request_container.get()
+    except LookupError:
+        raise RuntimeError(
+            "Called outside of a mediator request; "
+            "send requests through `RequestMediator`.",
+        ) from None
+
+
+class RequestScopedContainer:
+    """
+    diator container for the event emitter of a mediator built once per app.
+    Resolves event handlers from the request scope the events are emitted in.
+    """
+
+    @property
+    def external_container(self) -> AsyncContainer:
+        """
+        :raises RuntimeError:
+        """
+        return current_request_container()
+
+    def attach_external_container(self, container: AsyncContainer) -> None:
+        raise TypeError(
+            f"{type(self).__name__} resolves from the current request scope; "
+            f"{container!r} cannot be attached.",
+        )
+
+    async def resolve[T](self, type_: type[T]) -> T:
+        return await self.external_container.get(type_)
+
+
+class AppMediator:
+    """
+    Built once per app. Looks the handler up in the dispatch table
+    and gets it from the request's container, with no diator request map
+    or container adapter in between.
+    """
+
+    def __init__(
+        self,
+        dispatch_table: HandlerDispatchTable,
+        middleware_chain: MiddlewareChain,
+        event_emitter: EventEmitter,
+    ):
+        self._dispatch_table = dispatch_table
+        self._middleware_chain = middleware_chain
+        self._event_emitter = event_emitter
+
+    async def send(self, request: Request, container: AsyncContainer) -> Any:
+        """
+        :raises HandlerNotBoundError:
+        """
+        handler = await container.get(
+            self._dispatch_table.handler_for(type(request)),
+        )
+        token = _request_container.set(container)
+        try:
+            response = await self._middleware_chain.wrap(handler.handle)(request)
+            events = handler.events
+            if events:
+                for event in events:
+                    await self._event_emitter.emit(event)
+        finally:
+            _request_container.reset(token)
+        return response
+
+
+class RequestMediator(Mediator):
+    """
+    The app's mediator, bound to one request's container.
+    Costs one small object per request: the dispatch table, middleware chain
+    and event emitter behind it are built once per app.
+    """
+
+    def __init__(
+        self,
+        mediator: AppMediator,
+        container: AsyncContainer,
+    ):
+        self._mediator = mediator
+        self._container = container
+
+    async def send(self, request: Request) -> Any:
+        """
+        :raises HandlerNotBoundError:
+        """
+        return await self._mediator.send(request, self._container)
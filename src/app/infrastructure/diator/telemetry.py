@@ -0,0 +1,134 @@
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from time import perf_counter, time_ns
+from typing import Any, Final
+
+from diator.requests import Request
+
+from app.infrastructure.diator.tracing import (
+    Span,
+    SpanAttributeValue,
+    SpanExporter,
+    SpanStatusCode,
+    current_span,
+    new_span_context,
+)
+from app.infrastructure.latency_histogram import LatencyHistogram
+
+REQUEST_LATENCY_BUCKETS_S: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass(slots=True)
+class RequestTypeMetrics:
+    in_flight: int = 0
+    errors: int = 0
+    latency: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram(REQUEST_LATENCY_BUCKETS_S),
+    )
+
+
+class MediatorMetrics:
+    """Per request type, since the app started."""
+
+    def __init__(self) -> None:
+        self._by_type: dict[type[Request], RequestTypeMetrics] = {}
+
+    def of(self, request_type: type[Request]) -> RequestTypeMetrics:
+        metrics = self._by_type.get(request_type)
+        if metrics is None:
+            metrics = self._by_type[request_type] = RequestTypeMetrics()
+        return metrics
+
+    def by_name(self) -> dict[str, RequestTypeMetrics]:
+        return {
+            request_type.__name__: metrics
+            for request_type, metrics in self._by_type.items()
+        }
+
+
+class MediatorTelemetryMiddleware:
+    """
+    Times each mediator request, and counts its errors and requests in flight,
+    by request type. With an exporter, also records a span per request,
+    nested under the span of the request that sent it, if any.
+
+    Added to the chain only when enabled, so it costs nothing otherwise.
+    """
+
+    def __init__(
+        self,
+        metrics: MediatorMetrics,
+        span_exporter: SpanExporter | None,
+    ):
+        self._metrics = metrics
+        self._span_exporter = span_exporter
+
+    async def __call__(
+        self,
+        request: Request,
+        handle: Callable[[Request], Awaitable[Any]],
+    ) -> Any:
+        metrics = self._metrics.of(type(request))
+        metrics.in_flight += 1
+        started_at = perf_counter()
+        try:
+            if self._span_exporter is None:
+                return await handle(request)
+            return await self._traced(request, handle, self._span_exporter)
+        except Exception:
+            metrics.errors += 1
+            raise
+        finally:
+            metrics.in_flight -= 1
+            metrics.latency.observe(perf_counter() - started_at)
+
+    @staticmethod
+    async def _traced(
+        request: Request,
+        handle: Callable[[Request], Awaitable[Any]],
+        span_exporter: SpanExporter,
+    ) -> Any:
+        parent = current_span.get()
+        context = new_span_context(parent)
+        token = current_span.set(context)
+        attributes: dict[str, SpanAttributeValue] = {
+            "mediator.request.type": type(request).__name__,
+        }
+        status_code = SpanStatusCode.OK
+        status_message = None
+        started_ns = time_ns()
+        try:
+            return await handle(request)
+        except Exception as err:
+            status_code = SpanStatusCode.ERROR
+            status_message = str(err)
+            attributes["exception.type"] = type(err).__name__
+            raise
+        finally:
+            current_span.reset(token)
+            span_exporter.export(
+                (
+                    Span(
+                        name=type(request).__name__,
+                        context=context,
+                        parent_span_id=parent.span_id if parent else None,
+                        start_time_unix_nano=started_ns,
+                        end_time_unix_nano=time_ns(),
+                        status_code=status_code,
+                        status_message=status_message,
+                        attributes=attributes,
+                    ),
+                ),
+            )
@@ -0,0 +1,98 @@
+import logging
+import os
+from abc import abstractmethod
+from collections.abc import Mapping, Sequence
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from typing import Protocol
+
+log = logging.getLogger(__name__)
+
+type SpanAttributeValue = str | int | float | bool
+
+
+class SpanStatusCode(StrEnum):
+    UNSET = "UNSET"
+    OK = "OK"
+    ERROR = "ERROR"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Span:
+    """Named and shaped after OpenTelemetry spans, so exporters can map it 1:1."""
+
+    name: str
+    context: SpanContext
+    parent_span_id: str | None
+    start_time_unix_nano: int
+    end_time_unix_nano: int
+    status_code: SpanStatusCode
+    status_message: str | None
+    attributes: Mapping[str, SpanAttributeValue]
+
+
+class SpanExporter(Protocol):
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Called on the event loop; must not block it."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps every span; for tests."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self.spans.extend(spans)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class LoggingSpanExporter(SpanExporter):
+    """One log record per span, with the span in its `extra` fields."""
+
+    def export(self, spans: Sequence[Span]) -> None:
+        for span in spans:
+            log.info(
+                "Span %s: %.1f ms, %s.",
+                span.name,
+                (span.end_time_unix_nano - span.start_time_unix_nano) / 1e6,
+                span.status_code,
+                extra={"span": asdict(span)},
+            )
+
+
+class SpanExporterKind(StrEnum):
+    OFF = "off"
+    LOG = "log"
+
+
+def create_span_exporter(kind: SpanExporterKind) -> SpanExporter | None:
+    match kind:
+        case SpanExporterKind.OFF:
+            return None
+        case SpanExporterKind.LOG:
+            return LoggingSpanExporter()
+
+
+current_span: ContextVar[SpanContext | None] = ContextVar(
+    "current_span",
+    default=None,
+)
+
+
+def new_span_context(parent: SpanContext | None) -> SpanContext:
+    """Children share the trace of their parent; roots start a new one."""
+    return SpanContext(
+        trace_id=parent.trace_id if parent is not None else os.urandom(16).hex(),
+        span_id=os.urandom(8).hex(),
+    )
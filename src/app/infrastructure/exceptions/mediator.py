@@ -0,0 +1,9 @@
+from app.infrastructure.exceptions.base import InfrastructureError
+
+
+class HandlerNotBoundError(InfrastructureError):
+    pass
+
+
+class HandlerNotProvidedError(InfrastructureError):
+    pass
@@ -0,0 +1,34 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    bounds_s: tuple[float, ...]
+    # One count per bound, plus one for values above the last bound.
+    counts: list[int] = field(init=False)
+    total_s: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.bounds_s) + 1)
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, value_s: float) -> None:
+        self.counts[bisect_left(self.bounds_s, value_s)] += 1
+        self.total_s += value_s
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Values at or below each bound, the last bound being infinity."""
+        result: list[tuple[float, int]] = []
+        running = 0
+        for bound_s, count in zip(
+            (*self.bounds_s, float("inf")),
+            self.counts,
+            strict=True,
+        ):
+            running += count
+            result.append((bound_s, running))
+        return result
@@ -0,0 +1,45 @@
+"""auth session revocations
+
+Revision ID: 3b9f1c2d7a41
+Revises: e325187c1eeb
+Create Date: 2025-07-02 10:15:42.117305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9f1c2d7a41"
+down_revision: Union[str, None] = "e325187c1eeb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "auth_session_revocations",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "key", "kind", name=op.f("pk_auth_session_revocations")
+        ),
+    )
+    op.create_index(
+        "ix_auth_session_revocations_revoked_at",
+        "auth_session_revocations",
+        ["revoked_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_auth_session_revocations_revoked_at",
+        table_name="auth_session_revocations",
+    )
+    op.drop_table("auth_session_revocations")
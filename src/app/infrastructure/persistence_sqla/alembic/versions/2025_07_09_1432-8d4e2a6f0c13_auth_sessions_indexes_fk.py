@@ -0,0 +1,80 @@
+"""auth_sessions indexes, fk to users
+
+Revision ID: 8d4e2a6f0c13
+Revises: 3b9f1c2d7a41
+Create Date: 2025-07-09 14:32:07.561204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4e2a6f0c13"
+down_revision: Union[str, None] = "3b9f1c2d7a41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently: a plain CREATE INDEX blocks writes to auth_sessions,
+    # i.e. every log in and session extension, for the whole build.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_auth_sessions_user_id"),
+            "auth_sessions",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f("ix_auth_sessions_expiration"),
+            "auth_sessions",
+            ["expiration"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+    # Sessions of already deleted users would fail validation.
+    op.execute(
+        "DELETE FROM auth_sessions AS s "
+        "WHERE NOT EXISTS (SELECT 1 FROM users AS u WHERE u.id = s.user_id)"
+    )
+    # NOT VALID, then VALIDATE in its own transaction:
+    # existing rows are checked without blocking writes.
+    op.create_foreign_key(
+        op.f("fk_auth_sessions_user_id_users"),
+        "auth_sessions",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+        postgresql_not_valid=True,
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TABLE auth_sessions "
+            "VALIDATE CONSTRAINT fk_auth_sessions_user_id_users"
+        )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        op.f("fk_auth_sessions_user_id_users"),
+        "auth_sessions",
+        type_="foreignkey",
+    )
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_auth_sessions_expiration"),
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_auth_sessions_user_id"),
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+        )
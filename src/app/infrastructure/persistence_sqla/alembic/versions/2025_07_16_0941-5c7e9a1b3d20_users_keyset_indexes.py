@@ -0,0 +1,52 @@
+"""users keyset pagination indexes
+
+Revision ID: 5c7e9a1b3d20
+Revises: 8d4e2a6f0c13
+Create Date: 2025-07-16 09:41:52.318470
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c7e9a1b3d20"
+down_revision: Union[str, None] = "8d4e2a6f0c13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently, so sign ups are not blocked for the whole build.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_role_id",
+            "users",
+            ["role", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_users_is_active_id",
+            "users",
+            ["is_active", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_is_active_id",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_users_role_id",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
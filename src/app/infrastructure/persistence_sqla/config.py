@@ -10,3 +10,8 @@ class SqlaEngineConfig:
     echo_pool: bool
     pool_size: int
     max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+    statement_timeout_ms: int
+    share_connection: bool
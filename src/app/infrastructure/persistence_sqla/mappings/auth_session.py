@@ -1,4 +1,4 @@
-from sqlalchemy import UUID, Column, DateTime, String, Table
+from sqlalchemy import UUID, Column, DateTime, ForeignKey, Index, String, Table
 from sqlalchemy.orm import composite
 
 from app.domain.value_objects.entity_id import EntityId
@@ -9,8 +9,24 @@ auth_sessions_table = Table(
     "auth_sessions",
     mapping_registry.metadata,
     Column("id", String, primary_key=True),
-    Column("user_id", UUID(as_uuid=True), nullable=False),
-    Column("expiration", DateTime(timezone=True), nullable=False),
+    Column(
+        "user_id",
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    ),
+    Column("expiration", DateTime(timezone=True), nullable=False, index=True),
+)
+
+auth_session_revocations_table = Table(
+    "auth_session_revocations",
+    mapping_registry.metadata,
+    Column("key", String, primary_key=True),
+    Column("kind", String(16), primary_key=True),
+    Column("revoked_at", DateTime(timezone=True), nullable=False),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+    Index("ix_auth_session_revocations_revoked_at", "revoked_at"),
 )
 
 
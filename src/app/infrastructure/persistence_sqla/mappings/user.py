@@ -1,4 +1,4 @@
-from sqlalchemy import UUID, Boolean, Column, Enum, LargeBinary, String, Table
+from sqlalchemy import UUID, Boolean, Column, Enum, Index, LargeBinary, String, Table
 from sqlalchemy.orm import composite
 
 from app.domain.entities.user import User
@@ -22,6 +22,9 @@ users_table = Table(
         nullable=False,
     ),
     Column("is_active", Boolean, default=True, nullable=False),
+    # Keyset pagination on non-unique sorting fields.
+    Index("ix_users_role_id", "role", "id"),
+    Index("ix_users_is_active_id", "is_active", "id"),
 )
 
 
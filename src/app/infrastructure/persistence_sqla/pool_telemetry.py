@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Final
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+from sqlalchemy.pool.base import PoolProxiedConnection
+
+from app.infrastructure.latency_histogram import LatencyHistogram
+from app.infrastructure.persistence_sqla.replica import ReplicaAsyncEngine
+
+CHECKOUT_WAIT_BUCKETS_S: Final[tuple[float, ...]] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass(slots=True)
+class PoolTelemetry:
+    """Counters since the engine was created; they survive `dispose()`."""
+
+    checkouts: int = 0
+    checkout_timeouts: int = 0
+    peak_checked_out: int = 0
+    pre_ping_failures: int = 0
+    invalidations: int = 0
+    checkout_wait: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram(CHECKOUT_WAIT_BUCKETS_S),
+    )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PoolSnapshot:
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    telemetry: PoolTelemetry
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    Times each checkout: waiting for a free connection, connecting if none
+    is idle and the pool may grow, and the pre-ping.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        telemetry: PoolTelemetry | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.telemetry = telemetry or PoolTelemetry()
+        # A recreated pool inherits the listeners of the pool it replaces.
+        if "_dispatch" not in kwargs:
+            event.listen(self, "invalidate", self._on_invalidate)
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.telemetry.checkout_timeouts += 1
+            raise
+
+        telemetry = self.telemetry
+        telemetry.checkout_wait.observe(perf_counter() - started_at)
+        telemetry.checkouts += 1
+        telemetry.peak_checked_out = max(
+            telemetry.peak_checked_out,
+            self.checkedout(),
+        )
+        return connection
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.telemetry = self.telemetry
+        return pool
+
+    def snapshot(self) -> PoolSnapshot:
+        return PoolSnapshot(
+            size=self.size(),
+            checked_out=self.checkedout(),
+            idle=self.checkedin(),
+            # Negative while the pool has not opened `pool_size` connections yet.
+            overflow=max(self.overflow(), 0),
+            telemetry=self.telemetry,
+        )
+
+    def _on_invalidate(
+        self,
+        dbapi_connection: DBAPIConnection,  # noqa: ARG002
+        connection_record: ConnectionPoolEntry,  # noqa: ARG002
+        exception: BaseException | None,
+    ) -> None:
+        self.telemetry.invalidations += 1
+        if isinstance(exception, exc.InvalidatePoolError):
+            self.telemetry.pre_ping_failures += 1
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    pass
+
+
+class SqlaPoolMetrics:
+    def __init__(self, engine: AsyncEngine, replica_engine: ReplicaAsyncEngine):
+        self._engines = {"primary": engine}
+        if replica_engine is not engine:
+            self._engines["replica"] = replica_engine
+
+    def snapshots(self) -> dict[str, PoolSnapshot]:
+        """Engines whose pool is not instrumented are left out."""
+        return {
+            name: pool.snapshot()
+            for name, engine in self._engines.items()
+            if isinstance(pool := engine.sync_engine.pool, InstrumentedQueuePool)
+        }
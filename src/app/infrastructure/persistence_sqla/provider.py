@@ -1,6 +1,6 @@
 import logging
 from collections.abc import AsyncIterator
-from typing import cast
+from typing import Any, NewType, cast
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -11,33 +11,89 @@ from sqlalchemy.ext.asyncio import (
 
 from app.infrastructure.adapters.types import (
     MainAsyncSession,
+    QueryAsyncSession,
 )
 from app.infrastructure.auth.adapters.types import AuthAsyncSession
 from app.infrastructure.persistence_sqla.config import PostgresDsn, SqlaEngineConfig
+from app.infrastructure.persistence_sqla.pool_telemetry import (
+    InstrumentedAsyncAdaptedQueuePool,
+)
+from app.infrastructure.persistence_sqla.replica import (
+    READ_ROUTING_INFO_KEY,
+    ReplicaAsyncEngine,
+    ReplicaRoutingConfig,
+    ReplicaRoutingSession,
+    RequestReadRouting,
+)
+from app.infrastructure.persistence_sqla.shared_connection import (
+    SharedRequestConnection,
+)
+from app.infrastructure.persistence_sqla.statement_counter import track_statements
 
 log = logging.getLogger(__name__)
 
+RequestAsyncSessionFactory = NewType(
+    "RequestAsyncSessionFactory",
+    async_sessionmaker[AsyncSession],
+)
 
-async def get_async_engine(
-    dsn: PostgresDsn,
+
+def create_pooled_async_engine(
+    dsn: str,
     engine_config: SqlaEngineConfig,
-) -> AsyncIterator[AsyncEngine]:
+) -> AsyncEngine:
+    connect_args: dict[str, Any] = {"connect_timeout": 5}
+    if engine_config.statement_timeout_ms:
+        connect_args["options"] = (
+            f"-c statement_timeout={engine_config.statement_timeout_ms}"
+        )
+
     async_engine = create_async_engine(
         url=dsn,
         echo=engine_config.echo,
         echo_pool=engine_config.echo_pool,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
         pool_size=engine_config.pool_size,
         max_overflow=engine_config.max_overflow,
-        connect_args={"connect_timeout": 5},
-        pool_pre_ping=True,
+        pool_timeout=engine_config.pool_timeout,
+        pool_recycle=engine_config.pool_recycle,
+        pool_pre_ping=engine_config.pool_pre_ping,
+        connect_args=connect_args,
     )
+    track_statements(async_engine.sync_engine)
+    return async_engine
+
+
+async def get_async_engine(
+    dsn: PostgresDsn,
+    engine_config: SqlaEngineConfig,
+) -> AsyncIterator[AsyncEngine]:
+    async_engine = create_pooled_async_engine(dsn, engine_config)
     log.debug("Async engine created with DSN: %s", dsn)
     yield async_engine
-    log.debug("Disposing async engine...")
+    log.debug("Disposing async engine... Pool: %s.", async_engine.pool.status())
     await async_engine.dispose()
     log.debug("Engine is disposed.")
 
 
+async def get_replica_async_engine(
+    engine: AsyncEngine,
+    engine_config: SqlaEngineConfig,
+    routing_config: ReplicaRoutingConfig,
+) -> AsyncIterator[ReplicaAsyncEngine]:
+    """Without a replica configured, it is the primary engine."""
+    if routing_config.dsn is None:
+        yield ReplicaAsyncEngine(engine)
+        return
+
+    replica_engine = create_pooled_async_engine(routing_config.dsn, engine_config)
+    log.debug("Replica async engine created.")
+    yield ReplicaAsyncEngine(replica_engine)
+    log.debug("Disposing replica async engine...")
+    await replica_engine.dispose()
+    log.debug("Replica engine is disposed.")
+
+
 def get_async_session_factory(
     engine: AsyncEngine,
 ) -> async_sessionmaker[AsyncSession]:
@@ -51,12 +107,52 @@ def get_async_session_factory(
     return async_session_factory
 
 
-async def get_main_async_session(
+async def get_request_session_factory(
+    engine: AsyncEngine,
+    engine_config: SqlaEngineConfig,
     async_session_factory: async_sessionmaker[AsyncSession],
+    shared_connection: SharedRequestConnection,
+) -> AsyncIterator[RequestAsyncSessionFactory]:
+    """
+    With `share_connection`, sessions of a request are bound to one connection,
+    so a request holds at most one pooled connection instead of one per session.
+    Each session runs in SAVEPOINTs, so its commits and rollbacks stay its own;
+    the enclosing transaction is committed by `ASGISharedConnectionMiddleware`
+    once the response is complete, or rolled back for an error response,
+    and committed again for any later statements as the request scope closes.
+
+    Trade-off: commits become durable, and row locks are released, only then.
+    Sessions of a request must not run statements concurrently.
+    """
+    if not engine_config.share_connection:
+        yield RequestAsyncSessionFactory(async_session_factory)
+        return
+
+    log.debug("Connecting shared request connection...")
+    async with engine.connect() as connection:
+        await connection.begin()
+        shared_connection.attach(connection)
+        yield RequestAsyncSessionFactory(
+            async_sessionmaker(
+                bind=connection,
+                class_=AsyncSession,
+                autoflush=False,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            ),
+        )
+        await shared_connection.commit()
+    log.debug("Shared request connection released.")
+
+
+async def get_main_async_session(
+    async_session_factory: RequestAsyncSessionFactory,
+    shared_connection: SharedRequestConnection,
 ) -> AsyncIterator[MainAsyncSession]:
     """Provides UoW (AsyncSession) for the main context."""
     log.debug("Starting Main async session...")
     async with async_session_factory() as session:
+        shared_connection.track(session)
         log.debug("Main async session started.")
         yield cast(MainAsyncSession, session)
         log.debug("Closing Main async session.")
@@ -64,12 +160,44 @@ async def get_main_async_session(
 
 
 async def get_auth_async_session(
-    async_session_factory: async_sessionmaker[AsyncSession],
+    async_session_factory: RequestAsyncSessionFactory,
+    shared_connection: SharedRequestConnection,
 ) -> AsyncIterator[AuthAsyncSession]:
     """Provides UoW (AsyncSession) for the auth context."""
     log.debug("Starting Auth async session...")
     async with async_session_factory() as session:
+        shared_connection.track(session)
         log.debug("Auth async session started.")
         yield cast(AuthAsyncSession, session)
         log.debug("Closing Auth async session.")
     log.debug("Auth async session closed.")
+
+
+async def get_query_async_session(
+    main_session: MainAsyncSession,
+    engine: AsyncEngine,
+    replica_engine: ReplicaAsyncEngine,
+    routing_config: ReplicaRoutingConfig,
+    read_routing: RequestReadRouting,
+) -> AsyncIterator[QueryAsyncSession]:
+    """
+    Provides the session for query-side gateways, routed to the replica
+    if one is configured. Otherwise, it is the main session.
+    """
+    if not routing_config.is_enabled:
+        yield cast(QueryAsyncSession, main_session)
+        return
+
+    log.debug("Starting Query async session...")
+    async with AsyncSession(
+        sync_session_class=ReplicaRoutingSession,
+        primary=engine.sync_engine,
+        replica=replica_engine.sync_engine,
+        autoflush=False,
+        expire_on_commit=False,
+        info={READ_ROUTING_INFO_KEY: read_routing},
+    ) as session:
+        log.debug("Query async session started.")
+        yield cast(QueryAsyncSession, session)
+        log.debug("Closing Query async session.")
+    log.debug("Query async session closed.")
@@ -0,0 +1,180 @@
+from abc import abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from time import monotonic
+from typing import Any, NewType, Protocol
+
+from sqlalchemy import Engine
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.domain.value_objects.entity_id import EntityId
+
+ReplicaAsyncEngine = NewType("ReplicaAsyncEngine", AsyncEngine)
+
+READ_ROUTING_INFO_KEY = "read_routing"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReplicaRoutingConfig:
+    dsn: str | None
+    max_lag: timedelta
+    lag_check_interval: timedelta
+    read_your_writes_window: timedelta
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.dsn is not None
+
+
+class ReplicaRouter:
+    """
+    Process-wide view of the replica: its last measured lag,
+    and which users committed recently enough that it may not show their writes.
+    Until lag is measured, or once a measurement fails, reads go to the primary.
+
+    Recent writes are remembered by this worker only; other workers learn of them
+    from the window's end, which the client carries to its next requests.
+    """
+
+    def __init__(self, config: ReplicaRoutingConfig):
+        self._is_enabled = config.is_enabled
+        self._max_lag_s = config.max_lag.total_seconds()
+        self._window = config.read_your_writes_window
+        self._window_s = self._window.total_seconds()
+        self._lag_s: float | None = None
+        self._recent_writes: OrderedDict[EntityId, float] = OrderedDict()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._is_enabled
+
+    @property
+    def lag_s(self) -> float | None:
+        return self._lag_s
+
+    def report_lag(self, lag_s: float | None) -> None:
+        self._lag_s = lag_s
+
+    def record_write(self, user_id: EntityId) -> None:
+        now = monotonic()
+        self._recent_writes.pop(user_id, None)
+        self._recent_writes[user_id] = now
+        self._purge_recent_writes(now)
+
+    def window_end(self) -> datetime:
+        """End of the read-your-writes window of a write committed now."""
+        return datetime.now(UTC) + self._window
+
+    def prefers_primary(
+        self,
+        user_id: EntityId | None,
+        window_end: datetime | None = None,
+    ) -> bool:
+        if self._lag_s is None or self._lag_s > self._max_lag_s:
+            return True
+        if window_end is not None:
+            now = datetime.now(UTC)
+            # A client cannot stretch the window beyond one length.
+            if now < window_end <= now + self._window:
+                return True
+        if user_id is None:
+            return False
+        committed_at = self._recent_writes.get(user_id)
+        return committed_at is not None and monotonic() - committed_at <= self._window_s
+
+    def _purge_recent_writes(self, now: float) -> None:
+        """Pops writes out of the window from the front; costs nothing otherwise."""
+        recent_writes = self._recent_writes
+        while (
+            recent_writes and now - next(iter(recent_writes.values())) > self._window_s
+        ):
+            recent_writes.popitem(last=False)
+
+
+class ReadRoutingIdentity(Protocol):
+    """Identifies the user whose own writes the current request reads back."""
+
+    @abstractmethod
+    def get_user_id(self) -> EntityId | None:
+        """Without storage access; `None` while the request is anonymous."""
+
+
+class ReadYourWritesTransport(Protocol):
+    """
+    Carries the end of the client's read-your-writes window to its next requests,
+    so the window holds whichever worker serves them.
+    """
+
+    @abstractmethod
+    def deliver(self, window_end: datetime) -> None: ...
+
+    @abstractmethod
+    def extract(self) -> datetime | None:
+        """`None` if the client carries no window."""
+
+
+class RequestReadRouting:
+    """Routing decisions for the client of the current request."""
+
+    def __init__(
+        self,
+        router: ReplicaRouter,
+        identity: ReadRoutingIdentity,
+        transport: ReadYourWritesTransport,
+    ):
+        self._router = router
+        self._identity = identity
+        self._transport = transport
+        self._window_end = transport.extract()
+
+    def prefers_primary(self) -> bool:
+        return self._router.prefers_primary(
+            self._identity.get_user_id(),
+            self._window_end,
+        )
+
+    def record_write(self) -> None:
+        user_id = self._identity.get_user_id()
+        if user_id is not None:
+            self._router.record_write(user_id)
+        if self._router.is_enabled:
+            self._window_end = self._router.window_end()
+            self._transport.deliver(self._window_end)
+
+
+class ReplicaRoutingSession(Session):
+    """
+    Reads go to the replica, unless the request's routing prefers the primary;
+    writes always go to the primary. Decided per statement, so by the time
+    a query handler reads, the current user is known.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        primary: Engine,
+        replica: Engine,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self._primary = primary
+        self._replica = replica
+
+    def get_bind(
+        self,
+        mapper: Any = None,  # noqa: ARG002
+        clause: Any = None,
+        **kwargs: Any,  # noqa: ARG002
+    ) -> Engine | Connection:
+        routing: RequestReadRouting = self.info[READ_ROUTING_INFO_KEY]
+        if (
+            self._flushing
+            or isinstance(clause, UpdateBase)
+            or routing.prefers_primary()
+        ):
+            return self._primary
+        return self._replica
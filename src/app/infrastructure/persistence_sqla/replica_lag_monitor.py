@@ -0,0 +1,64 @@
+import asyncio
+import logging
+from typing import Final
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.infrastructure.background.worker import BackgroundWorker
+from app.infrastructure.persistence_sqla.replica import (
+    ReplicaAsyncEngine,
+    ReplicaRouter,
+    ReplicaRoutingConfig,
+)
+
+log = logging.getLogger(__name__)
+
+# Caught up when all received WAL is replayed: an idle primary is not lag.
+REPLICA_LAG_QUERY: Final[str] = (
+    "SELECT CASE "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+    "END"
+)
+
+
+class SqlaReplicaLagMonitor(BackgroundWorker):
+    """
+    Measures replica lag at a fixed interval and reports it to the router.
+    A failed measurement is reported as unknown, sending reads to the primary.
+    """
+
+    def __init__(
+        self,
+        config: ReplicaRoutingConfig,
+        engine: ReplicaAsyncEngine,
+        router: ReplicaRouter,
+    ):
+        self._is_enabled = config.is_enabled
+        self._interval_s = config.lag_check_interval.total_seconds()
+        self._engine = engine
+        self._router = router
+
+    async def run(self) -> None:
+        if not self._is_enabled:
+            return
+
+        while True:
+            self._router.report_lag(await self.measure())
+            await asyncio.sleep(self._interval_s)
+
+    async def shutdown(self) -> None:
+        log.debug("Replica lag monitor stopped. Last lag: %s s.", self._router.lag_s)
+
+    async def measure(self) -> float | None:
+        try:
+            async with self._engine.connect() as conn:
+                lag_s: float | None = await conn.scalar(text(REPLICA_LAG_QUERY))
+
+        except SQLAlchemyError as error:
+            log.warning("Replica lag check failed, reading from primary: '%s'.", error)
+            return None
+
+        # NULL on a primary, or on a replica that has not replayed anything yet.
+        return None if lag_s is None else float(lag_s)
@@ -0,0 +1,97 @@
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction, UOWTransaction
+
+from app.infrastructure.adapters.constants import (
+    DB_COMMIT_FAILED,
+    DB_QUERY_FAILED,
+    DB_ROLLBACK_FAILED,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+log = logging.getLogger(__name__)
+
+
+class SharedRequestConnection:
+    """
+    The connection sessions of a request share with `share_connection` on.
+    Its enclosing transaction must be committed ahead of the response,
+    so a failing commit still reaches the client.
+
+    Only work the sessions committed themselves is committed with it:
+    SAVEPOINTs of sessions holding flushed but uncommitted changes
+    are rolled back first. As SAVEPOINTs of one connection nest,
+    this also discards those opened after, inside them.
+    """
+
+    def __init__(self) -> None:
+        self._connection: AsyncConnection | None = None
+        self._sessions: list[AsyncSession] = []
+        self._uncommitted: set[Session] = set()
+
+    def attach(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    def track(self, session: AsyncSession) -> None:
+        if self._connection is None:
+            return
+        self._sessions.append(session)
+        event.listen(session.sync_session, "after_flush", self._on_flush)
+        event.listen(
+            session.sync_session,
+            "after_transaction_end",
+            self._on_transaction_end,
+        )
+
+    async def commit(self) -> None:
+        """
+        Does nothing if no connection is attached or nothing is pending.
+
+        :raises DataMapperError:
+        """
+        if self._connection is None or not self._connection.in_transaction():
+            return
+
+        try:
+            await self._roll_back_uncommitted()
+            await self._connection.commit()
+            log.debug("Shared request connection committed.")
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from error
+
+    async def rollback(self) -> None:
+        """
+        Does nothing if no connection is attached or nothing is pending.
+
+        :raises DataMapperError:
+        """
+        if self._connection is None or not self._connection.in_transaction():
+            return
+
+        try:
+            await self._connection.rollback()
+            log.debug("Shared request connection rolled back.")
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(f"{DB_QUERY_FAILED} {DB_ROLLBACK_FAILED}") from error
+
+    async def _roll_back_uncommitted(self) -> None:
+        for session in self._sessions:
+            if session.sync_session in self._uncommitted:
+                log.warning("Rolling back changes a session flushed, not committed.")
+                await session.rollback()
+
+    def _on_flush(self, session: Session, _: UOWTransaction) -> None:
+        self._uncommitted.add(session)
+
+    def _on_transaction_end(
+        self,
+        session: Session,
+        transaction: SessionTransaction,
+    ) -> None:
+        if transaction.parent is None:
+            self._uncommitted.discard(session)
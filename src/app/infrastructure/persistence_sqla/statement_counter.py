@@ -0,0 +1,100 @@
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Final
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+_STARTED_AT_KEY: Final[str] = "statement_started_at"
+
+_WHITESPACE = re.compile(r"\s+")
+# Expanded `IN` lists differ in length between calls of the same query.
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:%\(\w+\)s|%s|\$\d+|\?)\s*,?)+\)")
+
+
+@dataclass(slots=True)
+class StatementStats:
+    statements: int = 0
+    duration_s: float = 0.0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Statements issued at least `threshold` times, likely one per row (N+1)."""
+        return {
+            fingerprint: times
+            for fingerprint, times in self.fingerprints.items()
+            if times >= threshold
+        }
+
+
+_current_stats: ContextVar[tuple[StatementStats, ...]] = ContextVar(
+    "current_statement_stats",
+    default=(),
+)
+
+
+def track_statements(engine: Engine) -> None:
+    """
+    Records statements sent to the database within `count_statements()`.
+    Outside of it, costs a context variable lookup per statement.
+    """
+    event.listen(engine, "before_cursor_execute", _on_before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _on_after_cursor_execute)
+
+
+@contextmanager
+def count_statements() -> Iterator[StatementStats]:
+    """Nested scopes record into each enclosing one as well."""
+    stats = StatementStats()
+    token = _current_stats.set((*_current_stats.get(), stats))
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def fingerprint_statement(statement: str) -> str:
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("(...)", normalized)
+
+
+def _on_before_cursor_execute(
+    conn: Connection,  # noqa: ARG001
+    cursor: Any,  # noqa: ARG001
+    statement: str,
+    parameters: Any,  # noqa: ARG001
+    context: Any,
+    executemany: bool,  # noqa: ARG001
+) -> None:
+    scopes = _current_stats.get()
+    if not scopes:
+        return
+
+    fingerprint = fingerprint_statement(statement)
+    for stats in scopes:
+        stats.statements += 1
+        stats.fingerprints[fingerprint] += 1
+    if context is not None:
+        setattr(context, _STARTED_AT_KEY, perf_counter())
+
+
+def _on_after_cursor_execute(
+    conn: Connection,  # noqa: ARG001
+    cursor: Any,  # noqa: ARG001
+    statement: str,  # noqa: ARG001
+    parameters: Any,  # noqa: ARG001
+    context: Any,
+    executemany: bool,  # noqa: ARG001
+) -> None:
+    started_at: float | None = getattr(context, _STARTED_AT_KEY, None)
+    if started_at is None:
+        return
+
+    duration_s = perf_counter() - started_at
+    for stats in _current_stats.get():
+        stats.duration_s += duration_s
@@ -1,13 +1,18 @@
 import logging
-from typing import Any, Literal, NewType, TypedDict, cast
+from datetime import UTC, datetime
+from typing import Any, Literal, NewType, NotRequired, TypedDict, cast
+from uuid import UUID
 
 import jwt
 
-from app.infrastructure.auth.session.model import AuthSession
+from app.domain.value_objects.entity_id import EntityId
+from app.infrastructure.auth.session.model import AuthSession, SignedAuthSession
+from app.infrastructure.auth.session.revocation_list import AuthSessionStateless
 from app.presentation.http.auth.constants import (
     ACCESS_TOKEN_INVALID_OR_EXPIRED,
     ACCESS_TOKEN_PAYLOAD_MISSING,
     ACCESS_TOKEN_PAYLOAD_OF_INTEREST,
+    ACCESS_TOKEN_STATELESS_CLAIMS,
 )
 
 log = logging.getLogger(__name__)
@@ -19,18 +24,31 @@ JwtAlgorithm = Literal["HS256", "HS384", "HS512", "RS256", "RS384", "RS512"]
 class JwtPayload(TypedDict):
     auth_session_id: str
     exp: int
+    # Stateless mode only
+    user_id: NotRequired[str]
+    iat: NotRequired[int]
 
 
 class JwtAccessTokenProcessor:
-    def __init__(self, secret: JwtSecret, algorithm: JwtAlgorithm):
+    def __init__(
+        self,
+        secret: JwtSecret,
+        algorithm: JwtAlgorithm,
+        stateless: AuthSessionStateless,
+    ):
         self._secret = secret
         self._algorithm = algorithm
+        self._stateless = stateless
 
     def encode(self, auth_session: AuthSession) -> str:
         payload = JwtPayload(
             auth_session_id=auth_session.id_,
             exp=int(auth_session.expiration.timestamp()),
         )
+        if self._stateless:
+            payload["user_id"] = str(auth_session.user_id.value)
+            payload["iat"] = int(datetime.now(tz=UTC).timestamp())
+
         return jwt.encode(
             cast(dict[str, Any], payload),
             key=self._secret,
@@ -38,15 +56,8 @@ class JwtAccessTokenProcessor:
         )
 
     def decode_auth_session_id(self, token: str) -> str | None:
-        try:
-            payload = jwt.decode(
-                token,
-                key=self._secret,
-                algorithms=[self._algorithm],
-            )
-
-        except jwt.PyJWTError as error:
-            log.debug("%s %s", ACCESS_TOKEN_INVALID_OR_EXPIRED, error)
+        payload = self._decode(token)
+        if payload is None:
             return None
 
         auth_session_id: str | None = payload.get(ACCESS_TOKEN_PAYLOAD_OF_INTEREST)
@@ -59,3 +70,42 @@ class JwtAccessTokenProcessor:
             return None
 
         return auth_session_id
+
+    def decode_signed_session(self, token: str) -> SignedAuthSession | None:
+        """
+        Returns `None` for tokens issued without stateless claims,
+        so they fall back to the storage lookup.
+        """
+        payload = self._decode(token)
+        if payload is None:
+            return None
+
+        try:
+            return SignedAuthSession(
+                id_=payload[ACCESS_TOKEN_PAYLOAD_OF_INTEREST],
+                user_id=EntityId(UUID(payload["user_id"])),
+                expiration=datetime.fromtimestamp(payload["exp"], tz=UTC),
+                issued_at=datetime.fromtimestamp(payload["iat"], tz=UTC),
+            )
+
+        except (KeyError, TypeError, ValueError):
+            log.debug(
+                "%s %s",
+                ACCESS_TOKEN_PAYLOAD_MISSING,
+                ACCESS_TOKEN_STATELESS_CLAIMS,
+            )
+            return None
+
+    def _decode(self, token: str) -> dict[str, Any] | None:
+        try:
+            payload: dict[str, Any] = jwt.decode(
+                token,
+                key=self._secret,
+                algorithms=[self._algorithm],
+            )
+
+        except jwt.PyJWTError as error:
+            log.debug("%s %s", ACCESS_TOKEN_INVALID_OR_EXPIRED, error)
+            return None
+
+        return payload
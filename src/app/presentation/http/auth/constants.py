@@ -10,6 +10,7 @@ ACCESS_TOKEN_MARKED_FOR_REMOVAL: Final[str] = (
 ACCESS_TOKEN_NOT_FOUND_IN_COOKIE: Final[str] = "No access token found in cookie."
 ACCESS_TOKEN_PAYLOAD_OF_INTEREST: Final[str] = "auth_session_id"
 ACCESS_TOKEN_PAYLOAD_MISSING: Final[str] = "JWT payload missing."
+ACCESS_TOKEN_STATELESS_CLAIMS: Final[str] = "'user_id', 'iat'"
 
 COOKIE_ACCESS_TOKEN_NAME: Final[str] = "access_token"
 
@@ -5,14 +5,14 @@ from app.presentation.http.controllers.general.router import create_general_rout
 from app.presentation.http.controllers.users.router import create_users_router
 
 
-def create_api_v1_router() -> APIRouter:
+def create_api_v1_router(*, expose_metrics: bool = False) -> APIRouter:
     router = APIRouter(
         prefix="/api/v1",
     )
 
     sub_routers = (
         create_account_router(),
-        create_general_router(),
+        create_general_router(expose_metrics=expose_metrics),
         create_users_router(),
     )
 
@@ -0,0 +1,297 @@
+from collections.abc import Mapping
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter
+from starlette.responses import PlainTextResponse
+
+from app.infrastructure.adapters.password_hasher_pooled import (
+    PasswordHasherPool,
+    PasswordHasherPoolStats,
+)
+from app.infrastructure.auth.adapters.store_stats import AuthSessionStoreStats
+from app.infrastructure.diator.telemetry import MediatorMetrics, RequestTypeMetrics
+from app.infrastructure.latency_histogram import LatencyHistogram
+from app.infrastructure.persistence_sqla.pool_telemetry import (
+    PoolSnapshot,
+    SqlaPoolMetrics,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render_pool_metrics(snapshots: Mapping[str, PoolSnapshot]) -> str:
+    """Prometheus text exposition format, one `pool` label per engine."""
+    gauges = {
+        "sqla_pool_size": ("Connections the pool keeps open.", "size"),
+        "sqla_pool_checked_out": ("Connections in use.", "checked_out"),
+        "sqla_pool_idle": ("Connections open and idle in the pool.", "idle"),
+        "sqla_pool_overflow": ("Connections open beyond the pool size.", "overflow"),
+    }
+    counters = {
+        "sqla_pool_checkouts_total": ("Checkouts that succeeded.", "checkouts"),
+        "sqla_pool_checkout_timeouts_total": (
+            "Checkouts that timed out waiting for a connection.",
+            "checkout_timeouts",
+        ),
+        "sqla_pool_pre_ping_failures_total": (
+            "Connections found dead by the pre-ping.",
+            "pre_ping_failures",
+        ),
+        "sqla_pool_invalidations_total": (
+            "Connections invalidated, including by the pre-ping.",
+            "invalidations",
+        ),
+    }
+
+    lines: list[str] = []
+    for name, (help_text, attr) in gauges.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        lines += [
+            f'{name}{{pool="{pool}"}} {getattr(snapshot, attr)}'
+            for pool, snapshot in snapshots.items()
+        ]
+    lines += [
+        "# HELP sqla_pool_peak_checked_out Most connections in use at once.",
+        "# TYPE sqla_pool_peak_checked_out gauge",
+    ]
+    lines += [
+        f'sqla_pool_peak_checked_out{{pool="{pool}"}} '
+        f"{snapshot.telemetry.peak_checked_out}"
+        for pool, snapshot in snapshots.items()
+    ]
+    for name, (help_text, attr) in counters.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines += [
+            f'{name}{{pool="{pool}"}} {getattr(snapshot.telemetry, attr)}'
+            for pool, snapshot in snapshots.items()
+        ]
+
+    lines += _render_histogram(
+        "sqla_pool_checkout_seconds",
+        "Time to check out a connection, including the pre-ping.",
+        "pool",
+        {
+            pool: snapshot.telemetry.checkout_wait
+            for pool, snapshot in snapshots.items()
+        },
+    )
+    return "\n".join(lines) + "\n"
+
+
+def render_mediator_metrics(metrics: Mapping[str, RequestTypeMetrics]) -> str:
+    """Prometheus text exposition format, one `request_type` label per type."""
+    lines = [
+        "# HELP mediator_requests_in_flight Requests being handled.",
+        "# TYPE mediator_requests_in_flight gauge",
+    ]
+    lines += [
+        f'mediator_requests_in_flight{{request_type="{name}"}} {m.in_flight}'
+        for name, m in metrics.items()
+    ]
+    lines += [
+        "# HELP mediator_request_errors_total Requests whose handling raised.",
+        "# TYPE mediator_request_errors_total counter",
+    ]
+    lines += [
+        f'mediator_request_errors_total{{request_type="{name}"}} {m.errors}'
+        for name, m in metrics.items()
+    ]
+    lines += _render_histogram(
+        "mediator_request_duration_seconds",
+        "Time to handle a request, middlewares included.",
+        "request_type",
+        {name: m.latency for name, m in metrics.items()},
+    )
+    return "\n".join(lines) + "\n"
+
+
+def render_password_hasher_metrics(stats: PasswordHasherPoolStats) -> str:
+    """Prometheus text exposition format, labelled by the pool's executor."""
+    label = f'executor="{stats.executor}"'
+    lines = [
+        *_render_sample(
+            "password_hasher_waiting",
+            "gauge",
+            "Hashes waiting for a free slot.",
+            label,
+            stats.waiting,
+        ),
+        *_render_sample(
+            "password_hasher_running",
+            "gauge",
+            "Hashes running.",
+            label,
+            stats.running,
+        ),
+        *_render_sample(
+            "password_hasher_completed_total",
+            "counter",
+            "Hashes that ran.",
+            label,
+            stats.completed,
+        ),
+        *_render_sample(
+            "password_hasher_rejected_total",
+            "counter",
+            "Hashes rejected as too many were waiting.",
+            label,
+            stats.rejected,
+        ),
+    ]
+    lines += _render_histogram(
+        "password_hasher_wait_seconds",
+        "Time a hash waited for a free slot.",
+        "executor",
+        {stats.executor: stats.wait_latency},
+    )
+    lines += _render_histogram(
+        "password_hasher_run_seconds",
+        "Time a hash ran for.",
+        "executor",
+        {stats.executor: stats.run_latency},
+    )
+    return "\n".join(lines) + "\n"
+
+
+def render_auth_session_store_metrics(stats: AuthSessionStoreStats) -> str:
+    """Prometheus text exposition format; empty for stores without them."""
+    lines: list[str] = []
+    if stats.cache is not None:
+        cache = stats.cache
+        lines += [
+            *_render_sample(
+                "auth_session_cache_hits_total",
+                "counter",
+                "Auth sessions found in the cache.",
+                "",
+                cache.hits,
+            ),
+            *_render_sample(
+                "auth_session_cache_misses_total",
+                "counter",
+                "Auth sessions missing from the cache, or expired in it.",
+                "",
+                cache.misses,
+            ),
+            *_render_sample(
+                "auth_session_cache_size",
+                "gauge",
+                "Auth sessions in the cache.",
+                "",
+                cache.size,
+            ),
+            *_render_sample(
+                "auth_session_cache_max_size",
+                "gauge",
+                "Most auth sessions the cache keeps.",
+                "",
+                cache.max_size,
+            ),
+        ]
+    if stats.reaper is not None:
+        reaper = stats.reaper
+        lines += [
+            *_render_sample(
+                "auth_session_reaper_runs_total",
+                "counter",
+                "Reaper runs that succeeded.",
+                "",
+                reaper.runs,
+            ),
+            *_render_sample(
+                "auth_session_reaper_failed_runs_total",
+                "counter",
+                "Reaper runs that failed.",
+                "",
+                reaper.failed_runs,
+            ),
+            *_render_sample(
+                "auth_session_reaper_deleted_sessions_total",
+                "counter",
+                "Expired auth sessions deleted.",
+                "",
+                reaper.deleted_sessions,
+            ),
+            *_render_sample(
+                "auth_session_reaper_deleted_revocations_total",
+                "counter",
+                "Expired revocations deleted.",
+                "",
+                reaper.deleted_revocations,
+            ),
+            *_render_sample(
+                "auth_session_reaper_last_run_duration_seconds",
+                "gauge",
+                "Duration of the last successful run.",
+                "",
+                reaper.last_run_duration_s,
+            ),
+        ]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _render_sample(
+    name: str,
+    metric_type: str,
+    help_text: str,
+    labels: str,
+    value: float,
+) -> list[str]:
+    sample = f"{name}{{{labels}}}" if labels else name
+    return [
+        f"# HELP {name} {help_text}",
+        f"# TYPE {name} {metric_type}",
+        f"{sample} {value}",
+    ]
+
+
+def _render_histogram(
+    name: str,
+    help_text: str,
+    label: str,
+    histograms: Mapping[str, LatencyHistogram],
+) -> list[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for value, histogram in histograms.items():
+        lines += [
+            f'{name}_bucket{{{label}="{value}",le="{_format_bound(bound_s)}"}} {count}'
+            for bound_s, count in histogram.cumulative()
+        ]
+        lines += [
+            f'{name}_sum{{{label}="{value}"}} {histogram.total_s}',
+            f'{name}_count{{{label}="{value}"}} {histogram.count}',
+        ]
+    return lines
+
+
+def _format_bound(bound_s: float) -> str:
+    return "+Inf" if bound_s == float("inf") else str(bound_s)
+
+
+def create_metrics_router() -> APIRouter:
+    router = APIRouter()
+
+    @router.get("/metrics", response_class=PlainTextResponse)
+    @inject
+    async def metrics(
+        pool_metrics: FromDishka[SqlaPoolMetrics],
+        mediator_metrics: FromDishka[MediatorMetrics],
+        password_hasher_pool: FromDishka[PasswordHasherPool],
+        auth_session_store_stats: FromDishka[AuthSessionStoreStats],
+    ) -> PlainTextResponse:
+        """
+        - Open to everyone; served only with metrics enabled in settings,
+        which must keep it off the public ingress.
+        - Returns connection pool, mediator, password hasher
+        and auth session store metrics in the Prometheus text format.
+        """
+        return PlainTextResponse(
+            render_pool_metrics(pool_metrics.snapshots())
+            + render_mediator_metrics(mediator_metrics.by_name())
+            + render_password_hasher_metrics(password_hasher_pool.stats)
+            + render_auth_session_store_metrics(auth_session_store_stats),
+            media_type=PROMETHEUS_CONTENT_TYPE,
+        )
+
+    return router
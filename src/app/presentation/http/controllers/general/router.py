@@ -3,14 +3,18 @@ from fastapi import APIRouter
 from app.presentation.http.controllers.general.healthcheck import (
     create_healthcheck_router,
 )
+from app.presentation.http.controllers.general.metrics import create_metrics_router
 
 
-def create_general_router() -> APIRouter:
+def create_general_router(*, expose_metrics: bool = False) -> APIRouter:
     router = APIRouter(
         tags=["General"],
     )
 
-    sub_routers = (create_healthcheck_router(),)
+    sub_routers = [create_healthcheck_router()]
+    # Unauthenticated, so off unless enabled in settings
+    if expose_metrics:
+        sub_routers.append(create_metrics_router())
 
     for sub_router in sub_routers:
         router.include_router(sub_router)
@@ -4,7 +4,7 @@ from fastapi.responses import RedirectResponse
 from app.presentation.http.controllers.api_v1_router import create_api_v1_router
 
 
-def create_root_router() -> APIRouter:
+def create_root_router(*, expose_metrics: bool = False) -> APIRouter:
     router = APIRouter()
 
     @router.get("/", tags=["General"])
@@ -15,7 +15,7 @@ def create_root_router() -> APIRouter:
         """
         return RedirectResponse(url="docs/")
 
-    sub_routers = (create_api_v1_router(),)
+    sub_routers = (create_api_v1_router(expose_metrics=expose_metrics),)
 
     for sub_router in sub_routers:
         router.include_router(sub_router)
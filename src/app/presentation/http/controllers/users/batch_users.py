@@ -0,0 +1,127 @@
+from inspect import getdoc
+from typing import Annotated, Final, Literal
+
+from diator.mediator import Mediator
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.features.user.commands.activate import ActivateUserCommand
+from app.application.features.user.commands.batch import (
+    BatchMode,
+    BatchUserCommand,
+    BatchUserCommandItem,
+    BatchUserCommandResult,
+)
+from app.application.features.user.commands.create import CreateUserCommand
+from app.application.features.user.commands.deactivate import DeactivateUserCommand
+from app.domain.enums.user_role import UserRole
+from app.domain.exceptions.user import UsernameAlreadyExistsError
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+# Each created user costs a password hash within the request.
+MAX_BATCH_ITEMS: Final[int] = 100
+
+
+class CreateUserItemPydantic(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    op: Literal["create"]
+    username: str
+    password: str
+    role: UserRole = Field(default=UserRole.USER)
+
+
+class ActivateUserItemPydantic(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    op: Literal["activate"]
+    username: str
+
+
+class DeactivateUserItemPydantic(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    op: Literal["deactivate"]
+    username: str
+
+
+type BatchItemPydantic = Annotated[
+    CreateUserItemPydantic | ActivateUserItemPydantic | DeactivateUserItemPydantic,
+    Field(discriminator="op"),
+]
+
+
+class BatchUsersRequestPydantic(BaseModel):
+    """
+    Using a Pydantic model here is generally unnecessary.
+    It's only implemented to render a specific Swagger UI (OpenAPI) schema.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    items: list[BatchItemPydantic] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+    mode: BatchMode = Field(default=BatchMode.ALL_OR_NOTHING)
+
+
+def to_batch_item(item: BatchItemPydantic) -> BatchUserCommandItem:
+    match item:
+        case CreateUserItemPydantic():
+            return CreateUserCommand(
+                username=item.username,
+                password=item.password,
+                role=item.role,
+            )
+        case ActivateUserItemPydantic():
+            return ActivateUserCommand(username=item.username)
+        case DeactivateUserItemPydantic():
+            return DeactivateUserCommand(username=item.username)
+
+
+def create_batch_users_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.post(
+        "/batch",
+        description=getdoc(BatchUserCommand),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            PasswordHasherBusyError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            UsernameAlreadyExistsError: status.HTTP_409_CONFLICT,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def batch_users(
+        request_data_pydantic: BatchUsersRequestPydantic,
+        mediator: FromDishka[Mediator],
+    ) -> BatchUserCommandResult:
+        command = BatchUserCommand(
+            items=[to_batch_item(item) for item in request_data_pydantic.items],
+            mode=request_data_pydantic.mode,
+        )
+        return await mediator.send(command)
+
+    return router
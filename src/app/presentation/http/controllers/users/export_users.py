@@ -0,0 +1,91 @@
+from inspect import getdoc
+from typing import Annotated
+
+from diator.mediator import Mediator
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Security, status
+from fastapi.responses import StreamingResponse
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.query import SortingError
+from app.application.common.query_params.sorting import SortingOrder
+from app.application.features.user.queries.export import (
+    ExportUsersQuery,
+    ExportUsersQueryResult,
+)
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError, ReaderError
+from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+from app.presentation.http.streaming.user_export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    encode_users,
+)
+
+
+class ExportUsersRequestPydantic(BaseModel):
+    """
+    Using a Pydantic model here is generally unnecessary.
+    It's only implemented to render a specific Swagger UI (OpenAPI) schema.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    format: Annotated[ExportFormat, Field()] = ExportFormat.NDJSON
+    sorting_field: Annotated[str, Field()] = "username"
+    sorting_order: Annotated[SortingOrder, Field()] = SortingOrder.ASC
+
+
+def create_export_users_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/export",
+        description=getdoc(ExportUsersQuery),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            ReaderError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            SortingError: status.HTTP_400_BAD_REQUEST,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        response_class=StreamingResponse,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def export_users(
+        request_data_pydantic: Annotated[ExportUsersRequestPydantic, Depends()],
+        mediator: FromDishka[Mediator],
+    ) -> StreamingResponse:
+        query = ExportUsersQuery(
+            sorting_field=request_data_pydantic.sorting_field,
+            sorting_order=request_data_pydantic.sorting_order,
+        )
+        result: ExportUsersQueryResult = await mediator.send(query)
+        export_format = request_data_pydantic.format
+        return StreamingResponse(
+            encode_users(result.users, export_format),
+            media_type=MEDIA_TYPES[export_format],
+            headers={
+                "Content-Disposition": f'attachment; filename="users.{export_format}"',
+            },
+        )
+
+    return router
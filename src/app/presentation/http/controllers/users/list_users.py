@@ -10,6 +10,10 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from app.application.common.exceptions.authorization import AuthorizationError
 from app.application.common.exceptions.query import PaginationError, SortingError
+from app.application.common.query_params.pagination import (
+    PaginationMode,
+    TotalCountMode,
+)
 from app.application.common.query_params.sorting import SortingOrder
 from app.application.features.user.queries.list import (
     ListUsersQuery,
@@ -36,6 +40,9 @@ class ListUsersRequestPydantic(BaseModel):
     offset: Annotated[int, Field(ge=0)] = 0
     sorting_field: Annotated[str, Field()] = "username"
     sorting_order: Annotated[SortingOrder, Field()] = SortingOrder.ASC
+    pagination: Annotated[PaginationMode, Field()] = PaginationMode.OFFSET
+    cursor: Annotated[str | None, Field(max_length=512)] = None
+    total: Annotated[TotalCountMode | None, Field()] = None
 
 
 def create_list_users_router() -> APIRouter:
@@ -74,6 +81,9 @@ def create_list_users_router() -> APIRouter:
             offset=request_data_pydantic.offset,
             sorting_field=request_data_pydantic.sorting_field,
             sorting_order=request_data_pydantic.sorting_order,
+            pagination=request_data_pydantic.pagination,
+            cursor=request_data_pydantic.cursor,
+            total=request_data_pydantic.total,
         )
         return await mediator.send(query)
 
@@ -3,6 +3,9 @@ from fastapi import APIRouter
 from app.presentation.http.controllers.users.activate_user import (
     create_activate_user_router,
 )
+from app.presentation.http.controllers.users.batch_users import (
+    create_batch_users_router,
+)
 from app.presentation.http.controllers.users.change_password import (
     create_change_password_router,
 )
@@ -12,6 +15,9 @@ from app.presentation.http.controllers.users.create_user import (
 from app.presentation.http.controllers.users.deactivate_user import (
     create_deactivate_user_router,
 )
+from app.presentation.http.controllers.users.export_users import (
+    create_export_users_router,
+)
 from app.presentation.http.controllers.users.grant_admin import (
     create_grant_admin_router,
 )
@@ -29,7 +35,9 @@ def create_users_router() -> APIRouter:
 
     sub_routers = (
         create_create_user_router(),
+        create_batch_users_router(),
         create_list_users_router(),
+        create_export_users_router(),
         create_change_password_router(),
         create_grant_admin_router(),
         create_revoke_admin_router(),
@@ -0,0 +1,166 @@
+import logging
+import math
+from dataclasses import asdict
+from datetime import UTC, datetime
+from http.cookies import SimpleCookie
+
+from dishka import AsyncContainer
+from starlette import status
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.shared_connection import (
+    SharedRequestConnection,
+)
+from app.presentation.http.auth.cookie_params import CookieParams
+from app.presentation.http.errors.translators import ServiceUnavailableTranslator
+from app.presentation.http.persistence.read_your_writes_cookie import (
+    COOKIE_READ_YOUR_WRITES_NAME,
+    REQUEST_STATE_READ_YOUR_WRITES_KEY,
+)
+
+log = logging.getLogger(__name__)
+
+
+class ASGISharedConnectionMiddleware:
+    """
+    Ends the request's shared connection transaction along with the response,
+    rather than once the request scope closes after it is sent:
+    - a response sent in one body is committed before it starts,
+    and a failing commit replaces it with 503;
+    - a streamed response is committed before its last body message,
+    as its rows may still be read from a cursor of that transaction;
+    - an error response (status >= 400), or an exception, rolls it back.
+
+    Must run inside the Dishka container middleware.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        container: AsyncContainer = Request(scope).state.dishka_container
+        sender = _TransactionEndingSender(scope, receive, send, container)
+        try:
+            await self.app(scope, receive, sender.send)
+        except Exception:
+            shared_connection = await container.get(SharedRequestConnection)
+            await shared_connection.rollback()
+            raise
+
+
+class _TransactionEndingSender:
+    def __init__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        container: AsyncContainer,
+    ):
+        self._scope = scope
+        self._receive = receive
+        self._send = send
+        self._container = container
+        self._start_message: Message | None = None
+        self._is_started = False
+        self._is_replaced = False
+
+    async def send(self, message: Message) -> None:
+        if self._is_replaced:
+            return
+        if message["type"] == "http.response.start":
+            self._start_message = message
+            return
+        if message["type"] != "http.response.body" or self._start_message is None:
+            await self._send(message)
+            return
+
+        more_body = message.get("more_body", False)
+        if not self._is_started:
+            if not more_body:
+                try:
+                    await self._end_transaction(self._start_message["status"])
+                except DataMapperError as error:
+                    log.error("Shared request connection commit failed: %s", error)
+                    self._is_replaced = True
+                    await self._unavailable(error)(
+                        self._scope,
+                        self._receive,
+                        self._send,
+                    )
+                    return
+            self._is_started = True
+            await self._send(self._start_message)
+        elif not more_body:
+            # Too late to change the status: the client gets a truncated body.
+            await self._end_transaction(self._start_message["status"])
+        await self._send(message)
+
+    async def _end_transaction(self, status_code: int) -> None:
+        shared_connection = await self._container.get(SharedRequestConnection)
+        if status_code >= status.HTTP_400_BAD_REQUEST:
+            await shared_connection.rollback()
+        else:
+            await shared_connection.commit()
+
+    @staticmethod
+    def _unavailable(error: DataMapperError) -> JSONResponse:
+        body = ServiceUnavailableTranslator().from_error(error)
+        return JSONResponse(
+            asdict(body),
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+
+class ASGIReadYourWritesMiddleware:
+    """
+    Sets the cookie carrying the end of the client's read-your-writes window,
+    once a request commits, so every worker routes its reads to the primary
+    until the replica has caught up with its writes.
+    """
+
+    def __init__(self, app: ASGIApp, cookie_params: CookieParams):
+        self.app = app
+        self._cookie_params = cookie_params
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request = Request(scope)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                window_end: datetime | None = getattr(
+                    request.state,
+                    REQUEST_STATE_READ_YOUR_WRITES_KEY,
+                    None,
+                )
+                if window_end is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Set-Cookie", self._make_cookie_header(window_end))
+            await send(message)
+
+        return await self.app(scope, receive, send_wrapper)
+
+    def _make_cookie_header(self, window_end: datetime) -> str:
+        max_age = (window_end - datetime.now(UTC)).total_seconds()
+        cookie = SimpleCookie()
+        # Rounded down, so the window the cookie carries never grows.
+        cookie[COOKIE_READ_YOUR_WRITES_NAME] = str(int(window_end.timestamp()))
+        cookie[COOKIE_READ_YOUR_WRITES_NAME]["path"] = "/"
+        cookie[COOKIE_READ_YOUR_WRITES_NAME]["httponly"] = True
+        cookie[COOKIE_READ_YOUR_WRITES_NAME]["max-age"] = max(math.ceil(max_age), 0)
+        if self._cookie_params.secure:
+            cookie[COOKIE_READ_YOUR_WRITES_NAME]["secure"] = True
+        if self._cookie_params.samesite:
+            cookie[COOKIE_READ_YOUR_WRITES_NAME]["samesite"] = (
+                self._cookie_params.samesite
+            )
+        return cookie.output(header="").strip()
@@ -0,0 +1,31 @@
+import logging
+from datetime import UTC, datetime
+from typing import Final
+
+from starlette.requests import Request
+
+from app.infrastructure.persistence_sqla.replica import ReadYourWritesTransport
+
+log = logging.getLogger(__name__)
+
+COOKIE_READ_YOUR_WRITES_NAME: Final[str] = "read_your_writes_until"
+REQUEST_STATE_READ_YOUR_WRITES_KEY: Final[str] = "read_your_writes_until"
+
+
+class CookieReadYourWritesTransport(ReadYourWritesTransport):
+    def __init__(self, request: Request):
+        self._request = request
+
+    def deliver(self, window_end: datetime) -> None:
+        setattr(self._request.state, REQUEST_STATE_READ_YOUR_WRITES_KEY, window_end)
+
+    def extract(self) -> datetime | None:
+        value = self._request.cookies.get(COOKIE_READ_YOUR_WRITES_NAME)
+        if value is None:
+            return None
+
+        try:
+            return datetime.fromtimestamp(int(value), UTC)
+        except (ValueError, OverflowError, OSError):
+            log.debug("Ignoring malformed read-your-writes cookie: '%s'.", value)
+            return None
@@ -0,0 +1,103 @@
+import logging
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Final
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.persistence_sqla.statement_counter import (
+    StatementStats,
+    count_statements,
+)
+
+log = logging.getLogger(__name__)
+
+LOGGED_STATEMENT_MAX_LENGTH: Final[int] = 200
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SqlProfilingConfig:
+    n_plus_one_threshold: int
+    server_timing: bool
+
+
+def format_server_timing(stats: StatementStats, elapsed_s: float) -> str:
+    return (
+        f'db;dur={stats.duration_s * 1000:.1f};desc="{stats.statements} statements", '
+        f"app;dur={elapsed_s * 1000:.1f}"
+    )
+
+
+class ASGISqlProfilingMiddleware:
+    """
+    Records SQL statements issued while handling each HTTP request:
+    count, time spent in the database and statements repeated often enough
+    to suggest one query per row (N+1).
+
+    Logged per request; optionally also sent as a `Server-Timing` header,
+    which reflects the statements issued before the response started.
+    """
+
+    def __init__(self, app: ASGIApp, config: SqlProfilingConfig):
+        self.app = app
+        self._config = config
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        started_at = perf_counter()
+        with count_statements() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if (
+                    message["type"] == "http.response.start"
+                    and self._config.server_timing
+                ):
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        format_server_timing(stats, perf_counter() - started_at),
+                    )
+                await send(message)
+
+            try:
+                return await self.app(scope, receive, send_wrapper)
+            finally:
+                self._log(scope, stats, perf_counter() - started_at)
+
+    def _log(self, scope: Scope, stats: StatementStats, elapsed_s: float) -> None:
+        if not stats.statements:
+            return
+
+        method, path = scope["method"], scope["path"]
+        extra = {
+            "http_method": method,
+            "http_path": path,
+            "sql_statements": stats.statements,
+            "sql_duration_ms": round(stats.duration_s * 1000, 1),
+            "duration_ms": round(elapsed_s * 1000, 1),
+        }
+        log.info(
+            "SQL profile: %s %s, %d statements in %.1f ms of %.1f ms.",
+            method,
+            path,
+            stats.statements,
+            extra["sql_duration_ms"],
+            extra["duration_ms"],
+            extra=extra,
+        )
+
+        repeated = stats.repeated(self._config.n_plus_one_threshold)
+        if repeated:
+            log.warning(
+                "Likely N+1 queries: %s %s. %s",
+                method,
+                path,
+                " ".join(
+                    f"{times}x '{fingerprint[:LOGGED_STATEMENT_MAX_LENGTH]}'."
+                    for fingerprint, times in repeated.items()
+                ),
+                extra={**extra, "sql_repeated": repeated},
+            )
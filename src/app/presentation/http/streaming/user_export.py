@@ -0,0 +1,71 @@
+import csv
+import io
+import logging
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from enum import StrEnum
+
+import orjson
+
+from app.application.common.query_models.user import UserQueryModel
+
+log = logging.getLogger(__name__)
+
+CSV_COLUMNS = ("id", "username", "role", "is_active")
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def encode_ndjson(users: list[UserQueryModel]) -> bytes:
+    return b"".join(
+        orjson.dumps(
+            {
+                "id": user["id_"],
+                "username": user["username"],
+                "role": user["role"],
+                "is_active": user["is_active"],
+            },
+            option=orjson.OPT_APPEND_NEWLINE,
+        )
+        for user in users
+    )
+
+
+def encode_csv(users: list[UserQueryModel]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        (user["id_"], user["username"], user["role"].value, user["is_active"])
+        for user in users
+    )
+    return buffer.getvalue().encode()
+
+
+async def encode_users(
+    chunks: AsyncGenerator[list[UserQueryModel]],
+    export_format: ExportFormat,
+) -> AsyncGenerator[bytes]:
+    """
+    One encoded chunk per batch read, so memory does not grow with the table.
+    If the client disconnects, Starlette cancels this generator,
+    and `aclosing` releases the database cursor right away.
+    """
+    async with aclosing(chunks):
+        if export_format == ExportFormat.CSV:
+            yield (",".join(CSV_COLUMNS) + "\r\n").encode()
+        async for users in chunks:
+            yield (
+                encode_csv(users)
+                if export_format == ExportFormat.CSV
+                else encode_ndjson(users)
+            )
+    log.info("Export users: done.")
@@ -20,10 +20,14 @@ def make_app(
     configure_logging(level=settings.logs.level)
 
     app: FastAPI = create_app()
-    configure_app(app=app, root_router=create_root_router())
+    configure_app(
+        app=app,
+        root_router=create_root_router(expose_metrics=settings.metrics.enabled),
+        settings=settings,
+    )
 
     async_ioc_container = create_async_ioc_container(
-        providers=(*get_providers(), *di_providers),
+        providers=(*get_providers(settings), *di_providers),
         settings=settings,
     )
     setup_dishka(container=async_ioc_container, app=app)
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
 
@@ -5,10 +6,21 @@ from dishka import AsyncContainer, Provider, make_async_container
 from fastapi import APIRouter, FastAPI
 from fastapi.responses import ORJSONResponse
 
+from app.infrastructure.background.worker import BackgroundWorkers
+from app.infrastructure.diator.request_scope import AppMediator
 from app.infrastructure.persistence_sqla.mappings.all import map_tables
 from app.presentation.http.auth.asgi_middleware import (
     ASGIAuthMiddleware,
 )
+from app.presentation.http.auth.cookie_params import CookieParams
+from app.presentation.http.persistence.asgi_middleware import (
+    ASGIReadYourWritesMiddleware,
+    ASGISharedConnectionMiddleware,
+)
+from app.presentation.http.profiling.asgi_middleware import (
+    ASGISqlProfilingMiddleware,
+    SqlProfilingConfig,
+)
 from app.setup.config.settings import AppSettings
 
 
@@ -22,17 +34,43 @@ def create_app() -> FastAPI:
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     map_tables()
+    container: AsyncContainer = app.state.dishka_container
+    # Fails startup if a handler is not provided, rather than its first request.
+    await container.get(AppMediator)
+    workers = await container.get(BackgroundWorkers)
+    tasks = [asyncio.create_task(worker.run()) for worker in workers]
     yield None
-    await app.state.dishka_container.close()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    for worker in workers:
+        await worker.shutdown()
+    await container.close()
     # https://dishka.readthedocs.io/en/stable/integrations/fastapi.html
 
 
 def configure_app(
     app: FastAPI,
     root_router: APIRouter,
+    settings: AppSettings,
 ) -> None:
     app.include_router(root_router)
     app.add_middleware(ASGIAuthMiddleware)
+    if settings.sqla.share_connection:
+        app.add_middleware(ASGISharedConnectionMiddleware)
+    if settings.postgres.replica_dsn is not None:
+        app.add_middleware(
+            ASGIReadYourWritesMiddleware,
+            cookie_params=CookieParams(secure=settings.security.cookies.secure),
+        )
+    # Added last to be outermost, so auth statements are profiled too.
+    app.add_middleware(
+        ASGISqlProfilingMiddleware,
+        config=SqlProfilingConfig(
+            n_plus_one_threshold=settings.queries.n_plus_one_threshold,
+            server_timing=settings.queries.server_timing,
+        ),
+    )
     # https://github.com/encode/starlette/discussions/2451
 
     # Good place to register global exception handlers
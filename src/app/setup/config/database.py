@@ -14,6 +14,15 @@ class PostgresSettings(BaseModel):
     host: str = Field(alias="HOST")
     port: int = Field(alias="PORT")
     driver: str = Field(alias="DRIVER")
+    replica_host: str | None = Field(alias="REPLICA_HOST", default=None)
+    replica_port: int | None = Field(alias="REPLICA_PORT", default=None)
+    replica_max_lag_sec: float = Field(alias="REPLICA_MAX_LAG_SEC", default=1, ge=0)
+    replica_lag_check_sec: float = Field(
+        alias="REPLICA_LAG_CHECK_SEC",
+        default=1,
+        gt=0,
+    )
+    read_your_writes_sec: float = Field(alias="READ_YOUR_WRITES_SEC", default=5, ge=0)
 
     @field_validator("host")
     @classmethod
@@ -23,22 +32,31 @@ class PostgresSettings(BaseModel):
             return postgres_host_env
         return v
 
-    @field_validator("port")
+    @field_validator("port", "replica_port")
     @classmethod
-    def validate_port_range(cls, v: int) -> int:
-        if not PORT_MIN <= v <= PORT_MAX:
+    def validate_port_range(cls, v: int | None) -> int | None:
+        if v is not None and not PORT_MIN <= v <= PORT_MAX:
             raise ValueError(f"Port must be between {PORT_MIN} and {PORT_MAX}")
         return v
 
     @property
     def dsn(self) -> str:
+        return self._build_dsn(self.host, self.port)
+
+    @property
+    def replica_dsn(self) -> str | None:
+        if self.replica_host is None:
+            return None
+        return self._build_dsn(self.replica_host, self.replica_port or self.port)
+
+    def _build_dsn(self, host: str, port: int) -> str:
         return str(
             PostgresDsn.build(
                 scheme=f"postgresql+{self.driver}",
                 username=self.user,
                 password=self.password,
-                host=self.host,
-                port=self.port,
+                host=host,
+                port=port,
                 path=self.db,
             ),
         )
@@ -49,3 +67,8 @@ class SqlaEngineSettings(BaseModel):
     echo_pool: bool = Field(alias="ECHO_POOL")
     pool_size: int = Field(alias="POOL_SIZE")
     max_overflow: int = Field(alias="MAX_OVERFLOW")
+    pool_timeout: float = Field(alias="POOL_TIMEOUT_SEC", default=30, gt=0)
+    pool_recycle: int = Field(alias="POOL_RECYCLE_SEC", default=-1, ge=-1)
+    pool_pre_ping: bool = Field(alias="POOL_PRE_PING", default=True)
+    statement_timeout_ms: int = Field(alias="STATEMENT_TIMEOUT_MS", default=0, ge=0)
+    share_connection: bool = Field(alias="SHARE_CONNECTION", default=False)
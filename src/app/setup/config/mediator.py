@@ -0,0 +1,8 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class MediatorSettings(BaseModel):
+    telemetry: bool = Field(alias="TELEMETRY", default=False)
+    span_exporter: Literal["off", "log"] = Field(alias="SPAN_EXPORTER", default="off")
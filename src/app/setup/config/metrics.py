@@ -0,0 +1,5 @@
+from pydantic import BaseModel, Field
+
+
+class MetricsSettings(BaseModel):
+    enabled: bool = Field(alias="ENABLED", default=False)
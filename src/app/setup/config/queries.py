@@ -0,0 +1,33 @@
+from datetime import timedelta
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+
+
+class QuerySettings(BaseModel):
+    user_count_cache_ttl_sec: timedelta = Field(
+        alias="USER_COUNT_CACHE_TTL_SEC",
+        default=timedelta(seconds=60),
+    )
+    statement_budget: Literal["off", "warn", "fail"] = Field(
+        alias="STATEMENT_BUDGET",
+        default="off",
+    )
+    n_plus_one_threshold: int = Field(
+        alias="N_PLUS_ONE_THRESHOLD",
+        default=3,
+        ge=2,
+    )
+    server_timing: bool = Field(alias="SERVER_TIMING", default=False)
+
+    @field_validator("user_count_cache_ttl_sec", mode="before")
+    @classmethod
+    def convert_seconds(cls, v: Any, info: ValidationInfo) -> timedelta:
+        name = (info.field_name or "").upper()
+        if isinstance(v, timedelta):
+            return v
+        if not isinstance(v, (int, float)):
+            raise ValueError(f"{name} must be a number (n of seconds, n > 0).")
+        if v <= 0:
+            raise ValueError(f"{name} must be positive.")
+        return timedelta(seconds=v)
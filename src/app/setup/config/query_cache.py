@@ -0,0 +1,26 @@
+from enum import StrEnum
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class QueryCacheBackend(StrEnum):
+    OFF = "off"
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
+class QueryCacheSettings(BaseModel):
+    backend: QueryCacheBackend = Field(
+        alias="BACKEND",
+        default=QueryCacheBackend.OFF,
+    )
+    redis_url: str | None = Field(alias="REDIS_URL", default=None)
+    key_prefix: str = Field(alias="KEY_PREFIX", default="query_cache")
+    max_entries: int = Field(alias="MAX_ENTRIES", default=1024, gt=0)
+
+    @model_validator(mode="after")
+    def validate_redis_url(self) -> Self:
+        if self.backend == QueryCacheBackend.REDIS and not self.redis_url:
+            raise ValueError("REDIS_URL must be set when BACKEND is 'redis'.")
+        return self
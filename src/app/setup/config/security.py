@@ -1,7 +1,7 @@
 from datetime import timedelta
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 
 class AuthSettings(BaseModel):
@@ -16,6 +16,53 @@ class AuthSettings(BaseModel):
     ] = Field(alias="JWT_ALGORITHM")
     session_ttl_min: timedelta = Field(alias="SESSION_TTL_MIN")
     session_refresh_threshold: float = Field(alias="SESSION_REFRESH_THRESHOLD")
+    session_cache_max_size: int = Field(
+        alias="SESSION_CACHE_MAX_SIZE",
+        default=10_000,
+        ge=0,
+    )
+    session_cache_ttl_sec: timedelta = Field(
+        alias="SESSION_CACHE_TTL_SEC",
+        default=timedelta(seconds=30),
+    )
+    session_extension_flush_sec: timedelta = Field(
+        alias="SESSION_EXTENSION_FLUSH_SEC",
+        default=timedelta(seconds=1),
+    )
+    session_reaper_interval_sec: timedelta = Field(
+        alias="SESSION_REAPER_INTERVAL_SEC",
+        default=timedelta(minutes=5),
+    )
+    session_reaper_batch_size: int = Field(
+        alias="SESSION_REAPER_BATCH_SIZE",
+        default=1_000,
+        ge=1,
+    )
+    session_stateless: bool = Field(alias="SESSION_STATELESS", default=False)
+    session_revocation_sync_sec: timedelta = Field(
+        alias="SESSION_REVOCATION_SYNC_SEC",
+        default=timedelta(seconds=5),
+    )
+    session_revocation_compaction_sec: timedelta = Field(
+        alias="SESSION_REVOCATION_COMPACTION_SEC",
+        default=timedelta(minutes=10),
+    )
+    session_revocation_bloom_capacity: int = Field(
+        alias="SESSION_REVOCATION_BLOOM_CAPACITY",
+        default=1_000_000,
+        ge=1,
+    )
+    session_revocation_bloom_error_rate: float = Field(
+        alias="SESSION_REVOCATION_BLOOM_ERROR_RATE",
+        default=0.001,
+        gt=0,
+        lt=1,
+    )
+    session_revocation_exact_max_size: int = Field(
+        alias="SESSION_REVOCATION_EXACT_MAX_SIZE",
+        default=100_000,
+        ge=0,
+    )
 
     @field_validator("session_ttl_min", mode="before")
     @classmethod
@@ -40,6 +87,25 @@ class AuthSettings(BaseModel):
             )
         return v
 
+    @field_validator(
+        "session_cache_ttl_sec",
+        "session_extension_flush_sec",
+        "session_reaper_interval_sec",
+        "session_revocation_sync_sec",
+        "session_revocation_compaction_sec",
+        mode="before",
+    )
+    @classmethod
+    def convert_seconds(cls, v: Any, info: ValidationInfo) -> timedelta:
+        name = (info.field_name or "").upper()
+        if isinstance(v, timedelta):
+            return v
+        if not isinstance(v, (int, float)):
+            raise ValueError(f"{name} must be a number (n of seconds, n >= 0).")
+        if v < 0:
+            raise ValueError(f"{name} must not be negative.")
+        return timedelta(seconds=v)
+
 
 class CookiesSettings(BaseModel):
     secure: bool = Field(alias="SECURE")
@@ -47,6 +113,32 @@ class CookiesSettings(BaseModel):
 
 class PasswordSettings(BaseModel):
     pepper: str = Field(alias="PEPPER")
+    algorithm: Literal["bcrypt", "argon2id", "scrypt"] = Field(
+        alias="ALGORITHM",
+        default="bcrypt",
+    )
+    bcrypt_rounds: int = Field(alias="BCRYPT_ROUNDS", default=12, ge=4, le=31)
+    argon2_time_cost: int = Field(alias="ARGON2_TIME_COST", default=3, ge=1)
+    argon2_memory_cost_kib: int = Field(
+        alias="ARGON2_MEMORY_COST_KIB",
+        default=64 * 1024,
+        ge=8,
+    )
+    argon2_parallelism: int = Field(alias="ARGON2_PARALLELISM", default=1, ge=1)
+    scrypt_log2_n: int = Field(alias="SCRYPT_LOG2_N", default=15, ge=1, le=24)
+    scrypt_block_size: int = Field(alias="SCRYPT_BLOCK_SIZE", default=8, ge=1)
+    scrypt_parallelism: int = Field(alias="SCRYPT_PARALLELISM", default=1, ge=1)
+    hasher_executor: Literal["thread", "process"] = Field(
+        alias="HASHER_EXECUTOR",
+        default="thread",
+    )
+    hasher_max_workers: int = Field(alias="HASHER_MAX_WORKERS", default=4, ge=1)
+    hasher_max_concurrency: int = Field(
+        alias="HASHER_MAX_CONCURRENCY",
+        default=4,
+        ge=1,
+    )
+    hasher_max_waiting: int = Field(alias="HASHER_MAX_WAITING", default=64, ge=0)
 
 
 class SecuritySettings(BaseModel):
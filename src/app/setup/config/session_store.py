@@ -0,0 +1,25 @@
+from enum import StrEnum
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class AuthSessionBackend(StrEnum):
+    SQLA = "sqla"
+    REDIS = "redis"
+    MEMORY = "memory"
+
+
+class AuthSessionStoreSettings(BaseModel):
+    backend: AuthSessionBackend = Field(
+        alias="BACKEND",
+        default=AuthSessionBackend.SQLA,
+    )
+    redis_url: str | None = Field(alias="REDIS_URL", default=None)
+    key_prefix: str = Field(alias="KEY_PREFIX", default="auth_session")
+
+    @model_validator(mode="after")
+    def validate_redis_url(self) -> Self:
+        if self.backend == AuthSessionBackend.REDIS and not self.redis_url:
+            raise ValueError("REDIS_URL must be set when BACKEND is 'redis'.")
+        return self
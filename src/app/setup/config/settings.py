@@ -1,11 +1,17 @@
 from pydantic import (
     BaseModel,
+    Field,
 )
 
 from app.setup.config.database import PostgresSettings, SqlaEngineSettings
 from app.setup.config.loader import ValidEnvs, get_current_env, load_full_config
 from app.setup.config.logs import LoggingSettings
+from app.setup.config.mediator import MediatorSettings
+from app.setup.config.metrics import MetricsSettings
+from app.setup.config.queries import QuerySettings
+from app.setup.config.query_cache import QueryCacheSettings
 from app.setup.config.security import SecuritySettings
+from app.setup.config.session_store import AuthSessionStoreSettings
 
 
 class AppSettings(BaseModel):
@@ -13,6 +19,13 @@ class AppSettings(BaseModel):
     sqla: SqlaEngineSettings
     security: SecuritySettings
     logs: LoggingSettings
+    session_store: AuthSessionStoreSettings = Field(
+        default_factory=AuthSessionStoreSettings,
+    )
+    queries: QuerySettings = Field(default_factory=QuerySettings)
+    mediator: MediatorSettings = Field(default_factory=MediatorSettings)
+    query_cache: QueryCacheSettings = Field(default_factory=QueryCacheSettings)
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
 
 
 def load_settings(env: ValidEnvs | None = None) -> AppSettings:
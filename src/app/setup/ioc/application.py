@@ -3,11 +3,16 @@ from dishka import Provider, Scope, provide, provide_all
 from app.application.common.ports.access_revoker import AccessRevoker
 from app.application.common.ports.flusher import Flusher
 from app.application.common.ports.identity_provider import IdentityProvider
+from app.application.common.ports.query_cache_invalidator import (
+    QueryCacheInvalidator,
+)
 from app.application.common.ports.uow import AsyncBaseUnitOfWork
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
 from app.application.common.ports.user_query_gateway import UserQueryGateway
 from app.application.common.services.current_user import CurrentUserService
 from app.application.features.user.commands.activate import ActivateUserCommandHandler
+from app.application.features.user.commands.batch import BatchUserCommandHandler
 from app.application.features.user.commands.change_password import (
     ChangePasswordCommandHandler,
 )
@@ -19,9 +24,11 @@ from app.application.features.user.commands.grant_admin import GrantAdminCommand
 from app.application.features.user.commands.revoke_admin import (
     RevokeAdminCommandHandler,
 )
+from app.application.features.user.queries.export import ExportUsersQueryHandler
 from app.application.features.user.queries.list import ListUsersQueryHandler
 from app.infrastructure.adapters.main_flusher_sqla import SqlaMainFlusher
 from app.infrastructure.adapters.uow import AsyncSQLAlchemyUnitOfWork
+from app.infrastructure.adapters.user_counter_sqla import SqlaUserCounter
 from app.infrastructure.adapters.user_data_mapper_sqla import (
     SqlaUserDataMapper,
 )
@@ -32,6 +39,7 @@ from app.infrastructure.auth.adapters.access_revoker import (
 from app.infrastructure.auth.adapters.identity_provider import (
     AuthSessionIdentityProvider,
 )
+from app.infrastructure.diator.query_cache import StoreQueryCacheInvalidator
 
 
 class ApplicationProvider(Provider):
@@ -69,10 +77,20 @@ class ApplicationProvider(Provider):
         source=SqlaUserReader,
         provides=UserQueryGateway,
     )
+    user_counter = provide(
+        source=SqlaUserCounter,
+        provides=UserCounter,
+    )
+    query_cache_invalidator = provide(
+        source=StoreQueryCacheInvalidator,
+        provides=QueryCacheInvalidator,
+        scope=Scope.APP,
+    )
 
     # Commands
     commands = provide_all(
         ActivateUserCommandHandler,
+        BatchUserCommandHandler,
         ChangePasswordCommandHandler,
         CreateUserCommandHandler,
         DeactivateUserCommandHandler,
@@ -82,5 +100,6 @@ class ApplicationProvider(Provider):
 
     # Queries
     queries = provide_all(
+        ExportUsersQueryHandler,
         ListUsersQueryHandler,
     )
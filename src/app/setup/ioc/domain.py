@@ -3,8 +3,13 @@ from dishka import Provider, Scope, provide
 from app.domain.ports.password_hasher import PasswordHasher
 from app.domain.ports.user_id_generator import UserIdGenerator
 from app.domain.services.user import UserService
-from app.infrastructure.adapters.password_hasher_bcrypt import (
-    BcryptPasswordHasher,
+from app.infrastructure.adapters.password_hasher_dispatching import (
+    get_dispatching_password_hasher,
+)
+from app.infrastructure.adapters.password_hasher_pooled import (
+    BlockingPasswordHasher,
+    PooledPasswordHasher,
+    get_password_hasher_pool,
 )
 from app.infrastructure.adapters.user_id_generator_uuid import (
     UuidUserIdGenerator,
@@ -19,9 +24,18 @@ class DomainProvider(Provider):
 
     # Ports
     password_hasher = provide(
-        source=BcryptPasswordHasher,
+        source=PooledPasswordHasher,
         provides=PasswordHasher,
     )
+    blocking_password_hasher = provide(
+        source=staticmethod(get_dispatching_password_hasher),
+        provides=BlockingPasswordHasher,
+        scope=Scope.APP,
+    )
+    password_hasher_pool = provide(
+        source=staticmethod(get_password_hasher_pool),
+        scope=Scope.APP,
+    )
     user_id_generator = provide(
         source=UuidUserIdGenerator,
         provides=UserIdGenerator,
@@ -1,43 +1,114 @@
 from dishka import Provider, Scope, provide, provide_all
 
+from app.infrastructure.adapters.password_hasher_pooled import PasswordHasherPool
+from app.infrastructure.adapters.user_count_cache import UserCountCache
+from app.infrastructure.adapters.user_count_refresher_sqla import (
+    SqlaUserCountRefresher,
+)
 from app.infrastructure.adapters.user_data_mapper_sqla import (
     SqlaUserDataMapper,
 )
 from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+from app.infrastructure.auth.adapters.data_mapper_kv import KvAuthSessionDataMapper
 from app.infrastructure.auth.adapters.data_mapper_sqla import (
     SqlaAuthSessionDataMapper,
 )
+from app.infrastructure.auth.adapters.extension_flusher_sqla import (
+    SqlaAuthSessionExtensionFlusher,
+)
+from app.infrastructure.auth.adapters.gateway_cached import (
+    CachedAuthSessionGateway,
+)
 from app.infrastructure.auth.adapters.identity_provider import (
     AuthSessionIdentityProvider,
 )
+from app.infrastructure.auth.adapters.kv_store import (
+    AuthSessionKeyValueStore,
+    KvAuthSessionWriteBuffer,
+)
+from app.infrastructure.auth.adapters.kv_store_memory import (
+    InMemoryAuthSessionKeyValueStore,
+)
+from app.infrastructure.auth.adapters.read_routing_identity import (
+    AuthSessionReadRoutingIdentity,
+)
+from app.infrastructure.auth.adapters.reaper_sqla import SqlaAuthSessionReaper
+from app.infrastructure.auth.adapters.revocation_gateway_kv import (
+    KvAuthSessionRevocationGateway,
+)
+from app.infrastructure.auth.adapters.revocation_gateway_sqla import (
+    SqlaAuthSessionRevocationGateway,
+)
+from app.infrastructure.auth.adapters.store_stats import AuthSessionStoreStats
+from app.infrastructure.auth.adapters.transaction_manager_kv import (
+    KvAuthSessionTransactionManager,
+)
 from app.infrastructure.auth.adapters.transaction_manager_sqla import (
     SqlaAuthSessionTransactionManager,
 )
 from app.infrastructure.auth.handlers.log_in import LogInHandler
 from app.infrastructure.auth.handlers.log_out import LogOutHandler
 from app.infrastructure.auth.handlers.sign_up import SignUpHandler
+from app.infrastructure.auth.session.cache import AuthSessionCache
+from app.infrastructure.auth.session.extension_buffer import (
+    AuthSessionExtensionBuffer,
+)
 from app.infrastructure.auth.session.id_generator_str import (
     StrAuthSessionIdGenerator,
 )
 from app.infrastructure.auth.session.ports.gateway import AuthSessionGateway
+from app.infrastructure.auth.session.ports.revocation_gateway import (
+    AuthSessionRevocationGateway,
+)
 from app.infrastructure.auth.session.ports.transaction_manager import (
     AuthSessionTransactionManager,
 )
 from app.infrastructure.auth.session.ports.transport import AuthSessionTransport
+from app.infrastructure.auth.session.revocation_list import (
+    AuthSessionRevocationList,
+)
 from app.infrastructure.auth.session.service import AuthSessionService
 from app.infrastructure.auth.session.timer_utc import UtcAuthSessionTimer
+from app.infrastructure.background.worker import BackgroundWorkers
 from app.infrastructure.diator.provider import (
     get_mediator,
+    get_request_mediator,
 )
+from app.infrastructure.diator.query_cache import (
+    InMemoryQueryCacheStore,
+    QueryCacheStore,
+)
+from app.infrastructure.diator.telemetry import MediatorMetrics
+from app.infrastructure.persistence_sqla.pool_telemetry import SqlaPoolMetrics
 from app.infrastructure.persistence_sqla.provider import (
     get_async_engine,
     get_async_session_factory,
     get_auth_async_session,
     get_main_async_session,
+    get_query_async_session,
+    get_replica_async_engine,
+    get_request_session_factory,
+)
+from app.infrastructure.persistence_sqla.replica import (
+    ReadRoutingIdentity,
+    ReadYourWritesTransport,
+    ReplicaRouter,
+    RequestReadRouting,
+)
+from app.infrastructure.persistence_sqla.replica_lag_monitor import (
+    SqlaReplicaLagMonitor,
+)
+from app.infrastructure.persistence_sqla.shared_connection import (
+    SharedRequestConnection,
 )
 from app.presentation.http.auth.adapters.session_transport_jwt_cookie import (
     JwtCookieAuthSessionTransport,
 )
+from app.presentation.http.persistence.read_your_writes_cookie import (
+    CookieReadYourWritesTransport,
+)
+from app.setup.config.query_cache import QueryCacheBackend
+from app.setup.config.session_store import AuthSessionBackend
 
 
 class InfrastructureProvider(Provider):
@@ -46,21 +117,19 @@ class InfrastructureProvider(Provider):
     # Auth Services
     auth_session_service = provide(source=AuthSessionService)
 
-    # Auth Ports Persistence
-    auth_session_gateway = provide(
-        source=SqlaAuthSessionDataMapper,
-        provides=AuthSessionGateway,
-    )
-    auth_session_tx_manager = provide(
-        source=SqlaAuthSessionTransactionManager,
-        provides=AuthSessionTransactionManager,
-    )
-
     # Auth Ports
     auth_session_transport = provide(
         source=JwtCookieAuthSessionTransport,
         provides=AuthSessionTransport,
     )
+    read_routing_identity = provide(
+        source=AuthSessionReadRoutingIdentity,
+        provides=ReadRoutingIdentity,
+    )
+    read_your_writes_transport = provide(
+        source=CookieReadYourWritesTransport,
+        provides=ReadYourWritesTransport,
+    )
 
     # Infrastructure Handlers
     infra_handlers = provide_all(
@@ -71,19 +140,40 @@ class InfrastructureProvider(Provider):
 
     # Concrete Objects
     infra_objects = provide_all(
+        RequestReadRouting,
         StrAuthSessionIdGenerator,
         UtcAuthSessionTimer,
         AuthSessionIdentityProvider,
-        SqlaAuthSessionDataMapper,
-        SqlaAuthSessionTransactionManager,
         SqlaUserDataMapper,
         SqlaUserReader,
     )
 
 
-def infrastructure_provider() -> InfrastructureProvider:
+def infrastructure_provider(
+    auth_session_backend: AuthSessionBackend = AuthSessionBackend.SQLA,
+    query_cache_backend: QueryCacheBackend = QueryCacheBackend.OFF,
+) -> InfrastructureProvider:
     provider = InfrastructureProvider()
 
+    # Auth Session Revocations
+    provider.provide(
+        source=AuthSessionRevocationList,
+        scope=Scope.APP,
+    )
+
+    # User Counts
+    provider.provide_all(
+        UserCountCache,
+        SqlaUserCountRefresher,
+        scope=Scope.APP,
+    )
+
+    # Auth Ports Persistence
+    if auth_session_backend == AuthSessionBackend.SQLA:
+        _provide_sqla_auth_session_store(provider)
+    else:
+        _provide_kv_auth_session_store(provider, auth_session_backend)
+
     # SQLA Persistence
     provider.provide(
         source=get_async_engine,
@@ -93,8 +183,44 @@ def infrastructure_provider() -> InfrastructureProvider:
         source=get_async_session_factory,
         scope=Scope.APP,
     )
+    provider.provide(
+        source=SqlaPoolMetrics,
+        scope=Scope.APP,
+    )
+
+    # Read Replica
+    provider.provide(
+        source=get_replica_async_engine,
+        scope=Scope.APP,
+    )
+    provider.provide_all(
+        ReplicaRouter,
+        SqlaReplicaLagMonitor,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_query_async_session,
+        scope=Scope.REQUEST,
+    )
     provider.provide(
         source=get_mediator,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=MediatorMetrics,
+        scope=Scope.APP,
+    )
+    _provide_query_cache(provider, query_cache_backend)
+    provider.provide(
+        source=get_request_mediator,
+        scope=Scope.REQUEST,
+    )
+    provider.provide(
+        source=SharedRequestConnection,
+        scope=Scope.REQUEST,
+    )
+    provider.provide(
+        source=get_request_session_factory,
         scope=Scope.REQUEST,
     )
     provider.provide(
@@ -106,3 +232,143 @@ def infrastructure_provider() -> InfrastructureProvider:
         scope=Scope.REQUEST,
     )
     return provider
+
+
+def _get_sqla_background_workers(
+    extension_flusher: SqlaAuthSessionExtensionFlusher,
+    reaper: SqlaAuthSessionReaper,
+    password_hasher_pool: PasswordHasherPool,
+    user_count_refresher: SqlaUserCountRefresher,
+    replica_lag_monitor: SqlaReplicaLagMonitor,
+) -> BackgroundWorkers:
+    return BackgroundWorkers([
+        extension_flusher,
+        reaper,
+        password_hasher_pool,
+        user_count_refresher,
+        replica_lag_monitor,
+    ])
+
+
+def _get_kv_background_workers(
+    password_hasher_pool: PasswordHasherPool,
+    user_count_refresher: SqlaUserCountRefresher,
+    replica_lag_monitor: SqlaReplicaLagMonitor,
+) -> BackgroundWorkers:
+    return BackgroundWorkers([
+        password_hasher_pool,
+        user_count_refresher,
+        replica_lag_monitor,
+    ])
+
+
+def _get_sqla_auth_session_store_stats(
+    cache: AuthSessionCache,
+    reaper: SqlaAuthSessionReaper,
+) -> AuthSessionStoreStats:
+    return AuthSessionStoreStats(cache=cache.stats, reaper=reaper.stats)
+
+
+def _get_kv_auth_session_store_stats() -> AuthSessionStoreStats:
+    return AuthSessionStoreStats()
+
+
+def _provide_query_cache(
+    provider: Provider,
+    query_cache_backend: QueryCacheBackend,
+) -> None:
+    # Provided even when off, as command handlers invalidate it regardless
+    if query_cache_backend == QueryCacheBackend.REDIS:
+        from app.infrastructure.diator.query_cache_redis import (  # noqa: PLC0415
+            get_redis_query_cache_store,
+        )
+
+        provider.provide(
+            source=get_redis_query_cache_store,
+            scope=Scope.APP,
+        )
+    else:
+        provider.provide(
+            source=InMemoryQueryCacheStore,
+            provides=QueryCacheStore,
+            scope=Scope.APP,
+        )
+
+
+def _provide_sqla_auth_session_store(provider: Provider) -> None:
+    provider.provide(
+        source=AuthSessionCache,
+        scope=Scope.APP,
+    )
+    provider.provide_all(
+        AuthSessionExtensionBuffer,
+        SqlaAuthSessionExtensionFlusher,
+        SqlaAuthSessionReaper,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=_get_sqla_background_workers,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=_get_sqla_auth_session_store_stats,
+        scope=Scope.REQUEST,
+    )
+    provider.provide_all(
+        SqlaAuthSessionDataMapper,
+        SqlaAuthSessionTransactionManager,
+    )
+    provider.provide(
+        source=CachedAuthSessionGateway,
+        provides=AuthSessionGateway,
+    )
+    provider.provide(
+        source=SqlaAuthSessionTransactionManager,
+        provides=AuthSessionTransactionManager,
+    )
+    provider.provide(
+        source=SqlaAuthSessionRevocationGateway,
+        provides=AuthSessionRevocationGateway,
+    )
+
+
+def _provide_kv_auth_session_store(
+    provider: Provider,
+    auth_session_backend: AuthSessionBackend,
+) -> None:
+    if auth_session_backend == AuthSessionBackend.REDIS:
+        from app.infrastructure.auth.adapters.kv_store_redis import (  # noqa: PLC0415
+            get_redis_auth_session_store,
+        )
+
+        provider.provide(
+            source=get_redis_auth_session_store,
+            scope=Scope.APP,
+        )
+    else:
+        provider.provide(
+            source=InMemoryAuthSessionKeyValueStore,
+            provides=AuthSessionKeyValueStore,
+            scope=Scope.APP,
+        )
+    provider.provide(
+        source=_get_kv_background_workers,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=_get_kv_auth_session_store_stats,
+        scope=Scope.REQUEST,
+    )
+    provider.provide(source=KvAuthSessionWriteBuffer)
+    provider.provide(
+        source=KvAuthSessionDataMapper,
+        provides=AuthSessionGateway,
+    )
+    provider.provide(
+        source=KvAuthSessionTransactionManager,
+        provides=AuthSessionTransactionManager,
+    )
+    provider.provide(
+        source=KvAuthSessionRevocationGateway,
+        provides=AuthSessionRevocationGateway,
+    )
@@ -3,6 +3,7 @@ from collections.abc import Iterable
 from dishka import Provider
 from dishka.integrations.starlette import StarletteProvider
 
+from app.setup.config.settings import AppSettings
 from app.setup.ioc.application import ApplicationProvider
 from app.setup.ioc.domain import DomainProvider
 from app.setup.ioc.infrastructure import infrastructure_provider
@@ -10,12 +11,15 @@ from app.setup.ioc.presentation import PresentationProvider
 from app.setup.ioc.settings import SettingsProvider
 
 
-def get_providers() -> Iterable[Provider]:
+def get_providers(settings: AppSettings) -> Iterable[Provider]:
     return (
         DomainProvider(),
         ApplicationProvider(),
         StarletteProvider(),
-        infrastructure_provider(),
+        infrastructure_provider(
+            settings.session_store.backend,
+            settings.query_cache.backend,
+        ),
         PresentationProvider(),
         SettingsProvider(),
     )
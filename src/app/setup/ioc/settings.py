@@ -1,11 +1,45 @@
+from datetime import timedelta
+
 from dishka import Provider, Scope, from_context, provide
 
-from app.infrastructure.adapters.password_hasher_bcrypt import PasswordPepper
+from app.infrastructure.adapters.password_hasher_bcrypt import BcryptRounds
+from app.infrastructure.adapters.password_hasher_dispatching import (
+    Argon2Params,
+    PasswordHashAlgorithm,
+    PasswordHashConfig,
+)
+from app.infrastructure.adapters.password_hasher_pooled import (
+    PasswordHasherExecutor,
+    PasswordHasherPoolConfig,
+)
+from app.infrastructure.adapters.password_hasher_scrypt import ScryptParams
+from app.infrastructure.adapters.password_pepper import PasswordPepper
+from app.infrastructure.adapters.user_count_cache import UserCountCacheTtl
+from app.infrastructure.auth.adapters.data_mapper_kv import AuthSessionKeyPrefix
+from app.infrastructure.auth.adapters.kv_store import AuthSessionRedisUrl
+from app.infrastructure.auth.adapters.reaper_sqla import AuthSessionReaperConfig
+from app.infrastructure.auth.session.cache import (
+    AuthSessionCacheMaxSize,
+    AuthSessionCacheTtl,
+)
+from app.infrastructure.auth.session.extension_buffer import (
+    AuthSessionExtensionFlushInterval,
+)
+from app.infrastructure.auth.session.revocation_list import (
+    AuthSessionRevocationListConfig,
+    AuthSessionStateless,
+)
 from app.infrastructure.auth.session.timer_utc import (
     AuthSessionRefreshThreshold,
     AuthSessionTtlMin,
 )
+from app.infrastructure.diator.query_cache import (
+    QueryCacheKeyPrefix,
+    QueryCacheMaxEntries,
+    QueryCacheRedisUrl,
+)
 from app.infrastructure.persistence_sqla.config import PostgresDsn, SqlaEngineConfig
+from app.infrastructure.persistence_sqla.replica import ReplicaRoutingConfig
 from app.presentation.http.auth.access_token_processor_jwt import (
     JwtAlgorithm,
     JwtSecret,
@@ -14,7 +48,7 @@ from app.presentation.http.auth.cookie_params import CookieParams
 from app.setup.config.settings import AppSettings
 
 
-class SettingsProvider(Provider):
+class SettingsProvider(Provider):  # noqa: PLR0904
     scope = Scope.APP
 
     settings = from_context(provides=AppSettings)
@@ -27,10 +61,60 @@ class SettingsProvider(Provider):
     def provide_sqla_engine_config(self, settings: AppSettings) -> SqlaEngineConfig:
         return SqlaEngineConfig(**settings.sqla.model_dump())
 
+    @provide
+    def provide_replica_routing_config(
+        self,
+        settings: AppSettings,
+    ) -> ReplicaRoutingConfig:
+        postgres = settings.postgres
+        return ReplicaRoutingConfig(
+            dsn=postgres.replica_dsn,
+            max_lag=timedelta(seconds=postgres.replica_max_lag_sec),
+            lag_check_interval=timedelta(seconds=postgres.replica_lag_check_sec),
+            read_your_writes_window=timedelta(seconds=postgres.read_your_writes_sec),
+        )
+
     @provide
     def provide_password_pepper(self, settings: AppSettings) -> PasswordPepper:
         return PasswordPepper(settings.security.password.pepper)
 
+    @provide
+    def provide_bcrypt_rounds(self, settings: AppSettings) -> BcryptRounds:
+        return BcryptRounds(settings.security.password.bcrypt_rounds)
+
+    @provide
+    def provide_password_hash_config(
+        self,
+        settings: AppSettings,
+    ) -> PasswordHashConfig:
+        password = settings.security.password
+        return PasswordHashConfig(
+            algorithm=PasswordHashAlgorithm(password.algorithm),
+            argon2=Argon2Params(
+                time_cost=password.argon2_time_cost,
+                memory_cost_kib=password.argon2_memory_cost_kib,
+                parallelism=password.argon2_parallelism,
+            ),
+            scrypt=ScryptParams(
+                log2_n=password.scrypt_log2_n,
+                block_size=password.scrypt_block_size,
+                parallelism=password.scrypt_parallelism,
+            ),
+        )
+
+    @provide
+    def provide_password_hasher_pool_config(
+        self,
+        settings: AppSettings,
+    ) -> PasswordHasherPoolConfig:
+        password = settings.security.password
+        return PasswordHasherPoolConfig(
+            executor=PasswordHasherExecutor(password.hasher_executor),
+            max_workers=password.hasher_max_workers,
+            max_concurrency=password.hasher_max_concurrency,
+            max_waiting=password.hasher_max_waiting,
+        )
+
     @provide
     def provide_jwt_secret(self, settings: AppSettings) -> JwtSecret:
         return JwtSecret(settings.security.auth.jwt_secret)
@@ -52,6 +136,99 @@ class SettingsProvider(Provider):
             settings.security.auth.session_refresh_threshold,
         )
 
+    @provide
+    def provide_auth_session_cache_max_size(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionCacheMaxSize:
+        return AuthSessionCacheMaxSize(settings.security.auth.session_cache_max_size)
+
+    @provide
+    def provide_auth_session_cache_ttl(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionCacheTtl:
+        return AuthSessionCacheTtl(settings.security.auth.session_cache_ttl_sec)
+
+    @provide
+    def provide_auth_session_extension_flush_interval(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionExtensionFlushInterval:
+        return AuthSessionExtensionFlushInterval(
+            settings.security.auth.session_extension_flush_sec,
+        )
+
+    @provide
+    def provide_auth_session_reaper_config(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionReaperConfig:
+        return AuthSessionReaperConfig(
+            interval=settings.security.auth.session_reaper_interval_sec,
+            batch_size=settings.security.auth.session_reaper_batch_size,
+        )
+
+    @provide
+    def provide_auth_session_key_prefix(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionKeyPrefix:
+        return AuthSessionKeyPrefix(settings.session_store.key_prefix)
+
+    @provide
+    def provide_auth_session_redis_url(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionRedisUrl:
+        return AuthSessionRedisUrl(settings.session_store.redis_url or "")
+
+    @provide
+    def provide_auth_session_stateless(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionStateless:
+        return AuthSessionStateless(settings.security.auth.session_stateless)
+
+    @provide
+    def provide_auth_session_revocation_list_config(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionRevocationListConfig:
+        auth = settings.security.auth
+        return AuthSessionRevocationListConfig(
+            sync_interval=auth.session_revocation_sync_sec,
+            compaction_interval=auth.session_revocation_compaction_sec,
+            bloom_capacity=auth.session_revocation_bloom_capacity,
+            bloom_error_rate=auth.session_revocation_bloom_error_rate,
+            exact_max_size=auth.session_revocation_exact_max_size,
+        )
+
+    @provide
+    def provide_user_count_cache_ttl(self, settings: AppSettings) -> UserCountCacheTtl:
+        return UserCountCacheTtl(settings.queries.user_count_cache_ttl_sec)
+
+    @provide
+    def provide_query_cache_max_entries(
+        self,
+        settings: AppSettings,
+    ) -> QueryCacheMaxEntries:
+        return QueryCacheMaxEntries(settings.query_cache.max_entries)
+
+    @provide
+    def provide_query_cache_key_prefix(
+        self,
+        settings: AppSettings,
+    ) -> QueryCacheKeyPrefix:
+        return QueryCacheKeyPrefix(settings.query_cache.key_prefix)
+
+    @provide
+    def provide_query_cache_redis_url(
+        self,
+        settings: AppSettings,
+    ) -> QueryCacheRedisUrl:
+        return QueryCacheRedisUrl(settings.query_cache.redis_url or "")
+
     @provide
     def provide_cookie_params(self, settings: AppSettings) -> CookieParams:
         return CookieParams(secure=settings.security.cookies.secure)
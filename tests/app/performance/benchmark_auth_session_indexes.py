@@ -0,0 +1,129 @@
+"""
+Query plans and timings of auth_sessions access paths, with and without
+the `user_id`/`expiration` indexes added in revision `8d4e2a6f0c13`.
+
+Runs against the configured Postgres in a scratch schema, which is dropped after:
+    python -m tests.app.performance.benchmark_auth_session_indexes --sessions 1000000
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.setup.config.settings import load_settings
+
+SCHEMA = "bench_auth_sessions"
+
+QUERIES = {
+    "delete_all_for_user": (
+        "DELETE FROM auth_sessions WHERE user_id = "
+        "(SELECT user_id FROM auth_sessions ORDER BY id LIMIT 1)"
+    ),
+    "reaper_batch": (
+        "DELETE FROM auth_sessions WHERE id IN ("
+        "SELECT id FROM auth_sessions WHERE expiration < now() "
+        "LIMIT 1000 FOR UPDATE SKIP LOCKED)"
+    ),
+    "read_by_id": (
+        "SELECT * FROM auth_sessions WHERE id = "
+        "(SELECT id FROM auth_sessions ORDER BY id DESC LIMIT 1)"
+    ),
+    "user_delete_cascade": (
+        "DELETE FROM users WHERE id = (SELECT id FROM users ORDER BY id LIMIT 1)"
+    ),
+}
+
+
+async def seed(conn: AsyncConnection, n_sessions: int, n_users: int) -> None:
+    await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    await conn.execute(text(f"SET search_path TO {SCHEMA}"))
+    await conn.execute(text("CREATE TABLE users (id uuid PRIMARY KEY)"))
+    await conn.execute(
+        text(
+            "CREATE TABLE auth_sessions ("
+            "id varchar PRIMARY KEY, "
+            "user_id uuid NOT NULL, "
+            "expiration timestamptz NOT NULL)",
+        ),
+    )
+    await conn.execute(
+        text("INSERT INTO users SELECT gen_random_uuid() FROM generate_series(1, :n)"),
+        {"n": n_users},
+    )
+    # About 10% of sessions are expired, as if never reaped.
+    await conn.execute(
+        text(
+            "INSERT INTO auth_sessions "
+            "SELECT md5(g::text), u.id, now() + (random() * 11 - 1) * interval '1 day' "
+            "FROM generate_series(1, :n) AS g "
+            "JOIN (SELECT id, row_number() OVER () AS rn FROM users) AS u "
+            "ON u.rn = 1 + g % :users",
+        ),
+        {"n": n_sessions, "users": n_users},
+    )
+    await conn.execute(text("ANALYZE users"))
+    await conn.execute(text("ANALYZE auth_sessions"))
+
+
+async def add_indexes(conn: AsyncConnection) -> None:
+    await conn.execute(
+        text("CREATE INDEX ix_auth_sessions_user_id ON auth_sessions (user_id)"),
+    )
+    await conn.execute(
+        text("CREATE INDEX ix_auth_sessions_expiration ON auth_sessions (expiration)"),
+    )
+    await conn.execute(
+        text(
+            "ALTER TABLE auth_sessions ADD CONSTRAINT fk_auth_sessions_user_id_users "
+            "FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE",
+        ),
+    )
+    await conn.execute(text("ANALYZE auth_sessions"))
+
+
+async def explain_all(conn: AsyncConnection, label: str) -> None:
+    print(f"\n===== {label} =====")
+    for name, query in QUERIES.items():
+        # Rolled back, so each phase measures the same data.
+        async with conn.begin_nested() as savepoint:
+            started_at = perf_counter()
+            plan = await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {query}"))
+            elapsed_ms = (perf_counter() - started_at) * 1000
+            await savepoint.rollback()
+
+        print(f"\n--- {name}: {elapsed_ms:.1f} ms ---")
+        for (line,) in plan:
+            print(line)
+
+
+async def main(n_sessions: int, n_users: int) -> None:
+    settings = load_settings()
+    engine = create_async_engine(settings.postgres.dsn)
+    try:
+        async with engine.begin() as conn:
+            started_at = perf_counter()
+            await seed(conn, n_sessions, n_users)
+            print(
+                f"Seeded {n_sessions} sessions for {n_users} users "
+                f"in {perf_counter() - started_at:.1f} s.",
+            )
+
+            await explain_all(conn, "primary keys only (e325187c1eeb)")
+            await add_indexes(conn)
+            await explain_all(conn, "with indexes and FK (8d4e2a6f0c13)")
+
+            await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.users))
@@ -0,0 +1,116 @@
+"""
+Throughput, latency and peak memory of concurrent password verification
+for each hashing algorithm, with the costs from the loaded settings.
+Each algorithm runs in its own process, so peak RSS is not shared between them:
+    python -m tests.app.performance.benchmark_password_hash_algorithms --logins 64
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import statistics
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.adapters.password_hasher_bcrypt import BcryptRounds
+from app.infrastructure.adapters.password_hasher_dispatching import (
+    Argon2Params,
+    PasswordHashAlgorithm,
+    PasswordHashConfig,
+    get_dispatching_password_hasher,
+)
+from app.infrastructure.adapters.password_hasher_scrypt import ScryptParams
+from app.infrastructure.adapters.password_pepper import PasswordPepper
+from app.setup.config.settings import load_settings
+
+
+@dataclass(frozen=True, slots=True)
+class AlgorithmResult:
+    logins_per_s: float
+    p50_ms: float
+    p99_ms: float
+    peak_rss_mib: float
+
+
+def load_password_hash_config(algorithm: PasswordHashAlgorithm) -> PasswordHashConfig:
+    password = load_settings().security.password
+    return PasswordHashConfig(
+        algorithm=algorithm,
+        argon2=Argon2Params(
+            time_cost=password.argon2_time_cost,
+            memory_cost_kib=password.argon2_memory_cost_kib,
+            parallelism=password.argon2_parallelism,
+        ),
+        scrypt=ScryptParams(
+            log2_n=password.scrypt_log2_n,
+            block_size=password.scrypt_block_size,
+            parallelism=password.scrypt_parallelism,
+        ),
+    )
+
+
+def run_algorithm(
+    config: PasswordHashConfig,
+    bcrypt_rounds: int,
+    n_logins: int,
+    n_threads: int,
+) -> AlgorithmResult:
+    hasher = get_dispatching_password_hasher(
+        config,
+        PasswordPepper("Pepper"),
+        BcryptRounds(bcrypt_rounds),
+    )
+    raw_password = RawPassword("benchmark-password")
+    hashed_password = hasher.hash(raw_password)
+
+    def verify() -> float:
+        started_at = perf_counter()
+        hasher.verify(raw_password=raw_password, hashed_password=hashed_password)
+        return (perf_counter() - started_at) * 1000
+
+    started_at = perf_counter()
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        latencies_ms = sorted(executor.map(lambda _: verify(), range(n_logins)))
+    elapsed_s = perf_counter() - started_at
+
+    return AlgorithmResult(
+        logins_per_s=n_logins / elapsed_s,
+        p50_ms=statistics.median(latencies_ms),
+        p99_ms=latencies_ms[int(len(latencies_ms) * 0.99) - 1],
+        # Kilobytes on Linux.
+        peak_rss_mib=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    )
+
+
+def main(n_logins: int, n_threads: int) -> None:
+    bcrypt_rounds = load_settings().security.password.bcrypt_rounds
+    print(f"{n_logins} concurrent verifications on {n_threads} threads:")
+    for algorithm in PasswordHashAlgorithm:
+        config = load_password_hash_config(algorithm)
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as process:
+            result = process.submit(
+                run_algorithm,
+                config,
+                bcrypt_rounds,
+                n_logins,
+                n_threads,
+            ).result()
+        print(
+            f"{algorithm.value:<9} {result.logins_per_s:8.1f} logins/s  "
+            f"p50 {result.p50_ms:7.1f} ms  p99 {result.p99_ms:7.1f} ms  "
+            f"peak RSS {result.peak_rss_mib:7.1f} MiB",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 4)
+    args = parser.parse_args()
+    main(args.logins, args.threads)
@@ -0,0 +1,102 @@
+"""
+Throughput of concurrent password verification and the event loop lag it causes,
+hashing inline on the loop, in the thread pool, and in the process pool.
+
+    python -m tests.app.performance.benchmark_password_hasher_pools --logins 64
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+from collections.abc import Awaitable, Callable
+from time import perf_counter
+
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.adapters.password_hasher_bcrypt import (
+    BcryptPasswordHasher,
+    BcryptRounds,
+)
+from app.infrastructure.adapters.password_hasher_pooled import (
+    PasswordHasherExecutor,
+    PasswordHasherPool,
+    PasswordHasherPoolConfig,
+    PooledPasswordHasher,
+)
+from app.infrastructure.adapters.password_pepper import PasswordPepper
+
+LAG_PROBE_INTERVAL_S = 0.005
+
+
+async def probe_loop_lag(lags: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected_at = loop.time() + LAG_PROBE_INTERVAL_S
+        await asyncio.sleep(LAG_PROBE_INTERVAL_S)
+        lags.append(max(0.0, loop.time() - expected_at))
+
+
+async def measure(
+    label: str,
+    verify: Callable[[], Awaitable[bool]],
+    n_logins: int,
+) -> None:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(lags, stop))
+
+    started_at = perf_counter()
+    await asyncio.gather(*(verify() for _ in range(n_logins)))
+    elapsed_s = perf_counter() - started_at
+
+    stop.set()
+    await probe
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    print(
+        f"{label:<10} {n_logins / elapsed_s:8.1f} logins/s  "
+        f"loop lag p50 {statistics.median(lags_ms):7.1f} ms  "
+        f"max {lags_ms[-1]:7.1f} ms",
+    )
+
+
+async def main(n_logins: int, max_workers: int) -> None:
+    blocking_hasher = BcryptPasswordHasher(PasswordPepper("Pepper"), BcryptRounds(12))
+    raw_password = RawPassword("benchmark-password")
+    hashed_password = blocking_hasher.hash(raw_password)
+
+    async def verify_inline() -> bool:  # noqa: RUF029  # blocks the loop on purpose
+        return blocking_hasher.verify(
+            raw_password=raw_password,
+            hashed_password=hashed_password,
+        )
+
+    await measure("inline", verify_inline, n_logins)
+
+    for executor in PasswordHasherExecutor:
+        pool = PasswordHasherPool(
+            PasswordHasherPoolConfig(
+                executor=executor,
+                max_workers=max_workers,
+                max_concurrency=max_workers,
+                max_waiting=n_logins,
+            ),
+        )
+        await pool.run()
+        hasher = PooledPasswordHasher(blocking_hasher, pool)
+
+        async def verify_pooled(hasher: PooledPasswordHasher = hasher) -> bool:
+            return await hasher.verify(
+                raw_password=raw_password,
+                hashed_password=hashed_password,
+            )
+
+        await measure(executor.value, verify_pooled, n_logins)
+        await pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.workers))
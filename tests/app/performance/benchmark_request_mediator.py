@@ -0,0 +1,186 @@
+"""
+Per-request cost of getting a mediator and sending one request through it:
+- per request: a diator mediator built in each request, as `get_mediator` used to;
+- diator dispatch: one diator mediator per app, resolving handlers through
+its request map and a container adapter reading the request's container
+from a context variable;
+- dispatch table: `RequestMediator` over the app's `AppMediator`.
+
+The handler does nothing, so the difference is the mediator's own overhead.
+Both variants run inside an already open request scope.
+
+    python -m tests.app.performance.benchmark_request_mediator --requests 100000
+"""
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from collections.abc import Callable
+from contextvars import ContextVar
+from time import perf_counter
+
+from diator.events import EventEmitter, EventMap
+from diator.mediator import Mediator
+from diator.middlewares import MiddlewareChain
+from diator.requests import Request, RequestHandler, RequestMap
+from dishka import AsyncContainer, Provider, Scope, make_async_container, provide
+
+from app.infrastructure.diator.dispatch import HandlerDispatchTable
+from app.infrastructure.diator.request_scope import (
+    AppMediator,
+    RequestMediator,
+    RequestScopedContainer,
+)
+
+_request_container: ContextVar[AsyncContainer] = ContextVar("request_container")
+
+
+class Ping(Request):
+    pass
+
+
+class PingHandler(RequestHandler[Ping, None]):
+    async def handle(self, request: Ping) -> None:
+        pass
+
+
+class PingProvider(Provider):
+    handler = provide(PingHandler, scope=Scope.REQUEST)
+
+
+class AttachedContainer:
+    """Stands in for `diator.containers.dishka.DishkaContainer`."""
+
+    def __init__(self) -> None:
+        self._external_container: AsyncContainer | None = None
+
+    @property
+    def external_container(self) -> AsyncContainer:
+        assert self._external_container is not None
+        return self._external_container
+
+    def attach_external_container(self, container: AsyncContainer) -> None:
+        self._external_container = container
+
+    async def resolve[T](self, type_: type[T]) -> T:
+        return await self.external_container.get(type_)
+
+
+class ContextContainer(AttachedContainer):
+    @property
+    def external_container(self) -> AsyncContainer:
+        return _request_container.get()
+
+
+class ContextMediator(Mediator):
+    def __init__(self, mediator: Mediator, container: AsyncContainer):
+        self._mediator = mediator
+        self._container = container
+
+    async def send(self, request: Request) -> None:
+        token = _request_container.set(self._container)
+        try:
+            await self._mediator.send(request)
+        finally:
+            _request_container.reset(token)
+
+
+def create_request_map() -> RequestMap:
+    request_map = RequestMap()
+    request_map.bind(Ping, PingHandler)
+    return request_map
+
+
+def build_per_request(
+    request_map: RequestMap,
+    event_map: EventMap,
+    container: AsyncContainer,
+) -> Mediator:
+    dishka = AttachedContainer()
+    dishka.attach_external_container(container)
+    event_emitter = EventEmitter(
+        event_map=event_map,
+        container=dishka,
+        message_broker=None,
+    )
+    return Mediator(
+        request_map=request_map,
+        event_emitter=event_emitter,
+        container=dishka,
+        middleware_chain=MiddlewareChain(),
+    )
+
+
+def measure_retained_bytes(build: Callable[[], object], n: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [build() for _ in range(n)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return (after - before) / n
+
+
+async def measure_latency(build: Callable[[], Mediator], n: int) -> float:
+    for _ in range(min(n, 1000)):
+        await build().send(Ping())
+    started_at = perf_counter()
+    for _ in range(n):
+        await build().send(Ping())
+    return (perf_counter() - started_at) / n
+
+
+async def main(n_requests: int) -> None:
+    request_map = create_request_map()
+    event_map = EventMap()
+    diator_mediator = Mediator(
+        request_map=request_map,
+        event_emitter=EventEmitter(
+            event_map=event_map,
+            container=ContextContainer(),
+            message_broker=None,
+        ),
+        container=ContextContainer(),
+        middleware_chain=MiddlewareChain(),
+    )
+    app_mediator = AppMediator(
+        dispatch_table=HandlerDispatchTable({Ping: PingHandler}, event_map),
+        middleware_chain=MiddlewareChain(),
+        event_emitter=EventEmitter(
+            event_map=event_map,
+            container=RequestScopedContainer(),
+            message_broker=None,
+        ),
+    )
+    container = make_async_container(PingProvider())
+
+    async with container() as request_container:
+        variants: dict[str, Callable[[], Mediator]] = {
+            "per request": lambda: build_per_request(
+                request_map,
+                event_map,
+                request_container,
+            ),
+            "diator dispatch": lambda: ContextMediator(
+                diator_mediator,
+                request_container,
+            ),
+            "dispatch table": lambda: RequestMediator(app_mediator, request_container),
+        }
+        for label, build in variants.items():
+            bytes_per_request = measure_retained_bytes(build, n_requests)
+            latency_s = await measure_latency(build, n_requests)
+            print(
+                f"{label:<16} {latency_s * 1e6:7.2f} us/request  "
+                f"{bytes_per_request:8.0f} B retained per mediator",
+            )
+    await container.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,129 @@
+"""
+Pool occupancy and throughput of concurrent authenticated write requests,
+with Main and Auth sessions on separate connections and on a shared one.
+
+Each simulated request reads on the auth session, writes and commits
+on the main session, then extends the auth session and commits it,
+as `LogInHandler` and session extension do.
+
+Runs against the configured Postgres in a scratch schema, which is dropped after:
+    python -m tests.app.performance.benchmark_shared_connection --requests 2000
+"""
+
+import argparse
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from time import perf_counter
+
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.infrastructure.persistence_sqla.config import SqlaEngineConfig
+from app.infrastructure.persistence_sqla.pool_telemetry import (
+    InstrumentedAsyncAdaptedQueuePool,
+)
+from app.infrastructure.persistence_sqla.provider import (
+    get_async_session_factory,
+    get_request_session_factory,
+)
+from app.infrastructure.persistence_sqla.shared_connection import (
+    SharedRequestConnection,
+)
+from app.setup.config.settings import load_settings
+
+SCHEMA = "bench_shared_connection"
+POOL_SIZE = 10
+MAX_OVERFLOW = 0
+POOL_TIMEOUT_S = 5
+
+
+async def seed(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.execute(text("CREATE TABLE counters (id int PRIMARY KEY, n int)"))
+        await conn.execute(
+            text("INSERT INTO counters SELECT g, 0 FROM generate_series(1, 1000) AS g"),
+        )
+
+
+async def simulate_request(
+    engine: AsyncEngine,
+    engine_config: SqlaEngineConfig,
+    i: int,
+) -> None:
+    request_session_factory = asynccontextmanager(get_request_session_factory)
+    async with (
+        request_session_factory(
+            engine,
+            engine_config,
+            get_async_session_factory(engine),
+            SharedRequestConnection(),
+        ) as session_factory,
+        session_factory() as auth_session,
+    ):
+        await auth_session.execute(text("SELECT pg_sleep(0.002)"))
+        async with session_factory() as main_session:
+            await main_session.execute(
+                text("UPDATE counters SET n = n + 1 WHERE id = :id"),
+                {"id": i % 1000 + 1},
+            )
+            await main_session.commit()
+        await auth_session.execute(text("SELECT pg_sleep(0.002)"))
+        await auth_session.commit()
+
+
+async def run(dsn: str, engine_config: SqlaEngineConfig, n_requests: int) -> None:
+    engine = create_async_engine(
+        dsn,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT_S,
+        connect_args={"options": f"-c search_path={SCHEMA}"},
+    )
+    pool = engine.sync_engine.pool
+    assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+    telemetry = pool.telemetry
+    try:
+        await seed(engine)
+        started_at = perf_counter()
+        results = await asyncio.gather(
+            *(simulate_request(engine, engine_config, i) for i in range(n_requests)),
+            return_exceptions=True,
+        )
+        elapsed_s = perf_counter() - started_at
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+    timeouts = sum(isinstance(result, PoolTimeoutError) for result in results)
+    failures = sum(isinstance(result, BaseException) for result in results) - timeouts
+    label = "shared" if engine_config.share_connection else "separate"
+    print(
+        f"{label:>8}: {n_requests / elapsed_s:7.1f} req/s, "
+        f"peak {telemetry.peak_checked_out}/{POOL_SIZE + MAX_OVERFLOW} connections, "
+        f"{telemetry.checkouts} checkouts, {timeouts} pool timeouts, "
+        f"{failures} other failures",
+    )
+
+
+async def main(n_requests: int) -> None:
+    settings = load_settings()
+    engine_config = SqlaEngineConfig(**settings.sqla.model_dump())
+    for share_connection in (False, True):
+        await run(
+            settings.postgres.dsn,
+            replace(engine_config, share_connection=share_connection),
+            n_requests,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,152 @@
+"""
+Latency of the user list page at increasing depths, by offset and by cursor,
+for each sorting field, through `SqlaUserReader`.
+
+Runs against the configured Postgres in a scratch schema, which is dropped after:
+    python -m tests.app.performance.benchmark_user_list_pagination --users 10000000
+"""
+
+import argparse
+import asyncio
+import statistics
+from collections.abc import Awaitable, Callable
+from functools import partial
+from time import perf_counter
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from app.application.common.query_params.pagination import (
+    KeysetPagination,
+    Pagination,
+)
+from app.application.common.query_params.sorting import SortingOrder
+from app.application.common.query_params.user import (
+    UserListKeysetParams,
+    UserListParams,
+    UserListSorting,
+)
+from app.infrastructure.adapters.types import QueryAsyncSession
+from app.infrastructure.adapters.user_reader_sqla import (
+    SqlaUserReader,
+    encode_keyset_cursor,
+)
+from app.setup.config.settings import load_settings
+
+SCHEMA = "bench_user_list"
+PAGE_SIZE = 20
+SORTING_FIELDS = ("username", "role", "is_active")
+REPEATS = 5
+
+
+async def seed(conn: AsyncConnection, n_users: int) -> None:
+    await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    await conn.execute(text(f"SET search_path TO {SCHEMA}"))
+    await conn.execute(
+        text("CREATE TYPE userrole AS ENUM ('SUPER_ADMIN', 'ADMIN', 'USER')"),
+    )
+    await conn.execute(
+        text(
+            "CREATE TABLE users ("
+            "id uuid PRIMARY KEY, "
+            "username varchar(20) NOT NULL UNIQUE, "
+            "password_hash bytea NOT NULL, "
+            "role userrole NOT NULL, "
+            "is_active boolean NOT NULL)",
+        ),
+    )
+    await conn.execute(
+        text(
+            "INSERT INTO users "
+            "SELECT gen_random_uuid(), 'user' || g, '\\x00', "
+            "CASE WHEN g % 100 = 0 THEN 'ADMIN' ELSE 'USER' END::userrole, "
+            "g % 10 <> 0 "
+            "FROM generate_series(1, :n) AS g",
+        ),
+        {"n": n_users},
+    )
+    await conn.execute(text("CREATE INDEX ix_users_role_id ON users (role, id)"))
+    await conn.execute(
+        text("CREATE INDEX ix_users_is_active_id ON users (is_active, id)"),
+    )
+    await conn.execute(text("ANALYZE users"))
+
+
+async def time_ms(coro_factory: Callable[[], Awaitable[object]]) -> float:
+    timings_ms = []
+    for _ in range(REPEATS):
+        started_at = perf_counter()
+        await coro_factory()
+        timings_ms.append((perf_counter() - started_at) * 1000)
+    return statistics.median(timings_ms)
+
+
+async def benchmark_field(
+    session: AsyncSession,
+    field: str,
+    depths: list[int],
+) -> None:
+    reader = SqlaUserReader(QueryAsyncSession(session))
+    sorting = UserListSorting(sorting_field=field, sorting_order=SortingOrder.ASC)
+    print(f"\n--- sorted by {field} ---")
+    print(f"{'depth':>10} {'offset ms':>10} {'cursor ms':>10}")
+
+    for depth in depths:
+        offset_params = UserListParams(
+            pagination=Pagination(limit=PAGE_SIZE, offset=depth),
+            sorting=sorting,
+        )
+        offset_ms = await time_ms(partial(reader.read_all, offset_params))
+
+        # The cursor a client would hold after paging down to `depth`.
+        previous = await reader.read_all(
+            UserListParams(
+                pagination=Pagination(limit=1, offset=max(depth - 1, 0)),
+                sorting=sorting,
+            ),
+        )
+        assert previous
+        last = previous[0]
+        sorting_key = last["id_"] if field == "id" else last[field]  # type: ignore[literal-required]
+        cursor = encode_keyset_cursor(sorting, sorting_key, last["id_"])
+        cursor_params = UserListKeysetParams(
+            pagination=KeysetPagination(limit=PAGE_SIZE, cursor=cursor),
+            sorting=sorting,
+        )
+        cursor_ms = await time_ms(partial(reader.read_page, cursor_params))
+
+        print(f"{depth:>10} {offset_ms:>10.1f} {cursor_ms:>10.1f}")
+
+
+async def main(n_users: int) -> None:
+    settings = load_settings()
+    engine = create_async_engine(settings.postgres.dsn)
+    depths = sorted({
+        depth
+        for depth in (1, 1_000, 100_000, 1_000_000, n_users - PAGE_SIZE)
+        if 0 < depth < n_users
+    })
+    try:
+        async with engine.connect() as conn:
+            started_at = perf_counter()
+            await seed(conn, n_users)
+            await conn.commit()
+            print(f"Seeded {n_users} users in {perf_counter() - started_at:.1f} s.")
+
+            session = AsyncSession(bind=conn)
+            for field in SORTING_FIELDS:
+                await benchmark_field(session, field, depths)
+            await session.close()
+
+            await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+            await conn.commit()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=10_000_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.users))
@@ -3,8 +3,9 @@ from line_profiler import LineProfiler
 from app.domain.value_objects.raw_password.raw_password import RawPassword
 from app.infrastructure.adapters.password_hasher_bcrypt import (
     BcryptPasswordHasher,
-    PasswordPepper,
+    BcryptRounds,
 )
+from app.infrastructure.adapters.password_pepper import PasswordPepper
 
 
 def profile_password_hashing(hasher: BcryptPasswordHasher) -> None:
@@ -15,7 +16,7 @@ def profile_password_hashing(hasher: BcryptPasswordHasher) -> None:
 
 def main() -> None:
     pepper = PasswordPepper("Cayenne!")
-    hasher = BcryptPasswordHasher(pepper)
+    hasher = BcryptPasswordHasher(pepper, BcryptRounds(12))
 
     profiler = LineProfiler()
     profiler.add_function(profile_password_hashing)
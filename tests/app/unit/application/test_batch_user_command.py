@@ -0,0 +1,247 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("diator.responses")
+
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.flusher import Flusher
+from app.application.common.ports.query_cache_invalidator import (
+    QueryCacheInvalidator,
+)
+from app.application.common.ports.uow import AsyncBaseUnitOfWork
+from app.application.common.ports.user_command_gateway import (
+    UserCommandGateway,
+)
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.services.current_user import (
+    CurrentUserService,
+)
+from app.application.features.user.commands.activate import (
+    ActivateUserCommand,
+)
+from app.application.features.user.commands.batch import (
+    BatchItemResult,
+    BatchItemStatus,
+    BatchMode,
+    BatchUserCommand,
+    BatchUserCommandHandler,
+    BatchUserCommandItem,
+)
+from app.application.features.user.commands.create import (
+    CreateUserCommand,
+)
+from app.application.features.user.commands.deactivate import (
+    DeactivateUserCommand,
+)
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.exceptions.user import UsernameAlreadyExistsError
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.ports.user_id_generator import UserIdGenerator
+from app.domain.services.user import UserService
+from tests.app.unit.factories.user_entity import create_user
+from tests.app.unit.factories.value_objects import create_username
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Ports:
+    user_command_gateway: MagicMock
+    flusher: MagicMock
+    uow: MagicMock
+    access_revoker: MagicMock
+
+
+def create_sut(
+    subject: User,
+    users: Sequence[User] = (),
+) -> tuple[BatchUserCommandHandler, Ports]:
+    current_user_service = cast(MagicMock, create_autospec(CurrentUserService))
+    current_user_service.get_current_user.return_value = subject
+    user_id_generator = cast(MagicMock, create_autospec(UserIdGenerator))
+    user_id_generator.side_effect = uuid4
+    password_hasher = cast(MagicMock, create_autospec(PasswordHasher))
+    password_hasher.hash.return_value = b"password_hash"
+    ports = Ports(
+        user_command_gateway=cast(MagicMock, create_autospec(UserCommandGateway)),
+        flusher=cast(MagicMock, create_autospec(Flusher)),
+        uow=cast(MagicMock, create_autospec(AsyncBaseUnitOfWork)),
+        access_revoker=cast(MagicMock, create_autospec(AccessRevoker)),
+    )
+    ports.user_command_gateway.read_by_usernames.return_value = list(users)
+    sut = BatchUserCommandHandler(
+        current_user_service=current_user_service,
+        user_service=UserService(user_id_generator, password_hasher),
+        user_command_gateway=ports.user_command_gateway,
+        flusher=ports.flusher,
+        uow=ports.uow,
+        user_counter=cast(MagicMock, create_autospec(UserCounter)),
+        query_cache=cast(MagicMock, create_autospec(QueryCacheInvalidator)),
+        access_revoker=ports.access_revoker,
+    )
+    return sut, ports
+
+
+def create_item(username: str, role: UserRole = UserRole.USER) -> CreateUserCommand:
+    return CreateUserCommand(username=username, password="Good Password", role=role)
+
+
+def statuses(results: Sequence[BatchItemResult]) -> list[BatchItemStatus]:
+    return [result["status"] for result in results]
+
+
+async def handle(
+    sut: BatchUserCommandHandler,
+    items: list[BatchUserCommandItem],
+    mode: BatchMode,
+) -> tuple[bool, list[BatchItemStatus]]:
+    result = await sut.handle(BatchUserCommand(items=items, mode=mode))
+    return result.committed, statuses(result.results)
+
+
+@pytest.mark.asyncio
+async def test_all_or_nothing_rolls_back_and_skips_other_items() -> None:
+    sut, ports = create_sut(create_user(role=UserRole.ADMIN))
+
+    committed, results = await handle(
+        sut,
+        [
+            create_item("alice"),
+            ActivateUserCommand(username="missing"),
+            create_item("bobby"),
+        ],
+        BatchMode.ALL_OR_NOTHING,
+    )
+
+    assert not committed
+    assert results == [
+        BatchItemStatus.SKIPPED,
+        BatchItemStatus.FAILED,
+        BatchItemStatus.SKIPPED,
+    ]
+    cast(AsyncMock, ports.uow.rollback).assert_awaited_once()
+    cast(AsyncMock, ports.uow.commit).assert_not_awaited()
+    ports.user_command_gateway.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_best_effort_commits_items_that_do_not_fail() -> None:
+    existing = create_user(username=create_username("carol"))
+    sut, ports = create_sut(create_user(role=UserRole.ADMIN), [existing])
+
+    committed, results = await handle(
+        sut,
+        [
+            create_item("alice"),
+            ActivateUserCommand(username="missing"),
+            DeactivateUserCommand(username="carol"),
+        ],
+        BatchMode.BEST_EFFORT,
+    )
+
+    assert committed
+    assert results == [
+        BatchItemStatus.DONE,
+        BatchItemStatus.FAILED,
+        BatchItemStatus.DONE,
+    ]
+    ports.user_command_gateway.add.assert_called_once()
+    cast(AsyncMock, ports.uow.commit).assert_awaited_once()
+    cast(
+        AsyncMock, ports.access_revoker.remove_all_user_access
+    ).assert_awaited_once_with(
+        existing.id_,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fails_duplicate_username_within_batch() -> None:
+    sut, ports = create_sut(create_user(role=UserRole.ADMIN))
+
+    committed, results = await handle(
+        sut,
+        [create_item("alice"), create_item("alice")],
+        BatchMode.BEST_EFFORT,
+    )
+
+    assert committed
+    assert results == [BatchItemStatus.DONE, BatchItemStatus.FAILED]
+    ports.user_command_gateway.add.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_does_not_revoke_user_activated_again_in_batch() -> None:
+    existing = create_user(username=create_username("carol"))
+    sut, ports = create_sut(create_user(role=UserRole.ADMIN), [existing])
+
+    committed, results = await handle(
+        sut,
+        [
+            DeactivateUserCommand(username="carol"),
+            ActivateUserCommand(username="carol"),
+        ],
+        BatchMode.ALL_OR_NOTHING,
+    )
+
+    assert committed
+    assert results == [BatchItemStatus.DONE, BatchItemStatus.DONE]
+    assert existing.is_active
+    cast(AsyncMock, ports.access_revoker.remove_all_user_access).assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fails_items_the_subject_is_not_authorized_for() -> None:
+    admin = create_user(username=create_username("carol"), role=UserRole.ADMIN)
+    sut, _ = create_sut(create_user(role=UserRole.ADMIN), [admin])
+
+    committed, results = await handle(
+        sut,
+        [
+            create_item("alice", role=UserRole.ADMIN),
+            DeactivateUserCommand(username="carol"),
+            create_item("bobby"),
+        ],
+        BatchMode.BEST_EFFORT,
+    )
+
+    assert committed
+    assert results == [
+        BatchItemStatus.FAILED,
+        BatchItemStatus.FAILED,
+        BatchItemStatus.DONE,
+    ]
+    assert admin.is_active
+
+
+@pytest.mark.asyncio
+async def test_fails_only_item_whose_username_was_taken_concurrently() -> None:
+    taken = create_user(username=create_username("alice"))
+    sut, ports = create_sut(create_user(role=UserRole.ADMIN))
+    ports.user_command_gateway.read_by_usernames.side_effect = [[], [taken]]
+    ports.flusher.flush.side_effect = [UsernameAlreadyExistsError("alice"), None]
+
+    committed, results = await handle(
+        sut,
+        [create_item("alice"), create_item("bobby")],
+        BatchMode.BEST_EFFORT,
+    )
+
+    assert committed
+    assert results == [BatchItemStatus.FAILED, BatchItemStatus.DONE]
+    cast(AsyncMock, ports.uow.rollback).assert_awaited_once()
+    cast(AsyncMock, ports.uow.commit).assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fails_batch_if_username_is_taken_concurrently_again() -> None:
+    sut, ports = create_sut(create_user(role=UserRole.ADMIN))
+    ports.flusher.flush.side_effect = UsernameAlreadyExistsError("alice")
+
+    with pytest.raises(UsernameAlreadyExistsError):
+        await handle(sut, [create_item("alice")], BatchMode.BEST_EFFORT)
+
+    cast(AsyncMock, ports.uow.commit).assert_not_awaited()
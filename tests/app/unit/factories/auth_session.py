@@ -0,0 +1,17 @@
+from datetime import UTC, datetime, timedelta
+
+from app.domain.value_objects.entity_id import EntityId
+from app.infrastructure.auth.session.model import AuthSession
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+def create_auth_session(
+    auth_session_id: str = "auth_session_id",
+    user_id: EntityId | None = None,
+    expiration: datetime | None = None,
+) -> AuthSession:
+    return AuthSession(
+        id_=auth_session_id,
+        user_id=user_id or create_user_id(),
+        expiration=expiration or datetime.now(tz=UTC) + timedelta(minutes=5),
+    )
@@ -0,0 +1,155 @@
+from datetime import timedelta
+
+import pytest
+
+from app.infrastructure.auth.session import cache as cache_module
+from app.infrastructure.auth.session.cache import (
+    AuthSessionCache,
+    AuthSessionCacheMaxSize,
+    AuthSessionCacheTtl,
+)
+from tests.app.unit.factories.auth_session import create_auth_session
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+def create_auth_session_cache(
+    max_size: int = 10,
+    ttl_sec: float = 30,
+) -> AuthSessionCache:
+    return AuthSessionCache(
+        AuthSessionCacheMaxSize(max_size),
+        AuthSessionCacheTtl(timedelta(seconds=ttl_sec)),
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "monotonic", lambda: now[0])
+    return now
+
+
+def test_returns_copy_of_cached_session() -> None:
+    sut = create_auth_session_cache()
+    auth_session = create_auth_session()
+
+    sut.put(auth_session)
+    cached = sut.get(auth_session.id_)
+
+    assert cached is not None
+    assert cached is not auth_session
+    assert cached.user_id == auth_session.user_id
+    assert cached.expiration == auth_session.expiration
+
+
+def test_counts_hits_and_misses() -> None:
+    sut = create_auth_session_cache()
+    auth_session = create_auth_session()
+
+    sut.get(auth_session.id_)
+    sut.put(auth_session)
+    sut.get(auth_session.id_)
+    sut.get(auth_session.id_)
+
+    assert sut.stats.hits == 2
+    assert sut.stats.misses == 1
+
+
+def test_evicts_least_recently_used_when_full() -> None:
+    sut = create_auth_session_cache(max_size=2)
+    first = create_auth_session("first")
+    second = create_auth_session("second")
+    third = create_auth_session("third")
+
+    sut.put(first)
+    sut.put(second)
+    sut.get(first.id_)
+    sut.put(third)
+
+    assert sut.get(first.id_) is not None
+    assert sut.get(second.id_) is None
+    assert sut.get(third.id_) is not None
+
+
+def test_expires_entries_after_ttl(clock: list[float]) -> None:
+    sut = create_auth_session_cache(ttl_sec=30)
+    auth_session = create_auth_session()
+
+    sut.put(auth_session)
+    clock[0] += 31
+
+    assert sut.get(auth_session.id_) is None
+    assert sut.stats.size == 0
+
+
+def test_invalidated_session_is_not_cached_again(clock: list[float]) -> None:
+    sut = create_auth_session_cache(ttl_sec=30)
+    auth_session = create_auth_session()
+
+    sut.put(auth_session)
+    sut.invalidate(auth_session.id_)
+    sut.put(auth_session)
+
+    assert sut.get(auth_session.id_) is None
+
+    clock[0] += 31
+    sut.put(auth_session)
+
+    assert sut.get(auth_session.id_) is not None
+
+
+def test_forgets_revocations_in_expiry_order(clock: list[float]) -> None:
+    sut = create_auth_session_cache(ttl_sec=30)
+    forgotten, renewed, later = (
+        create_auth_session(auth_session_id) for auth_session_id in ("a", "b", "c")
+    )
+
+    sut.invalidate(forgotten.id_)
+    sut.invalidate(renewed.id_)
+    clock[0] += 20
+    sut.invalidate(renewed.id_)
+    sut.invalidate(later.id_)
+    clock[0] += 11
+    for auth_session in (forgotten, renewed, later):
+        sut.put(auth_session)
+
+    assert sut.get(forgotten.id_) is not None
+    assert sut.get(renewed.id_) is None
+    assert sut.get(later.id_) is None
+
+
+def test_invalidates_all_sessions_of_user() -> None:
+    sut = create_auth_session_cache()
+    user_id = create_user_id()
+    other = create_auth_session("other")
+    sessions = [create_auth_session(f"s{i}", user_id=user_id) for i in range(3)]
+
+    for auth_session in (*sessions, other):
+        sut.put(auth_session)
+    sut.invalidate_user(user_id)
+
+    assert all(sut.get(s.id_) is None for s in sessions)
+    assert sut.get(other.id_) is not None
+
+
+def test_discarded_session_can_be_cached_again() -> None:
+    sut = create_auth_session_cache()
+    auth_session = create_auth_session()
+
+    sut.put(auth_session)
+    sut.discard(auth_session.id_)
+
+    assert sut.get(auth_session.id_) is None
+
+    sut.put(auth_session)
+
+    assert sut.get(auth_session.id_) is not None
+
+
+def test_disabled_cache_stores_nothing() -> None:
+    sut = create_auth_session_cache(max_size=0)
+    auth_session = create_auth_session()
+
+    sut.put(auth_session)
+
+    assert sut.get(auth_session.id_) is None
@@ -0,0 +1,63 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.auth.adapters.extension_flusher_sqla import (
+    build_bulk_extension_update,
+)
+from app.infrastructure.auth.session.extension_buffer import (
+    AuthSessionExtensionBuffer,
+    AuthSessionExtensionFlushInterval,
+)
+
+
+def create_extension_buffer(flush_sec: float = 1) -> AuthSessionExtensionBuffer:
+    return AuthSessionExtensionBuffer(
+        AuthSessionExtensionFlushInterval(timedelta(seconds=flush_sec)),
+    )
+
+
+def test_coalesces_extensions_per_session_keeping_latest() -> None:
+    sut = create_extension_buffer()
+    now = datetime.now(tz=UTC)
+
+    sut.schedule("a", now + timedelta(minutes=2))
+    sut.schedule("a", now + timedelta(minutes=5))
+    sut.schedule("a", now + timedelta(minutes=3))
+    sut.schedule("b", now + timedelta(minutes=1))
+
+    assert sut.drain() == {
+        "a": now + timedelta(minutes=5),
+        "b": now + timedelta(minutes=1),
+    }
+    assert len(sut) == 0
+
+
+def test_requeue_does_not_override_newer_extension() -> None:
+    sut = create_extension_buffer()
+    now = datetime.now(tz=UTC)
+    sut.schedule("a", now + timedelta(minutes=1))
+    failed_batch = sut.drain()
+
+    sut.schedule("a", now + timedelta(minutes=2))
+    sut.requeue(failed_batch)
+
+    assert sut.get("a") == now + timedelta(minutes=2)
+
+
+def test_zero_flush_interval_disables_buffer() -> None:
+    assert not create_extension_buffer(flush_sec=0).is_enabled
+
+
+def test_bulk_update_joins_values_list() -> None:
+    now = datetime.now(tz=UTC)
+
+    sql = str(
+        build_bulk_extension_update([("a", now), ("b", now)]).compile(
+            dialect=postgresql.dialect(),  # type: ignore[no-untyped-call]
+        ),
+    )
+
+    assert "UPDATE auth_sessions SET expiration=extensions.expiration" in sql
+    assert "FROM (VALUES" in sql
+    assert "auth_sessions.expiration < extensions.expiration" in sql
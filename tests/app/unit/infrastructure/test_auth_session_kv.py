@@ -0,0 +1,112 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.infrastructure.auth.adapters.data_mapper_kv import (
+    AuthSessionKeyPrefix,
+    KvAuthSessionDataMapper,
+)
+from app.infrastructure.auth.adapters.kv_store import (
+    KvAuthSessionWriteBuffer,
+    KvSetAdd,
+)
+from app.infrastructure.auth.adapters.kv_store_memory import (
+    InMemoryAuthSessionKeyValueStore,
+)
+from app.infrastructure.auth.adapters.transaction_manager_kv import (
+    KvAuthSessionTransactionManager,
+)
+from tests.app.unit.factories.auth_session import create_auth_session
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+def create_kv_gateway(
+    store: InMemoryAuthSessionKeyValueStore,
+) -> tuple[KvAuthSessionDataMapper, KvAuthSessionTransactionManager]:
+    write_buffer = KvAuthSessionWriteBuffer()
+    return (
+        KvAuthSessionDataMapper(store, write_buffer, AuthSessionKeyPrefix("test")),
+        KvAuthSessionTransactionManager(store, write_buffer),
+    )
+
+
+@pytest.mark.asyncio
+async def test_added_session_is_visible_after_commit_only() -> None:
+    store = InMemoryAuthSessionKeyValueStore()
+    sut, tx_manager = create_kv_gateway(store)
+    auth_session = create_auth_session()
+
+    sut.add(auth_session)
+
+    assert await sut.read_by_id(auth_session.id_) is None
+
+    await tx_manager.commit()
+    stored = await sut.read_by_id(auth_session.id_)
+
+    assert stored is not None
+    assert stored.user_id == auth_session.user_id
+    assert stored.expiration == auth_session.expiration
+
+
+@pytest.mark.asyncio
+async def test_expired_session_is_not_returned() -> None:
+    store = InMemoryAuthSessionKeyValueStore()
+    sut, tx_manager = create_kv_gateway(store)
+    auth_session = create_auth_session(
+        expiration=datetime.now(tz=UTC) - timedelta(seconds=1),
+    )
+
+    sut.add(auth_session)
+    await tx_manager.commit()
+
+    assert await sut.read_by_id(auth_session.id_) is None
+
+
+@pytest.mark.asyncio
+async def test_update_does_not_resurrect_deleted_session() -> None:
+    store = InMemoryAuthSessionKeyValueStore()
+    sut, tx_manager = create_kv_gateway(store)
+    auth_session = create_auth_session()
+    sut.add(auth_session)
+    await tx_manager.commit()
+
+    await sut.delete(auth_session.id_)
+    await tx_manager.commit()
+    await sut.update(auth_session)
+    await tx_manager.commit()
+
+    assert await sut.read_by_id(auth_session.id_) is None
+
+
+@pytest.mark.asyncio
+async def test_deletes_all_sessions_of_user_only() -> None:
+    store = InMemoryAuthSessionKeyValueStore()
+    sut, tx_manager = create_kv_gateway(store)
+    user_id = create_user_id()
+    sessions = [create_auth_session(f"s{i}", user_id=user_id) for i in range(3)]
+    other = create_auth_session("other")
+    for auth_session in (*sessions, other):
+        sut.add(auth_session)
+    await tx_manager.commit()
+
+    await sut.delete_all_for_user(user_id)
+    await tx_manager.commit()
+
+    for auth_session in sessions:
+        assert await sut.read_by_id(auth_session.id_) is None
+    assert await sut.read_by_id(other.id_) is not None
+
+
+@pytest.mark.asyncio
+async def test_adding_to_expired_set_does_not_resurrect_its_members() -> None:
+    sut = InMemoryAuthSessionKeyValueStore()
+    now = datetime.now(tz=UTC)
+
+    await sut.execute([
+        KvSetAdd(key="set", member="expired", expire_at=now - timedelta(seconds=1)),
+    ])
+    await sut.execute([
+        KvSetAdd(key="set", member="fresh", expire_at=now + timedelta(minutes=1)),
+    ])
+
+    assert await sut.members("set") == {"fresh"}
@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.auth.adapters.reaper_sqla import (
+    AuthSessionReaperConfig,
+    SqlaAuthSessionReaper,
+)
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_sessions_table,
+)
+
+
+def create_reaper(
+    interval_sec: float = 60, batch_size: int = 500
+) -> SqlaAuthSessionReaper:
+    return SqlaAuthSessionReaper(
+        AuthSessionReaperConfig(
+            interval=timedelta(seconds=interval_sec),
+            batch_size=batch_size,
+        ),
+        session_factory=None,  # type: ignore[arg-type]
+    )
+
+
+def test_batch_delete_is_bounded_and_skips_locked_rows() -> None:
+    sut = create_reaper(batch_size=500)
+
+    stmt = sut._build_batch_delete(  # noqa: SLF001
+        auth_sessions_table,
+        auth_sessions_table.c.expiration,
+    )
+    sql = str(
+        stmt.compile(
+            dialect=postgresql.dialect(),  # type: ignore[no-untyped-call]
+            compile_kwargs={"literal_binds": True},
+        ),
+    )
+
+    assert "WHERE auth_sessions.expiration < now()" in sql
+    assert "LIMIT 500 FOR UPDATE SKIP LOCKED" in sql
+
+
+def test_zero_interval_disables_reaper() -> None:
+    assert not create_reaper(interval_sec=0).is_enabled
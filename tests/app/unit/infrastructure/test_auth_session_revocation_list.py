@@ -0,0 +1,230 @@
+from datetime import UTC, datetime, timedelta
+from math import inf
+
+import pytest
+
+from app.infrastructure.auth.adapters.data_mapper_kv import AuthSessionKeyPrefix
+from app.infrastructure.auth.adapters.kv_store import (
+    KvAuthSessionWriteBuffer,
+    KvSortedSetAdd,
+)
+from app.infrastructure.auth.adapters.kv_store_memory import (
+    InMemoryAuthSessionKeyValueStore,
+)
+from app.infrastructure.auth.adapters.revocation_gateway_kv import (
+    KvAuthSessionRevocationGateway,
+)
+from app.infrastructure.auth.adapters.transaction_manager_kv import (
+    KvAuthSessionTransactionManager,
+)
+from app.infrastructure.auth.session.model import (
+    AuthSessionRevocation,
+    AuthSessionRevocationKind,
+    SignedAuthSession,
+)
+from app.infrastructure.auth.session.revocation_list import (
+    AuthSessionRevocationList,
+    AuthSessionRevocationListConfig,
+    AuthSessionRevocationStatus,
+    AuthSessionStateless,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+def create_signed_session(
+    issued_at: datetime,
+    auth_session_id: str = "auth_session_id",
+) -> SignedAuthSession:
+    return SignedAuthSession(
+        id_=auth_session_id,
+        user_id=create_user_id(),
+        expiration=issued_at + timedelta(hours=1),
+        issued_at=issued_at,
+    )
+
+
+def create_revocation(
+    revoked_at: datetime,
+    key: str = "auth_session_id",
+    ttl: timedelta = timedelta(hours=1),
+) -> AuthSessionRevocation:
+    return AuthSessionRevocation(
+        key=key,
+        kind=AuthSessionRevocationKind.SESSION,
+        revoked_at=revoked_at,
+        expires_at=revoked_at + ttl,
+    )
+
+
+def create_revocation_list(
+    sync_sec: float = 5,
+    exact_max_size: int = 100,
+    bloom_capacity: int = 1000,
+) -> AuthSessionRevocationList:
+    return AuthSessionRevocationList(
+        AuthSessionRevocationListConfig(
+            sync_interval=timedelta(seconds=sync_sec),
+            compaction_interval=timedelta(minutes=10),
+            bloom_capacity=bloom_capacity,
+            bloom_error_rate=0.001,
+            exact_max_size=exact_max_size,
+        ),
+        AuthSessionStateless(True),
+    )
+
+
+def test_user_revocation_rejects_only_tokens_issued_before_it() -> None:
+    now = datetime.now(tz=UTC)
+    sut = create_revocation_list()
+    older = create_signed_session(issued_at=now - timedelta(minutes=1))
+    newer = create_signed_session(issued_at=now + timedelta(minutes=1))
+
+    sut.add(
+        AuthSessionRevocation(
+            key=str(older.user_id.value),
+            kind=AuthSessionRevocationKind.USER,
+            revoked_at=now,
+            expires_at=now + timedelta(hours=1),
+        ),
+    )
+
+    assert sut.check(older) == AuthSessionRevocationStatus.REVOKED
+    assert sut.check(newer) == AuthSessionRevocationStatus.NOT_REVOKED
+
+
+def test_evicted_session_is_reported_as_unknown() -> None:
+    now = datetime.now(tz=UTC)
+    sut = create_revocation_list(exact_max_size=1)
+    evicted = create_signed_session(issued_at=now, auth_session_id="evicted")
+    kept = create_signed_session(issued_at=now, auth_session_id="kept")
+
+    sut.add_session(evicted.id_, evicted.expiration)
+    sut.add_session(kept.id_, kept.expiration)
+
+    assert sut.check(kept) == AuthSessionRevocationStatus.REVOKED
+    assert sut.check(evicted) == AuthSessionRevocationStatus.UNKNOWN
+    assert (
+        sut.check(create_signed_session(issued_at=now, auth_session_id="other"))
+        == AuthSessionRevocationStatus.NOT_REVOKED
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_picks_up_revocations_committed_elsewhere() -> None:
+    now = datetime.now(tz=UTC)
+    store = InMemoryAuthSessionKeyValueStore()
+    write_buffer = KvAuthSessionWriteBuffer()
+    gateway = KvAuthSessionRevocationGateway(
+        store,
+        write_buffer,
+        AuthSessionKeyPrefix("test"),
+    )
+    signed_session = create_signed_session(issued_at=now)
+    sut = create_revocation_list(sync_sec=0)
+
+    await gateway.add(
+        AuthSessionRevocation(
+            key=signed_session.id_,
+            kind=AuthSessionRevocationKind.SESSION,
+            revoked_at=now,
+            expires_at=signed_session.expiration,
+        ),
+    )
+    await KvAuthSessionTransactionManager(store, write_buffer).commit()
+    await sut.sync_if_stale(gateway)
+
+    assert sut.check(signed_session) == AuthSessionRevocationStatus.REVOKED
+
+
+class RecordingRevocationGateway:
+    def __init__(self, revocations: list[AuthSessionRevocation]):
+        self._revocations = revocations
+        self.read_since_calls: list[datetime] = []
+
+    async def add(self, revocation: AuthSessionRevocation) -> None:
+        self._revocations.append(revocation)
+
+    async def read_since(
+        self,
+        since: datetime,
+    ) -> list[AuthSessionRevocation]:
+        self.read_since_calls.append(since)
+        return [
+            revocation
+            for revocation in self._revocations
+            if revocation.revoked_at > since
+        ]
+
+
+@pytest.mark.asyncio
+async def test_saturated_filter_is_grown_instead_of_reloaded_on_every_sync() -> None:
+    now = datetime.now(tz=UTC)
+    keys = [f"auth_session_{i}" for i in range(5)]
+    gateway = RecordingRevocationGateway([
+        create_revocation(now - timedelta(minutes=1), key) for key in keys
+    ])
+    sut = create_revocation_list(sync_sec=0, exact_max_size=3, bloom_capacity=2)
+
+    await sut.sync_if_stale(gateway)
+    await sut.sync_if_stale(gateway)
+    await sut.sync_if_stale(gateway)
+
+    epoch = datetime.min.replace(tzinfo=UTC)
+    assert gateway.read_since_calls[0] == epoch
+    assert epoch not in gateway.read_since_calls[1:]
+    assert all(
+        sut.check(create_signed_session(issued_at=now, auth_session_id=key))
+        != AuthSessionRevocationStatus.NOT_REVOKED
+        for key in keys
+    )
+
+
+@pytest.mark.asyncio
+async def test_gateway_reads_only_live_revocations_made_since() -> None:
+    now = datetime.now(tz=UTC)
+    store = InMemoryAuthSessionKeyValueStore()
+    write_buffer = KvAuthSessionWriteBuffer()
+    sut = KvAuthSessionRevocationGateway(
+        store,
+        write_buffer,
+        AuthSessionKeyPrefix("test"),
+    )
+    old = create_revocation(now - timedelta(minutes=2), key="old")
+    new = create_revocation(now, key="new")
+    expired = create_revocation(
+        now - timedelta(hours=2),
+        key="expired",
+        ttl=timedelta(hours=1),
+    )
+
+    for revocation in (old, new, expired):
+        await sut.add(revocation)
+    await KvAuthSessionTransactionManager(store, write_buffer).commit()
+
+    assert await sut.read_since(now - timedelta(minutes=1)) == [new]
+    assert await sut.read_since(now - timedelta(days=1)) == [old, new]
+    for key in ("test:revocations:by_time", "test:revocations:by_expiry"):
+        assert len(await store.range_by_score(key, above=-inf)) == 2
+
+
+@pytest.mark.asyncio
+async def test_gateway_wraps_undecodable_revocations() -> None:
+    now = datetime.now(tz=UTC)
+    store = InMemoryAuthSessionKeyValueStore()
+    sut = KvAuthSessionRevocationGateway(
+        store,
+        KvAuthSessionWriteBuffer(),
+        AuthSessionKeyPrefix("test"),
+    )
+    await store.execute([
+        KvSortedSetAdd(
+            key="test:revocations:by_time",
+            member="not json",
+            score=now.timestamp(),
+            expire_at=now + timedelta(hours=1),
+        ),
+    ])
+
+    with pytest.raises(DataMapperError):
+        await sut.read_since(now - timedelta(minutes=1))
@@ -0,0 +1,128 @@
+from collections.abc import Iterator
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import Engine, create_engine, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.domain.entities.user import User
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.auth.adapters.data_mapper_sqla import (
+    SqlaAuthSessionDataMapper,
+)
+from app.infrastructure.auth.adapters.types import AuthAsyncSession
+from app.infrastructure.auth.session.extension_buffer import (
+    AuthSessionExtensionBuffer,
+    AuthSessionExtensionFlushInterval,
+)
+from app.infrastructure.auth.session.revocation_list import (
+    AuthSessionRevocationList,
+    AuthSessionRevocationListConfig,
+    AuthSessionStateless,
+)
+from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+from tests.app.unit.factories.auth_session import create_auth_session
+from tests.app.unit.factories.user_entity import create_user
+from tests.app.unit.factories.value_objects import create_username
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    if inspect(User, raiseerr=False) is None:
+        map_tables()
+    engine = create_engine("sqlite://")
+    mapping_registry.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def create_async_session(engine: Engine) -> AsyncSession:
+    """The async session API, run over a sync SQLite engine."""
+    session = AsyncSession()
+    session.sync_session.bind = engine
+    return session
+
+
+def create_sut(
+    auth_session: AsyncSession,
+    main_session: AsyncSession,
+) -> SqlaAuthSessionDataMapper:
+    return SqlaAuthSessionDataMapper(
+        AuthAsyncSession(auth_session),
+        MainAsyncSession(main_session),
+        AuthSessionRevocationList(
+            AuthSessionRevocationListConfig(
+                sync_interval=timedelta(seconds=5),
+                compaction_interval=timedelta(minutes=10),
+                bloom_capacity=1000,
+                bloom_error_rate=0.001,
+                exact_max_size=100,
+            ),
+            AuthSessionStateless(False),
+        ),
+        AuthSessionExtensionBuffer(AuthSessionExtensionFlushInterval(timedelta(0))),
+    )
+
+
+def seed_user_with_session(engine: Engine) -> tuple[User, str]:
+    user = create_user()
+    auth_session = create_auth_session(user_id=user.id_)
+    with Session(engine, expire_on_commit=False) as session:
+        session.add_all([user, auth_session])
+        session.commit()
+    return user, auth_session.id_
+
+
+@pytest.mark.asyncio
+async def test_reads_session_and_hands_its_user_over_to_main_session(
+    engine: Engine,
+) -> None:
+    user, auth_session_id = seed_user_with_session(engine)
+    auth_session, main_session = (
+        create_async_session(engine),
+        create_async_session(engine),
+    )
+    sut = create_sut(auth_session, main_session)
+
+    read = await sut.read_by_id(auth_session_id)
+
+    assert read is not None
+    assert read.user_id == user.id_
+    assert list(auth_session.identity_map.values()) == [read]
+    # Served from the identity map, without a query.
+    handed_over = list(main_session.identity_map.values())
+    loaded = await main_session.get(User, user.id_.value)
+    assert loaded is not None
+    assert handed_over == [loaded]
+    assert loaded.username == user.username
+
+
+@pytest.mark.asyncio
+async def test_keeps_user_already_loaded_in_main_session(engine: Engine) -> None:
+    user, auth_session_id = seed_user_with_session(engine)
+    auth_session, main_session = (
+        create_async_session(engine),
+        create_async_session(engine),
+    )
+    sut = create_sut(auth_session, main_session)
+    loaded = await main_session.get(User, user.id_.value)
+    assert loaded is not None
+    pending_username = create_username("Bobby")
+    loaded.username = pending_username
+
+    await sut.read_by_id(auth_session_id)
+
+    assert list(main_session.identity_map.values()) == [loaded]
+    assert loaded.username == pending_username
+
+
+@pytest.mark.asyncio
+async def test_returns_none_for_unknown_session(engine: Engine) -> None:
+    seed_user_with_session(engine)
+    main_session = create_async_session(engine)
+    sut = create_sut(create_async_session(engine), main_session)
+
+    assert await sut.read_by_id("unknown") is None
+    assert not main_session.identity_map
@@ -0,0 +1,22 @@
+from app.infrastructure.auth.session.bloom_filter import BloomFilter
+
+
+def test_has_no_false_negatives() -> None:
+    sut = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [f"session-{i}" for i in range(1000)]
+
+    for key in keys:
+        sut.add(key)
+
+    assert all(key in sut for key in keys)
+
+
+def test_false_positive_rate_stays_near_target_at_capacity() -> None:
+    sut = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        sut.add(f"session-{i}")
+
+    false_positives = sum(f"other-{i}" in sut for i in range(10_000))
+
+    assert false_positives < 300
+    assert not sut.is_saturated
@@ -0,0 +1,14 @@
+import pytest
+
+from app.infrastructure.latency_histogram import LatencyHistogram
+
+
+def test_histogram_counts_values_at_or_below_each_bound() -> None:
+    sut = LatencyHistogram(bounds_s=(0.1, 1.0))
+
+    for value_s in (0.05, 0.1, 0.5, 2.0):
+        sut.observe(value_s)
+
+    assert sut.cumulative() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert sut.count == 4
+    assert sut.total_s == pytest.approx(2.65)
@@ -0,0 +1,50 @@
+from typing import cast
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+
+from app.application.common.ports.uow import AsyncBaseUnitOfWork
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.services.user import UserService
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.auth.handlers.log_in import LogInHandler, LogInRequest
+from app.infrastructure.auth.session.service import AuthSessionService
+from app.infrastructure.exceptions.gateway import DataMapperError
+from tests.app.unit.factories.user_entity import create_user
+from tests.app.unit.factories.value_objects import create_username
+
+
+@pytest.mark.asyncio
+async def test_failed_rehash_commit_still_logs_in() -> None:
+    user = create_user(username=create_username("Alice"))
+    user_id = user.id_
+    current_user_service = cast(MagicMock, create_autospec(CurrentUserService))
+    current_user_service.get_current_user.side_effect = AuthenticationError("Anon.")
+    user_command_gateway = cast(MagicMock, create_autospec(UserCommandGateway))
+    user_command_gateway.read_by_username.return_value = user
+    user_service = cast(MagicMock, create_autospec(UserService))
+    user_service.is_password_valid.return_value = True
+    user_service.rehash_password_if_outdated.return_value = True
+    auth_session_service = cast(MagicMock, create_autospec(AuthSessionService))
+    uow = cast(MagicMock, create_autospec(AsyncBaseUnitOfWork))
+    uow.commit.side_effect = DataMapperError("Commit failed.")
+
+    def expire_user() -> None:
+        # As the session does: the next attribute access would reload the row.
+        for field in ("id_", "username", "role", "is_active"):
+            del user.__dict__[field]
+
+    uow.rollback.side_effect = expire_user
+    sut = LogInHandler(
+        current_user_service,
+        user_command_gateway,
+        user_service,
+        auth_session_service,
+        uow,
+    )
+
+    await sut.execute(LogInRequest(username="Alice", password="Good Password!"))
+
+    uow.rollback.assert_awaited_once()
+    auth_session_service.issue_session.assert_awaited_once_with(user_id)
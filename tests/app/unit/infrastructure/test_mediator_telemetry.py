@@ -0,0 +1,80 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from diator.requests import Request
+
+from app.infrastructure.diator.telemetry import (
+    MediatorMetrics,
+    MediatorTelemetryMiddleware,
+)
+from app.infrastructure.diator.tracing import InMemorySpanExporter, SpanStatusCode
+
+
+class Outer(Request):
+    pass
+
+
+class Inner(Request):
+    pass
+
+
+class Failing(Request):
+    pass
+
+
+def create_handle(
+    sut: MediatorTelemetryMiddleware,
+    metrics: MediatorMetrics,
+) -> Callable[[Request], Awaitable[Any]]:
+    async def handle(request: Request) -> str:
+        assert metrics.of(type(request)).in_flight == 1
+        if isinstance(request, Failing):
+            raise ValueError("boom")
+        if isinstance(request, Outer):
+            await sut(Inner(), handle)
+        return "done"
+
+    return handle
+
+
+@pytest.mark.asyncio
+async def test_records_latency_errors_and_in_flight_by_request_type() -> None:
+    metrics = MediatorMetrics()
+    sut = MediatorTelemetryMiddleware(metrics, span_exporter=None)
+    handle = create_handle(sut, metrics)
+
+    assert await sut(Outer(), handle) == "done"
+    with pytest.raises(ValueError, match="boom"):
+        await sut(Failing(), handle)
+
+    by_name = metrics.by_name()
+    assert by_name.keys() == {"Outer", "Inner", "Failing"}
+    assert by_name["Outer"].latency.count == 1
+    assert by_name["Outer"].errors == 0
+    assert by_name["Failing"].errors == 1
+    assert all(m.in_flight == 0 for m in by_name.values())
+
+
+@pytest.mark.asyncio
+async def test_exports_nested_spans() -> None:
+    metrics = MediatorMetrics()
+    exporter = InMemorySpanExporter()
+    sut = MediatorTelemetryMiddleware(metrics, exporter)
+    handle = create_handle(sut, metrics)
+
+    await sut(Outer(), handle)
+    with pytest.raises(ValueError, match="boom"):
+        await sut(Failing(), handle)
+
+    inner, outer, failing = exporter.spans
+    assert (inner.name, outer.name) == ("Inner", "Outer")
+    assert inner.context.trace_id == outer.context.trace_id
+    assert inner.parent_span_id == outer.context.span_id
+    assert outer.parent_span_id is None
+    assert outer.status_code == SpanStatusCode.OK
+    assert outer.start_time_unix_nano <= inner.start_time_unix_nano
+    assert failing.context.trace_id != outer.context.trace_id
+    assert failing.status_code == SpanStatusCode.ERROR
+    assert failing.status_message == "boom"
+    assert failing.attributes["exception.type"] == "ValueError"
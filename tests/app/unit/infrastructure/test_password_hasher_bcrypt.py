@@ -2,13 +2,17 @@ import pytest
 
 from app.infrastructure.adapters.password_hasher_bcrypt import (
     BcryptPasswordHasher,
-    PasswordPepper,
+    BcryptRounds,
 )
+from app.infrastructure.adapters.password_pepper import PasswordPepper
 from tests.app.unit.factories.value_objects import create_raw_password
 
 
-def create_bcrypt_password_hasher(pepper: str = "Habanero!") -> BcryptPasswordHasher:
-    return BcryptPasswordHasher(PasswordPepper(pepper))
+def create_bcrypt_password_hasher(
+    pepper: str = "Habanero!",
+    rounds: int = 4,
+) -> BcryptPasswordHasher:
+    return BcryptPasswordHasher(PasswordPepper(pepper), BcryptRounds(rounds))
 
 
 @pytest.mark.slow
@@ -61,3 +65,28 @@ def test_different_peppers_fail_verification() -> None:
 
     assert hasher1.verify(raw_password=pwd, hashed_password=hashed)
     assert not hasher2.verify(raw_password=pwd, hashed_password=hashed)
+
+
+@pytest.mark.slow
+def test_hashes_with_configured_rounds() -> None:
+    sut = create_bcrypt_password_hasher(rounds=5)
+
+    hashed = sut.hash(create_raw_password())
+
+    assert hashed.startswith(b"$2b$05$")
+    assert not sut.needs_rehash(hashed)
+
+
+@pytest.mark.parametrize(
+    ("hashed", "expected"),
+    [
+        (b"$2b$04$" + b"x" * 53, True),
+        (b"$2b$12$" + b"x" * 53, False),
+        (b"$2b$13$" + b"x" * 53, False),
+        (b"$2a$12$" + b"x" * 53, True),
+    ],
+)
+def test_detects_outdated_hashes(hashed: bytes, expected: bool) -> None:
+    sut = create_bcrypt_password_hasher(rounds=12)
+
+    assert sut.needs_rehash(hashed) is expected
@@ -0,0 +1,61 @@
+import pytest
+
+from app.infrastructure.adapters.password_hasher_bcrypt import BcryptRounds
+from app.infrastructure.adapters.password_hasher_dispatching import (
+    Argon2Params,
+    PasswordHashAlgorithm,
+    PasswordHashConfig,
+    get_dispatching_password_hasher,
+)
+from app.infrastructure.adapters.password_hasher_pooled import (
+    BlockingPasswordHasher,
+)
+from app.infrastructure.adapters.password_hasher_scrypt import ScryptParams
+from app.infrastructure.adapters.password_pepper import PasswordPepper
+from tests.app.unit.factories.value_objects import create_raw_password
+
+
+def create_dispatching_password_hasher(
+    algorithm: PasswordHashAlgorithm,
+) -> BlockingPasswordHasher:
+    config = PasswordHashConfig(
+        algorithm=algorithm,
+        argon2=Argon2Params(time_cost=1, memory_cost_kib=8, parallelism=1),
+        scrypt=ScryptParams(log2_n=4, block_size=8, parallelism=1),
+    )
+    return get_dispatching_password_hasher(
+        config,
+        PasswordPepper("Habanero!"),
+        BcryptRounds(4),
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("old_algorithm", list(PasswordHashAlgorithm))
+@pytest.mark.parametrize("new_algorithm", list(PasswordHashAlgorithm))
+def test_verifies_hashes_of_any_algorithm_and_flags_other_ones_for_rehash(
+    old_algorithm: PasswordHashAlgorithm,
+    new_algorithm: PasswordHashAlgorithm,
+) -> None:
+    pytest.importorskip("argon2")
+    pwd = create_raw_password()
+    old = create_dispatching_password_hasher(old_algorithm)
+    sut = create_dispatching_password_hasher(new_algorithm)
+
+    hashed = old.hash(pwd)
+
+    assert sut.verify(raw_password=pwd, hashed_password=hashed)
+    assert not sut.verify(
+        raw_password=create_raw_password("bruteforce"),
+        hashed_password=hashed,
+    )
+    assert sut.needs_rehash(hashed) is (old_algorithm != new_algorithm)
+
+
+def test_does_not_verify_hash_of_unknown_algorithm() -> None:
+    sut = create_dispatching_password_hasher(PasswordHashAlgorithm.SCRYPT)
+    hashed = b"$pbkdf2-sha256$29000$c2FsdA$a2V5"
+
+    assert not sut.recognizes(hashed)
+    assert not sut.verify(raw_password=create_raw_password(), hashed_password=hashed)
+    assert sut.needs_rehash(hashed)
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.infrastructure.adapters.password_hasher_bcrypt import (
+    BcryptPasswordHasher,
+    BcryptRounds,
+)
+from app.infrastructure.adapters.password_hasher_pooled import (
+    PasswordHasherExecutor,
+    PasswordHasherPool,
+    PasswordHasherPoolConfig,
+    PooledPasswordHasher,
+)
+from app.infrastructure.adapters.password_pepper import PasswordPepper
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from tests.app.unit.factories.value_objects import create_raw_password
+
+
+def create_pool(
+    executor: PasswordHasherExecutor = PasswordHasherExecutor.THREAD,
+    max_workers: int = 2,
+    max_concurrency: int = 1,
+    max_waiting: int = 8,
+) -> PasswordHasherPool:
+    return PasswordHasherPool(
+        PasswordHasherPoolConfig(
+            executor=executor,
+            max_workers=max_workers,
+            max_concurrency=max_concurrency,
+            max_waiting=max_waiting,
+        ),
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "executor",
+    [PasswordHasherExecutor.THREAD, PasswordHasherExecutor.PROCESS],
+)
+async def test_hashes_off_the_event_loop(executor: PasswordHasherExecutor) -> None:
+    pool = create_pool(executor=executor)
+    sut = PooledPasswordHasher(
+        BcryptPasswordHasher(PasswordPepper("Pepper"), BcryptRounds(4)), pool
+    )
+    raw_password = create_raw_password()
+    await pool.run()
+
+    hashed = await sut.hash(raw_password)
+
+    assert await sut.verify(raw_password=raw_password, hashed_password=hashed)
+    assert pool.stats.completed == 2
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_caps_concurrency_and_reports_waiting_callers() -> None:
+    sut = create_pool(max_workers=4, max_concurrency=1)
+    release = threading.Event()
+    first = asyncio.create_task(sut.submit(release.wait))
+    second = asyncio.create_task(sut.submit(release.wait))
+    await asyncio.sleep(0.05)
+
+    stats = sut.stats
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert stats.running == 1
+    assert stats.waiting == 1
+    assert sut.stats.completed == 2
+    await sut.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_callers_beyond_waiting_limit() -> None:
+    sut = create_pool(max_workers=2, max_concurrency=1, max_waiting=1)
+    release = threading.Event()
+    running = asyncio.create_task(sut.submit(release.wait))
+    waiting = asyncio.create_task(sut.submit(release.wait))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(PasswordHasherBusyError):
+        await sut.submit(release.wait)
+
+    release.set()
+    await asyncio.gather(running, waiting)
+    assert sut.stats.rejected == 1
+    assert sut.stats.completed == 2
+    await sut.shutdown()
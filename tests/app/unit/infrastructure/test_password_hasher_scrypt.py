@@ -0,0 +1,65 @@
+import pytest
+
+from app.infrastructure.adapters.password_hasher_scrypt import (
+    ScryptParams,
+    ScryptPasswordHasher,
+)
+from app.infrastructure.adapters.password_pepper import PasswordPepper
+from tests.app.unit.factories.value_objects import create_raw_password
+
+
+def create_scrypt_password_hasher(
+    pepper: str = "Habanero!",
+    log2_n: int = 4,
+) -> ScryptPasswordHasher:
+    return ScryptPasswordHasher(
+        PasswordPepper(pepper),
+        ScryptParams(log2_n=log2_n, block_size=8, parallelism=1),
+    )
+
+
+def test_verifies_correct_password() -> None:
+    sut = create_scrypt_password_hasher()
+    pwd = create_raw_password()
+
+    hashed = sut.hash(pwd)
+
+    assert hashed.startswith(b"$scrypt$ln=4,r=8,p=1$")
+    assert sut.verify(raw_password=pwd, hashed_password=hashed)
+
+
+def test_does_not_verify_incorrect_password() -> None:
+    sut = create_scrypt_password_hasher()
+    hashed = sut.hash(create_raw_password("secure"))
+
+    assert not sut.verify(
+        raw_password=create_raw_password("bruteforce"),
+        hashed_password=hashed,
+    )
+
+
+def test_verifies_with_parameters_stored_in_hash() -> None:
+    pwd = create_raw_password()
+    old = create_scrypt_password_hasher(log2_n=4)
+    sut = create_scrypt_password_hasher(log2_n=5)
+
+    hashed = old.hash(pwd)
+
+    assert sut.verify(raw_password=pwd, hashed_password=hashed)
+    assert sut.needs_rehash(hashed)
+    assert not old.needs_rehash(hashed)
+
+
+@pytest.mark.parametrize(
+    "hashed",
+    [
+        b"$scrypt$ln=4,r=8$c2FsdA$a2V5",
+        b"$scrypt$ln=4,r=8,p=1$c2FsdA",
+        b"$2b$12$" + b"x" * 53,
+    ],
+)
+def test_rejects_malformed_hashes(hashed: bytes) -> None:
+    sut = create_scrypt_password_hasher()
+
+    assert not sut.verify(raw_password=create_raw_password(), hashed_password=hashed)
+    assert sut.needs_rehash(hashed)
@@ -0,0 +1,82 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, exc
+
+from app.infrastructure.persistence_sqla.pool_telemetry import InstrumentedQueuePool
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'db.sqlite'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=1,
+        pool_timeout=0.01,
+        pool_pre_ping=True,
+    )
+    yield engine
+    engine.dispose()
+
+
+def pool_of(engine: Engine) -> InstrumentedQueuePool:
+    pool = engine.pool
+    assert isinstance(pool, InstrumentedQueuePool)
+    return pool
+
+
+def test_gauges_and_checkouts(engine: Engine) -> None:
+    with engine.connect(), engine.connect(), engine.connect():
+        sut = pool_of(engine).snapshot()
+        assert (sut.checked_out, sut.idle, sut.overflow) == (3, 0, 1)
+    with engine.connect():
+        pass
+
+    sut = pool_of(engine).snapshot()
+    # The overflow connection is closed on checkin, the pool being full.
+    assert (sut.size, sut.checked_out, sut.idle) == (2, 0, 2)
+    assert sut.telemetry.checkouts == 4
+    assert sut.telemetry.peak_checked_out == 3
+    assert sut.telemetry.checkout_wait.count == 4
+
+
+def test_counts_checkout_timeouts(engine: Engine) -> None:
+    with (
+        engine.connect(),
+        engine.connect(),
+        engine.connect(),
+        pytest.raises(exc.TimeoutError),
+    ):
+        engine.connect()
+
+    assert pool_of(engine).telemetry.checkout_timeouts == 1
+
+
+def test_counts_pre_ping_failures(
+    engine: Engine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with engine.connect():
+        pass
+    monkeypatch.setattr(engine.dialect, "do_ping", lambda _: False)
+    with engine.connect():
+        pass
+
+    sut = pool_of(engine).telemetry
+    assert sut.pre_ping_failures == 1
+    assert sut.invalidations == 1
+
+
+def test_telemetry_survives_dispose(engine: Engine) -> None:
+    with engine.connect():
+        pass
+    telemetry = pool_of(engine).telemetry
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    assert pool_of(engine).telemetry is telemetry
+    assert telemetry.checkouts == 2
+    assert telemetry.invalidations == 0
@@ -0,0 +1,88 @@
+import logging
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+import pytest
+from diator.requests import Request
+from sqlalchemy import Engine, create_engine, text
+
+from app.infrastructure.diator.query_budget import (
+    QueryBudgetMiddleware,
+    QueryBudgetMode,
+)
+from app.infrastructure.exceptions.query_budget import QueryBudgetExceededError
+from app.infrastructure.persistence_sqla.statement_counter import (
+    track_statements,
+)
+
+
+class Budgeted(Request):
+    pass
+
+
+class Unbudgeted(Request):
+    pass
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    track_statements(engine)
+    yield engine
+    engine.dispose()
+
+
+def create_middleware(mode: QueryBudgetMode) -> QueryBudgetMiddleware:
+    return QueryBudgetMiddleware({Budgeted: 2}, mode)
+
+
+def run_statements(engine: Engine, n: int) -> None:
+    with engine.connect() as conn:
+        for _ in range(n):
+            conn.execute(text("SELECT 1"))
+
+
+def create_handle(
+    engine: Engine,
+    statements: int,
+) -> Callable[[Request], Awaitable[Any]]:
+    async def handle(request: Request) -> str:  # noqa: ARG001, RUF029
+        run_statements(engine, statements)
+        return "done"
+
+    return handle
+
+
+@pytest.mark.asyncio
+async def test_within_budget_returns_response(engine: Engine) -> None:
+    sut = create_middleware(QueryBudgetMode.FAIL)
+
+    assert await sut(Budgeted(), create_handle(engine, 2)) == "done"
+
+
+@pytest.mark.asyncio
+async def test_over_budget_fails(engine: Engine) -> None:
+    sut = create_middleware(QueryBudgetMode.FAIL)
+
+    with pytest.raises(QueryBudgetExceededError):
+        await sut(Budgeted(), create_handle(engine, 3))
+
+
+@pytest.mark.asyncio
+async def test_over_budget_warns(
+    engine: Engine,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    sut = create_middleware(QueryBudgetMode.WARN)
+
+    with caplog.at_level(logging.WARNING):
+        assert await sut(Budgeted(), create_handle(engine, 3)) == "done"
+
+    assert "Budgeted issued 3 SQL statements, budget is 2." in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_request_without_budget_is_not_checked(engine: Engine) -> None:
+    sut = create_middleware(QueryBudgetMode.FAIL)
+
+    await sut(Unbudgeted(), create_handle(engine, 10))
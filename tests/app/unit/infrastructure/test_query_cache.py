@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+import pytest
+from diator.requests import Request
+
+from app.application.common.query_cache import QueryCachePolicy, QueryCacheTag
+from app.infrastructure.diator.query_cache import (
+    InMemoryQueryCacheStore,
+    QueryCacheMaxEntries,
+    QueryCacheMiddleware,
+    StoreQueryCacheInvalidator,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class Page(Request):
+    offset: int
+
+
+class Uncached(Request):
+    pass
+
+
+class Subject:
+    def __init__(self, role: str) -> None:
+        self.role = role
+
+    async def __call__(self) -> str:
+        return self.role
+
+
+class CountingHandle:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self, request: Request) -> list[int]:
+        self.calls += 1
+        return [self.calls]
+
+
+def create_sut(
+    subject: Subject,
+    max_entries: int = 8,
+) -> tuple[QueryCacheMiddleware, StoreQueryCacheInvalidator]:
+    store = InMemoryQueryCacheStore(QueryCacheMaxEntries(max_entries))
+    policies: dict[type[Request], QueryCachePolicy] = {
+        Page: QueryCachePolicy(ttl=timedelta(minutes=1), tags=(QueryCacheTag.USERS,)),
+    }
+    return (
+        QueryCacheMiddleware(policies, store, subject_role=subject),
+        StoreQueryCacheInvalidator(store),
+    )
+
+
+@pytest.mark.asyncio
+async def test_serves_repeated_queries_from_cache_per_key() -> None:
+    sut, _ = create_sut(Subject("admin"))
+    handle = CountingHandle()
+
+    first = await sut(Page(offset=0), handle)
+    assert await sut(Page(offset=0), handle) is first
+    await sut(Page(offset=10), handle)
+    await sut(Uncached(), handle)
+    await sut(Uncached(), handle)
+
+    assert handle.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_keeps_results_per_subject_role() -> None:
+    subject = Subject("admin")
+    sut, _ = create_sut(subject)
+    handle = CountingHandle()
+
+    await sut(Page(offset=0), handle)
+    subject.role = "super_admin"
+    await sut(Page(offset=0), handle)
+    subject.role = "admin"
+    await sut(Page(offset=0), handle)
+
+    assert handle.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidating_a_tag_drops_results_under_it() -> None:
+    sut, invalidator = create_sut(Subject("admin"))
+    handle = CountingHandle()
+
+    await sut(Page(offset=0), handle)
+    await invalidator.invalidate(QueryCacheTag.USERS)
+
+    assert await sut(Page(offset=0), handle) == [2]
+
+
+@pytest.mark.asyncio
+async def test_does_not_serve_results_stored_across_an_invalidation() -> None:
+    sut, invalidator = create_sut(Subject("admin"))
+
+    async def handle_racing_invalidation(_: Request) -> str:
+        await invalidator.invalidate(QueryCacheTag.USERS)
+        return "stale"
+
+    await sut(Page(offset=0), handle_racing_invalidation)
+
+    assert await sut(Page(offset=0), CountingHandle()) == [1]
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used_entries() -> None:
+    sut, _ = create_sut(Subject("admin"), max_entries=2)
+    handle = CountingHandle()
+
+    await sut(Page(offset=0), handle)
+    await sut(Page(offset=1), handle)
+    await sut(Page(offset=0), handle)
+    await sut(Page(offset=2), handle)
+    await sut(Page(offset=0), handle)
+    await sut(Page(offset=1), handle)
+
+    assert handle.calls == 4
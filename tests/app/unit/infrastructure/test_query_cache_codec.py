@@ -0,0 +1,51 @@
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("diator.responses")
+
+from app.application.common.query_models.user import UserQueryModel
+from app.application.features.user.queries.list import (
+    ListUsersQueryResult,
+)
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.diator.query_cache_codec import (
+    decode_query_result,
+    encode_query_result,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+
+def test_round_trips_list_users_result() -> None:
+    result = ListUsersQueryResult(
+        users=[
+            UserQueryModel(
+                id_=uuid4(),
+                username="alice",
+                role=UserRole.ADMIN,
+                is_active=True,
+            ),
+        ],
+        next_cursor="cursor",
+        total=1,
+    )
+
+    assert decode_query_result(encode_query_result(result)) == result
+
+
+def test_refuses_to_encode_unregistered_result() -> None:
+    with pytest.raises(DataMapperError):
+        encode_query_result({"users": []})
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        pytest.param(b"\x80\x04", id="not_json"),
+        pytest.param(b'{"type": "builtins.eval", "result": {}}', id="unknown_type"),
+        pytest.param(b'{"type": "ListUsersQueryResult"}', id="missing_result"),
+    ],
+)
+def test_wraps_undecodable_entries(raw: bytes) -> None:
+    with pytest.raises(DataMapperError):
+        decode_query_result(raw)
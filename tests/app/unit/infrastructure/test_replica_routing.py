@@ -0,0 +1,206 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Engine, create_engine, insert, select, text
+from sqlalchemy.sql.dml import Insert
+
+from app.domain.value_objects.entity_id import EntityId
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+from app.infrastructure.persistence_sqla.replica import (
+    READ_ROUTING_INFO_KEY,
+    ReplicaRouter,
+    ReplicaRoutingConfig,
+    ReplicaRoutingSession,
+    RequestReadRouting,
+)
+
+
+def create_router(
+    *,
+    max_lag_sec: float = 1,
+    read_your_writes_sec: float = 5,
+) -> ReplicaRouter:
+    return ReplicaRouter(
+        ReplicaRoutingConfig(
+            dsn="postgresql+psycopg://replica/db",
+            max_lag=timedelta(seconds=max_lag_sec),
+            lag_check_interval=timedelta(seconds=1),
+            read_your_writes_window=timedelta(seconds=read_your_writes_sec),
+        ),
+    )
+
+
+def create_user_id() -> EntityId:
+    return EntityId(uuid4())
+
+
+def test_prefers_primary_until_lag_is_measured() -> None:
+    sut = create_router()
+
+    assert sut.prefers_primary(None)
+
+    sut.report_lag(0.1)
+    assert not sut.prefers_primary(None)
+
+
+@pytest.mark.parametrize(
+    ("lag_s", "expected"),
+    [
+        pytest.param(0.5, False, id="within_max_lag"),
+        pytest.param(1.5, True, id="over_max_lag"),
+        pytest.param(None, True, id="check_failed"),
+    ],
+)
+def test_prefers_primary_by_lag(lag_s: float | None, expected: bool) -> None:
+    sut = create_router(max_lag_sec=1)
+
+    sut.report_lag(lag_s)
+
+    assert sut.prefers_primary(create_user_id()) is expected
+
+
+def test_reads_own_writes_from_primary_within_window() -> None:
+    sut = create_router()
+    sut.report_lag(0)
+    writer, other = create_user_id(), create_user_id()
+
+    sut.record_write(writer)
+
+    assert sut.prefers_primary(writer)
+    assert not sut.prefers_primary(other)
+
+
+def test_reads_own_writes_from_replica_after_window() -> None:
+    sut = create_router(read_your_writes_sec=0)
+    sut.report_lag(0)
+    writer = create_user_id()
+
+    sut.record_write(writer)
+
+    assert not sut.prefers_primary(writer)
+
+
+class StubIdentity:
+    def __init__(self, user_id: EntityId | None):
+        self.user_id = user_id
+
+    def get_user_id(self) -> EntityId | None:
+        return self.user_id
+
+
+class StubTransport:
+    def __init__(self, window_end: datetime | None = None):
+        self.window_end = window_end
+
+    def deliver(self, window_end: datetime) -> None:
+        self.window_end = window_end
+
+    def extract(self) -> datetime | None:
+        return self.window_end
+
+
+def test_request_routing_reads_back_writes_of_its_user_only() -> None:
+    router = create_router()
+    router.report_lag(0)
+    writer, other = create_user_id(), create_user_id()
+    sut = RequestReadRouting(router, StubIdentity(writer), StubTransport())
+
+    sut.record_write()
+
+    assert sut.prefers_primary()
+    assert not RequestReadRouting(
+        router,
+        StubIdentity(other),
+        StubTransport(),
+    ).prefers_primary()
+    assert not RequestReadRouting(
+        router,
+        StubIdentity(None),
+        StubTransport(),
+    ).prefers_primary()
+
+
+def test_request_routing_carries_window_to_other_workers() -> None:
+    writing_worker, other_worker = create_router(), create_router()
+    writing_worker.report_lag(0)
+    other_worker.report_lag(0)
+    client = StubTransport()
+
+    RequestReadRouting(writing_worker, StubIdentity(None), client).record_write()
+
+    assert client.window_end is not None
+    assert RequestReadRouting(
+        other_worker,
+        StubIdentity(None),
+        client,
+    ).prefers_primary()
+
+
+@pytest.mark.parametrize(
+    "window_end",
+    [
+        pytest.param(datetime.now(UTC) - timedelta(seconds=1), id="ended"),
+        pytest.param(datetime.now(UTC) + timedelta(hours=1), id="beyond_window"),
+    ],
+)
+def test_request_routing_ignores_window_out_of_bounds(window_end: datetime) -> None:
+    router = create_router(read_your_writes_sec=5)
+    router.report_lag(0)
+
+    sut = RequestReadRouting(router, StubIdentity(None), StubTransport(window_end))
+
+    assert not sut.prefers_primary()
+
+
+class StubReadRouting:
+    def __init__(self, *, prefers_primary: bool):
+        self._prefers_primary = prefers_primary
+
+    def prefers_primary(self) -> bool:
+        return self._prefers_primary
+
+
+@pytest.fixture
+def engines() -> Iterator[tuple[Engine, Engine]]:
+    primary, replica = create_engine("sqlite://"), create_engine("sqlite://")
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def create_session(
+    engines: tuple[Engine, Engine],
+    *,
+    prefers_primary: bool,
+) -> ReplicaRoutingSession:
+    primary, replica = engines
+    routing = StubReadRouting(prefers_primary=prefers_primary)
+    return ReplicaRoutingSession(
+        primary=primary,
+        replica=replica,
+        info={READ_ROUTING_INFO_KEY: cast(RequestReadRouting, routing)},
+    )
+
+
+def test_session_routes_reads_to_replica(engines: tuple[Engine, Engine]) -> None:
+    sut = create_session(engines, prefers_primary=False)
+
+    assert sut.get_bind(clause=select(text("1"))) is engines[1]
+
+
+def test_session_routes_reads_to_primary_when_preferred(
+    engines: tuple[Engine, Engine],
+) -> None:
+    sut = create_session(engines, prefers_primary=True)
+
+    assert sut.get_bind(clause=select(text("1"))) is engines[0]
+
+
+def test_session_routes_writes_to_primary(engines: tuple[Engine, Engine]) -> None:
+    sut = create_session(engines, prefers_primary=False)
+    insert_stmt: Insert = insert(users_table)
+
+    assert sut.get_bind(clause=insert_stmt) is engines[0]
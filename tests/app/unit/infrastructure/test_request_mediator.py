@@ -0,0 +1,144 @@
+import pytest
+from diator.events import (
+    DomainEvent,
+    Event,
+    EventEmitter,
+    EventHandler,
+    EventMap,
+)
+from diator.middlewares import MiddlewareChain
+from diator.requests import Request, RequestHandler
+from dishka import Provider, Scope, make_async_container, provide_all
+
+from app.infrastructure.diator.dispatch import HandlerDispatchTable
+from app.infrastructure.diator.request_scope import (
+    AppMediator,
+    RequestMediator,
+    RequestScopedContainer,
+)
+from app.infrastructure.exceptions.mediator import (
+    HandlerNotBoundError,
+    HandlerNotProvidedError,
+)
+
+
+class Ping(Request):
+    pass
+
+
+class Pong(Request):
+    pass
+
+
+class PingHandler(RequestHandler[Ping, None]):
+    def __init__(self) -> None:
+        self.handled = 0
+
+    async def handle(self, request: Ping) -> None:
+        self.handled += 1
+
+
+class PongHandler(RequestHandler[Pong, None]):
+    async def handle(self, request: Pong) -> None:
+        pass
+
+
+class Pinged(DomainEvent):
+    pass
+
+
+class PingedHandler(EventHandler[Pinged]):
+    def __init__(self) -> None:
+        self.handled = 0
+
+    async def handle(self, event: Pinged) -> None:
+        self.handled += 1
+
+
+class EmittingPingHandler(RequestHandler[Ping, None]):
+    def __init__(self) -> None:
+        self._events: list[Event] = []
+
+    @property
+    def events(self) -> list[Event]:
+        return self._events
+
+    async def handle(self, request: Ping) -> None:
+        self._events.append(Pinged())
+
+
+class PingProvider(Provider):
+    handlers = provide_all(
+        PingHandler,
+        EmittingPingHandler,
+        PingedHandler,
+        scope=Scope.REQUEST,
+    )
+
+
+def create_dispatch_table() -> HandlerDispatchTable:
+    return HandlerDispatchTable({Ping: PingHandler}, EventMap())
+
+
+def create_app_mediator() -> AppMediator:
+    return AppMediator(
+        dispatch_table=create_dispatch_table(),
+        middleware_chain=MiddlewareChain(),
+        event_emitter=EventEmitter(EventMap(), RequestScopedContainer()),
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolves_handlers_from_the_bound_request_scope() -> None:
+    container = make_async_container(PingProvider())
+    app_mediator = create_app_mediator()
+
+    async with container() as first, container() as second:
+        await RequestMediator(app_mediator, first).send(Ping())
+        await RequestMediator(app_mediator, first).send(Ping())
+        await RequestMediator(app_mediator, second).send(Ping())
+
+        assert (await first.get(PingHandler)).handled == 2
+        assert (await second.get(PingHandler)).handled == 1
+    await container.close()
+
+
+@pytest.mark.asyncio
+async def test_emits_events_to_handlers_of_the_request_scope() -> None:
+    container = make_async_container(PingProvider())
+    event_map = EventMap()
+    event_map.bind(Pinged, PingedHandler)
+    app_mediator = AppMediator(
+        dispatch_table=HandlerDispatchTable({Ping: EmittingPingHandler}, event_map),
+        middleware_chain=MiddlewareChain(),
+        event_emitter=EventEmitter(event_map, RequestScopedContainer()),
+    )
+
+    async with container() as request_container:
+        await RequestMediator(app_mediator, request_container).send(Ping())
+
+        assert (await request_container.get(PingedHandler)).handled == 1
+    await container.close()
+
+
+@pytest.mark.asyncio
+async def test_request_without_handler_fails() -> None:
+    container = make_async_container(PingProvider())
+
+    async with container() as request_container:
+        sut = RequestMediator(create_app_mediator(), request_container)
+
+        with pytest.raises(HandlerNotBoundError):
+            await sut.send(Pong())
+    await container.close()
+
+
+@pytest.mark.asyncio
+async def test_validates_handlers_are_provided_in_request_scope() -> None:
+    container = make_async_container(PingProvider())
+    sut = HandlerDispatchTable({Ping: PingHandler, Pong: PongHandler}, EventMap())
+
+    create_dispatch_table().validate(container)
+    with pytest.raises(HandlerNotProvidedError, match="PongHandler"):
+        sut.validate(container)
+    await container.close()
@@ -0,0 +1,63 @@
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+
+from app.infrastructure.persistence_sqla.statement_counter import (
+    count_statements,
+    fingerprint_statement,
+    track_statements,
+)
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    track_statements(engine)
+    yield engine
+    engine.dispose()
+
+
+def run_statements(engine: Engine, n: int) -> None:
+    with engine.connect() as conn:
+        for _ in range(n):
+            conn.execute(text("SELECT 1"))
+
+
+def test_records_only_within_scope(engine: Engine) -> None:
+    run_statements(engine, 1)
+
+    with count_statements() as stats:
+        run_statements(engine, 3)
+
+    run_statements(engine, 1)
+    assert stats.statements == 3
+    assert stats.duration_s > 0
+
+
+def test_nested_scope_records_into_enclosing(engine: Engine) -> None:
+    with count_statements() as outer:
+        run_statements(engine, 1)
+        with count_statements() as inner:
+            run_statements(engine, 2)
+
+    assert inner.statements == 2
+    assert outer.statements == 3
+
+
+def test_reports_repeated_statements(engine: Engine) -> None:
+    with count_statements() as stats, engine.connect() as conn:
+        conn.execute(text("SELECT 2"))
+        for i in range(3):
+            conn.execute(text("SELECT :i"), {"i": i})
+
+    assert stats.repeated(3) == {"SELECT ?": 3}
+    assert stats.repeated(4) == {}
+
+
+def test_fingerprint_ignores_in_list_length() -> None:
+    one = "SELECT id FROM users WHERE id IN (%(ids_1_1)s)"
+    three = "SELECT id FROM users\n WHERE id IN (%(ids_1_1)s, %(ids_1_2)s, %(ids_1_3)s)"
+
+    assert fingerprint_statement(one) == fingerprint_statement(three)
+    assert fingerprint_statement(one) == "SELECT id FROM users WHERE id IN (...)"
@@ -0,0 +1,83 @@
+import asyncio
+from datetime import timedelta
+from time import monotonic
+
+import pytest
+
+from app.infrastructure.adapters.user_count_cache import (
+    UserCountCache,
+    UserCountCacheTtl,
+)
+
+
+def create_user_count_cache(ttl_sec: float = 60) -> UserCountCache:
+    return UserCountCache(UserCountCacheTtl(timedelta(seconds=ttl_sec)))
+
+
+def test_fresh_after_set() -> None:
+    sut = create_user_count_cache()
+
+    sut.set(42, counted_at=monotonic())
+
+    assert sut.get() == 42
+    assert not sut.is_stale
+
+
+def test_stale_after_invalidate() -> None:
+    sut = create_user_count_cache()
+    sut.set(42, counted_at=monotonic())
+
+    sut.invalidate()
+
+    assert sut.is_stale
+    assert sut.get() == 42
+
+
+def test_invalidation_during_count_leaves_it_stale() -> None:
+    sut = create_user_count_cache()
+    counted_at = monotonic()
+
+    sut.invalidate()
+    sut.set(42, counted_at=counted_at)
+
+    assert sut.is_stale
+
+
+def test_older_count_does_not_override_newer() -> None:
+    sut = create_user_count_cache()
+    started_first = monotonic()
+    started_second = monotonic() + 1
+
+    sut.set(2, counted_at=started_second)
+    sut.set(1, counted_at=started_first)
+
+    assert sut.get() == 2
+
+
+def test_stale_after_ttl() -> None:
+    sut = create_user_count_cache(ttl_sec=0)
+
+    sut.set(42, counted_at=monotonic() - 1)
+
+    assert sut.is_stale
+
+
+@pytest.mark.asyncio
+async def test_get_on_stale_requests_refresh() -> None:
+    sut = create_user_count_cache()
+    sut.set(42, counted_at=monotonic() - 120)
+
+    sut.get()
+
+    await asyncio.wait_for(sut.wait_for_refresh(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_get_on_fresh_does_not_request_refresh() -> None:
+    sut = create_user_count_cache()
+    sut.set(42, counted_at=monotonic())
+
+    sut.get()
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(sut.wait_for_refresh(), timeout=0.05)
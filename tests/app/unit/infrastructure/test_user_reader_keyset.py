@@ -0,0 +1,99 @@
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Select
+from sqlalchemy.dialects import postgresql
+
+from app.application.common.exceptions.query import PaginationError
+from app.application.common.query_params.sorting import SortingOrder
+from app.application.common.query_params.user import UserListSorting
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.adapters.user_reader_sqla import (
+    build_keyset_select,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
+
+LAST_ID = UUID("01982b4c-5a9e-7c3f-8d2a-6b1e4f0c9a77")
+
+
+def create_sorting(
+    field: str = "username",
+    order: SortingOrder = SortingOrder.ASC,
+) -> UserListSorting:
+    return UserListSorting(sorting_field=field, sorting_order=order)
+
+
+def compile_sql(stmt: Select[tuple[UUID, str, UserRole, bool]]) -> str:
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(),  # type: ignore[no-untyped-call]
+            compile_kwargs={"literal_binds": True},
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    ("field", "sorting_key"),
+    [
+        ("id", LAST_ID),
+        ("username", "alice"),
+        ("role", UserRole.ADMIN),
+        ("is_active", False),
+    ],
+)
+@pytest.mark.parametrize("order", list(SortingOrder))
+def test_cursor_round_trips_sorting_key_and_id(
+    field: str,
+    sorting_key: UUID | str | UserRole | bool,
+    order: SortingOrder,
+) -> None:
+    sorting = create_sorting(field, order)
+
+    cursor = encode_keyset_cursor(sorting, sorting_key, LAST_ID)
+
+    assert decode_keyset_cursor(sorting, cursor) == (sorting_key, LAST_ID)
+
+
+def test_cursor_is_bound_to_its_sorting() -> None:
+    cursor = encode_keyset_cursor(create_sorting("username"), "alice", LAST_ID)
+
+    with pytest.raises(PaginationError):
+        decode_keyset_cursor(create_sorting("username", SortingOrder.DESC), cursor)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["", "not-a-cursor", "W10", "WyJyb2xlIiwiQVNDIiwiR09EIiwiMSJd"],
+)
+def test_rejects_malformed_cursor(cursor: str) -> None:
+    with pytest.raises(PaginationError):
+        decode_keyset_cursor(create_sorting("role"), cursor)
+
+
+def test_first_page_has_no_seek_condition() -> None:
+    sql = compile_sql(build_keyset_select(create_sorting("role"), None))
+
+    assert "WHERE" not in sql
+    assert "ORDER BY users.role ASC, users.id ASC" in sql
+
+
+def test_unique_field_seeks_by_sorting_key_alone() -> None:
+    sorting = create_sorting("username", SortingOrder.DESC)
+    cursor = encode_keyset_cursor(sorting, "alice", LAST_ID)
+
+    sql = compile_sql(build_keyset_select(sorting, cursor))
+
+    assert "WHERE users.username < 'alice'" in sql
+    assert "ORDER BY users.username DESC" in sql
+    assert "OFFSET" not in sql
+
+
+def test_non_unique_field_seeks_by_row_comparison_with_id() -> None:
+    sorting = create_sorting("is_active", SortingOrder.ASC)
+    cursor = encode_keyset_cursor(sorting, True, LAST_ID)
+
+    sql = compile_sql(build_keyset_select(sorting, cursor))
+
+    assert f"(users.is_active, users.id) > (true, '{LAST_ID}')" in sql
+    assert "ORDER BY users.is_active ASC, users.id ASC" in sql
@@ -0,0 +1,119 @@
+from app.infrastructure.adapters.password_hasher_pooled import (
+    HASH_LATENCY_BUCKETS_S,
+    PasswordHasherExecutor,
+    PasswordHasherPoolStats,
+)
+from app.infrastructure.auth.adapters.reaper_sqla import AuthSessionReaperStats
+from app.infrastructure.auth.adapters.store_stats import AuthSessionStoreStats
+from app.infrastructure.auth.session.cache import AuthSessionCacheStats
+from app.infrastructure.diator.telemetry import RequestTypeMetrics
+from app.infrastructure.latency_histogram import LatencyHistogram
+from app.infrastructure.persistence_sqla.pool_telemetry import (
+    PoolSnapshot,
+    PoolTelemetry,
+)
+from app.presentation.http.controllers.general.metrics import (
+    render_auth_session_store_metrics,
+    render_mediator_metrics,
+    render_password_hasher_metrics,
+    render_pool_metrics,
+)
+from app.presentation.http.controllers.general.router import create_general_router
+
+
+def test_renders_gauges_counters_and_histogram() -> None:
+    histogram = LatencyHistogram(bounds_s=(0.01, 0.1))
+    histogram.observe(0.005)
+    histogram.observe(0.05)
+    snapshot = PoolSnapshot(
+        size=5,
+        checked_out=2,
+        idle=3,
+        overflow=0,
+        telemetry=PoolTelemetry(
+            checkouts=2,
+            pre_ping_failures=1,
+            checkout_wait=histogram,
+        ),
+    )
+
+    sut = render_pool_metrics({"primary": snapshot}).splitlines()
+
+    assert "# TYPE sqla_pool_checked_out gauge" in sut
+    assert 'sqla_pool_checked_out{pool="primary"} 2' in sut
+    assert 'sqla_pool_idle{pool="primary"} 3' in sut
+    assert 'sqla_pool_pre_ping_failures_total{pool="primary"} 1' in sut
+    assert 'sqla_pool_checkout_seconds_bucket{pool="primary",le="0.01"} 1' in sut
+    assert 'sqla_pool_checkout_seconds_bucket{pool="primary",le="0.1"} 2' in sut
+    assert 'sqla_pool_checkout_seconds_bucket{pool="primary",le="+Inf"} 2' in sut
+    assert 'sqla_pool_checkout_seconds_count{pool="primary"} 2' in sut
+
+
+def test_renders_mediator_metrics_by_request_type() -> None:
+    metrics = RequestTypeMetrics(in_flight=1, errors=2)
+    metrics.latency.observe(0.02)
+
+    sut = render_mediator_metrics({"ListUsersQuery": metrics}).splitlines()
+
+    assert 'mediator_requests_in_flight{request_type="ListUsersQuery"} 1' in sut
+    assert 'mediator_request_errors_total{request_type="ListUsersQuery"} 2' in sut
+    assert (
+        'mediator_request_duration_seconds_bucket{request_type="ListUsersQuery",'
+        'le="0.025"} 1'
+    ) in sut
+
+
+def test_renders_password_hasher_queue_and_latency() -> None:
+    wait_latency = LatencyHistogram(HASH_LATENCY_BUCKETS_S)
+    wait_latency.observe(0.2)
+    run_latency = LatencyHistogram(HASH_LATENCY_BUCKETS_S)
+    run_latency.observe(0.06)
+    stats = PasswordHasherPoolStats(
+        executor=PasswordHasherExecutor.PROCESS,
+        waiting=3,
+        running=4,
+        completed=1,
+        rejected=2,
+        avg_wait_s=0.2,
+        max_wait_s=0.2,
+        avg_run_s=0.06,
+        wait_latency=wait_latency,
+        run_latency=run_latency,
+    )
+
+    sut = render_password_hasher_metrics(stats).splitlines()
+
+    assert 'password_hasher_waiting{executor="process"} 3' in sut
+    assert 'password_hasher_running{executor="process"} 4' in sut
+    assert 'password_hasher_rejected_total{executor="process"} 2' in sut
+    assert 'password_hasher_wait_seconds_bucket{executor="process",le="0.1"} 0' in sut
+    assert 'password_hasher_wait_seconds_bucket{executor="process",le="0.25"} 1' in sut
+    assert 'password_hasher_run_seconds_count{executor="process"} 1' in sut
+
+
+def test_renders_auth_session_cache_and_reaper_stats() -> None:
+    stats = AuthSessionStoreStats(
+        cache=AuthSessionCacheStats(hits=5, misses=2, size=3, max_size=10),
+        reaper=AuthSessionReaperStats(runs=4, failed_runs=1, deleted_sessions=7),
+    )
+
+    sut = render_auth_session_store_metrics(stats).splitlines()
+
+    assert "# TYPE auth_session_cache_hits_total counter" in sut
+    assert "auth_session_cache_hits_total 5" in sut
+    assert "auth_session_cache_size 3" in sut
+    assert "auth_session_reaper_failed_runs_total 1" in sut
+    assert "auth_session_reaper_deleted_sessions_total 7" in sut
+
+
+def test_renders_nothing_for_store_without_cache_or_reaper() -> None:
+    assert not render_auth_session_store_metrics(AuthSessionStoreStats())
+
+
+def test_serves_metrics_only_when_enabled() -> None:
+    def paths(*, expose_metrics: bool) -> set[str]:
+        router = create_general_router(expose_metrics=expose_metrics)
+        return {getattr(route, "path", "") for route in router.routes}
+
+    assert "/metrics" not in paths(expose_metrics=False)
+    assert "/metrics" in paths(expose_metrics=True)
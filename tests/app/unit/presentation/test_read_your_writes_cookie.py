@@ -0,0 +1,74 @@
+from datetime import UTC, datetime, timedelta
+from http.cookies import SimpleCookie
+
+import pytest
+from starlette.requests import Request
+from starlette.types import Message, Receive, Scope, Send
+
+from app.presentation.http.auth.cookie_params import CookieParams
+from app.presentation.http.persistence.asgi_middleware import (
+    ASGIReadYourWritesMiddleware,
+)
+from app.presentation.http.persistence.read_your_writes_cookie import (
+    COOKIE_READ_YOUR_WRITES_NAME,
+    CookieReadYourWritesTransport,
+)
+
+
+def create_scope(cookie: str | None = None) -> Scope:
+    headers = [] if cookie is None else [(b"cookie", cookie.encode())]
+    return {"type": "http", "method": "POST", "path": "/", "headers": headers}
+
+
+async def serve(window_end: datetime | None) -> list[Message]:
+    sent: list[Message] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG001
+        if window_end is not None:
+            CookieReadYourWritesTransport(Request(scope)).deliver(window_end)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def receive() -> Message:  # noqa: RUF029
+        return {"type": "http.request"}
+
+    async def send(message: Message) -> None:  # noqa: RUF029
+        sent.append(message)
+
+    sut = ASGIReadYourWritesMiddleware(app, cookie_params=CookieParams(secure=True))
+    await sut({**create_scope(), "state": {}}, receive, send)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_sets_cookie_the_next_request_reads_back() -> None:
+    window_end = datetime.now(UTC) + timedelta(seconds=5)
+
+    start, _ = await serve(window_end)
+
+    set_cookie = dict(start["headers"])[b"set-cookie"].decode()
+    assert "Secure" in set_cookie
+    assert "Max-Age=5" in set_cookie
+    cookie = SimpleCookie(set_cookie)
+    next_request = Request(
+        create_scope(
+            f"{COOKIE_READ_YOUR_WRITES_NAME}="
+            f"{cookie[COOKIE_READ_YOUR_WRITES_NAME].value}"
+        ),
+    )
+    extracted = CookieReadYourWritesTransport(next_request).extract()
+    assert extracted == window_end.replace(microsecond=0)
+
+
+@pytest.mark.asyncio
+async def test_sets_no_cookie_without_a_write() -> None:
+    start, _ = await serve(None)
+
+    assert start["headers"] == []
+
+
+@pytest.mark.parametrize("value", ["soon", "99999999999999999999"])
+def test_ignores_malformed_cookie(value: str) -> None:
+    request = Request(create_scope(f"{COOKIE_READ_YOUR_WRITES_NAME}={value}"))
+
+    assert CookieReadYourWritesTransport(request).extract() is None
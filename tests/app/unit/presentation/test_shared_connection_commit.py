@@ -0,0 +1,296 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import cast
+
+import pytest
+from sqlalchemy import Connection, Engine, create_engine, event, func, inspect, select
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import ConnectionPoolEntry
+from starlette.responses import Response, StreamingResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.application.common.query_params.sorting import SortingOrder
+from app.application.common.query_params.user import UserListSorting
+from app.domain.entities.user import User
+from app.infrastructure.adapters.types import QueryAsyncSession
+from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+from app.infrastructure.persistence_sqla.shared_connection import (
+    SharedRequestConnection,
+)
+from app.presentation.http.persistence.asgi_middleware import (
+    ASGISharedConnectionMiddleware,
+)
+from app.presentation.http.streaming.user_export import ExportFormat, encode_users
+from tests.app.unit.factories.user_entity import create_user
+from tests.app.unit.factories.value_objects import create_username
+
+
+class StubSharedConnection:
+    def __init__(self, sent: list[Message], *, fails: bool = False):
+        self._sent = sent
+        self._fails = fails
+        self.committed_after: int | None = None
+        self.rolled_back_after: int | None = None
+
+    async def commit(self) -> None:
+        self.committed_after = len(self._sent)
+        if self._fails:
+            raise DataMapperError("Commit failed.")
+
+    async def rollback(self) -> None:
+        self.rolled_back_after = len(self._sent)
+
+
+class StubContainer:
+    def __init__(
+        self,
+        shared_connection: StubSharedConnection | SharedRequestConnection,
+    ):
+        self._shared_connection = shared_connection
+
+    async def get(self, _: type) -> StubSharedConnection | SharedRequestConnection:
+        return self._shared_connection
+
+
+class SyncBackedConnection:
+    """The part of `AsyncConnection` the shared connection uses, over SQLite."""
+
+    def __init__(self, connection: Connection, sent: list[Message]):
+        self._connection = connection
+        self._sent = sent
+        self.committed_after: int | None = None
+
+    def in_transaction(self) -> bool:
+        return self._connection.in_transaction()
+
+    async def commit(self) -> None:
+        self.committed_after = len(self._sent)
+        self._connection.commit()
+
+    async def rollback(self) -> None:
+        self._connection.rollback()
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    if inspect(User, raiseerr=False) is None:
+        map_tables()
+    engine = create_engine(f"sqlite:///{tmp_path / 'shared.db'}")
+
+    # pysqlite needs its own transaction handling off for SAVEPOINTs to work.
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: DBAPIConnection, _: ConnectionPoolEntry) -> None:
+        dbapi_connection.isolation_level = None  # type: ignore[attr-defined]
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+    mapping_registry.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def create_session(connection: Connection) -> AsyncSession:
+    """The async session API, run over a sync SQLite connection."""
+    session = AsyncSession(
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    session.sync_session.bind = connection
+    return session
+
+
+def count_users(engine: Engine) -> int:
+    with Session(engine) as session:
+        return session.scalar(select(func.count()).select_from(User)) or 0
+
+
+async def app(scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG001
+    await send({"type": "http.response.start", "status": 201, "headers": []})
+    await send({"type": "http.response.body", "body": b"created"})
+
+
+async def call(
+    sut: ASGIApp,
+    sent: list[Message],
+    shared_connection: StubSharedConnection | SharedRequestConnection,
+) -> None:
+    async def receive() -> Message:
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:  # noqa: RUF029
+        sent.append(message)
+
+    scope: Scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/users",
+        "headers": [],
+        "state": {"dishka_container": StubContainer(shared_connection)},
+    }
+    await sut(scope, receive, send)
+
+
+@pytest.mark.asyncio
+async def test_commits_before_the_response_starts() -> None:
+    sent: list[Message] = []
+    shared_connection = StubSharedConnection(sent)
+
+    await call(ASGISharedConnectionMiddleware(app), sent, shared_connection)
+
+    assert shared_connection.committed_after == 0
+    assert [message.get("status") for message in sent] == [201, None]
+
+
+@pytest.mark.asyncio
+async def test_failing_commit_replaces_the_response() -> None:
+    sent: list[Message] = []
+    shared_connection = StubSharedConnection(sent, fails=True)
+
+    await call(ASGISharedConnectionMiddleware(app), sent, shared_connection)
+
+    start, body = sent
+    assert start["status"] == 503
+    assert "error" in json.loads(body["body"])
+
+
+@pytest.mark.asyncio
+async def test_error_response_rolls_back_instead_of_committing() -> None:
+    sent: list[Message] = []
+    shared_connection = StubSharedConnection(sent)
+
+    await call(
+        ASGISharedConnectionMiddleware(Response("taken", status_code=409)),
+        sent,
+        shared_connection,
+    )
+
+    assert shared_connection.committed_after is None
+    assert shared_connection.rolled_back_after == 0
+    assert sent[0]["status"] == 409
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_commits_before_its_last_message() -> None:
+    sent: list[Message] = []
+    shared_connection = StubSharedConnection(sent)
+
+    async def chunks() -> AsyncIterator[bytes]:  # noqa: RUF029
+        yield b"first"
+        yield b"second"
+
+    await call(
+        ASGISharedConnectionMiddleware(StreamingResponse(chunks())),
+        sent,
+        shared_connection,
+    )
+
+    assert shared_connection.committed_after == len(sent) - 1
+    assert [message.get("body") for message in sent] == [
+        None,
+        b"first",
+        b"second",
+        b"",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_handler_flushing_then_raising_persists_nothing(engine: Engine) -> None:
+    sent: list[Message] = []
+    shared_connection = SharedRequestConnection()
+
+    async def flushing_app(scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG001
+        session = create_session(connection)
+        shared_connection.track(session)
+        session.add(create_user())
+        await session.flush()
+        raise RuntimeError
+
+    with engine.connect() as connection:
+        connection.begin()
+        shared_connection.attach(
+            cast(AsyncConnection, SyncBackedConnection(connection, sent)),
+        )
+        with pytest.raises(RuntimeError):
+            await call(
+                ASGISharedConnectionMiddleware(flushing_app),
+                sent,
+                shared_connection,
+            )
+
+    assert count_users(engine) == 0
+
+
+@pytest.mark.asyncio
+async def test_commits_only_what_sessions_committed(engine: Engine) -> None:
+    sent: list[Message] = []
+    shared_connection = SharedRequestConnection()
+
+    async def handler_app(scope: Scope, receive: Receive, send: Send) -> None:
+        auth_session = create_session(connection)
+        shared_connection.track(auth_session)
+        await auth_session.scalar(select(func.count()).select_from(User))
+
+        main_session = create_session(connection)
+        shared_connection.track(main_session)
+        main_session.add(create_user(username=create_username("Alice")))
+        await main_session.commit()
+        main_session.add(create_user(username=create_username("Bobby")))
+        await main_session.flush()
+
+        await app(scope, receive, send)
+
+    with engine.connect() as connection:
+        connection.begin()
+        shared_connection.attach(
+            cast(AsyncConnection, SyncBackedConnection(connection, sent)),
+        )
+        await call(ASGISharedConnectionMiddleware(handler_app), sent, shared_connection)
+
+    assert count_users(engine) == 1
+    assert sent[0]["status"] == 201
+
+
+@pytest.mark.asyncio
+async def test_export_streams_every_user_over_the_shared_connection(
+    engine: Engine,
+) -> None:
+    usernames = ["Alice", "Bobby", "Carol"]
+    with Session(engine) as session:
+        session.add_all(
+            create_user(username=create_username(username)) for username in usernames
+        )
+        session.commit()
+    sent: list[Message] = []
+    shared_connection = SharedRequestConnection()
+
+    async def export_app(scope: Scope, receive: Receive, send: Send) -> None:
+        session = create_session(connection)
+        shared_connection.track(session)
+        reader = SqlaUserReader(QueryAsyncSession(session))
+        chunks = await reader.stream_all(
+            UserListSorting(sorting_field="username", sorting_order=SortingOrder.ASC),
+        )
+        assert chunks is not None
+        response = StreamingResponse(encode_users(chunks, ExportFormat.NDJSON))
+        await response(scope, receive, send)
+
+    with engine.connect() as connection:
+        connection.begin()
+        sync_backed = SyncBackedConnection(connection, sent)
+        shared_connection.attach(cast(AsyncConnection, sync_backed))
+        await call(ASGISharedConnectionMiddleware(export_app), sent, shared_connection)
+
+    body = b"".join(message.get("body", b"") for message in sent)
+    assert [json.loads(line)["username"] for line in body.splitlines()] == usernames
+    assert sync_backed.committed_after == len(sent) - 1
@@ -0,0 +1,87 @@
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.persistence_sqla.statement_counter import track_statements
+from app.presentation.http.profiling.asgi_middleware import (
+    ASGISqlProfilingMiddleware,
+    SqlProfilingConfig,
+)
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    track_statements(engine)
+    yield engine
+    engine.dispose()
+
+
+def create_app(engine: Engine, statements: int) -> ASGIApp:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG001
+        with engine.connect() as conn:
+            for i in range(statements):
+                conn.execute(text("SELECT :i"), {"i": i})
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+async def call(sut: ASGISqlProfilingMiddleware) -> list[Message]:
+    sent: list[Message] = []
+
+    async def receive() -> Message:  # noqa: RUF029
+        return {"type": "http.request"}
+
+    async def send(message: Message) -> None:  # noqa: RUF029
+        sent.append(message)
+
+    scope: Scope = {"type": "http", "method": "GET", "path": "/users", "headers": []}
+    await sut(scope, receive, send)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_sets_server_timing_header(engine: Engine) -> None:
+    sut = ASGISqlProfilingMiddleware(
+        create_app(engine, 2),
+        SqlProfilingConfig(n_plus_one_threshold=3, server_timing=True),
+    )
+
+    start, _ = await call(sut)
+
+    header = dict(start["headers"])[b"server-timing"].decode()
+    assert header.startswith("db;dur=")
+    assert 'desc="2 statements"' in header
+
+
+@pytest.mark.asyncio
+async def test_omits_server_timing_header_when_disabled(engine: Engine) -> None:
+    sut = ASGISqlProfilingMiddleware(
+        create_app(engine, 2),
+        SqlProfilingConfig(n_plus_one_threshold=3, server_timing=False),
+    )
+
+    start, _ = await call(sut)
+
+    assert b"server-timing" not in dict(start["headers"])
+
+
+@pytest.mark.asyncio
+async def test_warns_on_likely_n_plus_one(
+    engine: Engine,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    sut = ASGISqlProfilingMiddleware(
+        create_app(engine, 3),
+        SqlProfilingConfig(n_plus_one_threshold=3, server_timing=False),
+    )
+
+    await call(sut)
+
+    warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+    assert len(warnings) == 1
+    assert warnings[0].__dict__["sql_repeated"] == {"SELECT ?": 3}
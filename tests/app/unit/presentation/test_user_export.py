@@ -0,0 +1,82 @@
+from collections.abc import AsyncGenerator
+from uuid import UUID
+
+import orjson
+import pytest
+
+from app.application.common.query_models.user import UserQueryModel
+from app.domain.enums.user_role import UserRole
+from app.presentation.http.streaming.user_export import (
+    ExportFormat,
+    encode_users,
+)
+
+USER_ID = UUID("01982b4c-5a9e-7c3f-8d2a-6b1e4f0c9a77")
+
+
+def create_user_query_model(username: str = "alice") -> UserQueryModel:
+    return UserQueryModel(
+        id_=USER_ID,
+        username=username,
+        role=UserRole.ADMIN,
+        is_active=True,
+    )
+
+
+class ChunkSource:
+    def __init__(self, chunks: list[list[UserQueryModel]]):
+        self._chunks = chunks
+        self.is_closed = False
+
+    async def stream(self) -> AsyncGenerator[list[UserQueryModel]]:
+        try:
+            for chunk in self._chunks:
+                yield chunk
+        finally:
+            self.is_closed = True
+
+
+@pytest.mark.asyncio
+async def test_encodes_one_ndjson_line_per_user() -> None:
+    source = ChunkSource([
+        [create_user_query_model("alice")],
+        [create_user_query_model("bob")],
+    ])
+
+    body = b"".join([
+        chunk async for chunk in encode_users(source.stream(), ExportFormat.NDJSON)
+    ])
+
+    lines = [orjson.loads(line) for line in body.splitlines()]
+    assert [line["username"] for line in lines] == ["alice", "bob"]
+    assert lines[0] == {
+        "id": str(USER_ID),
+        "username": "alice",
+        "role": UserRole.ADMIN.value,
+        "is_active": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_encodes_csv_with_header() -> None:
+    source = ChunkSource([[create_user_query_model("alice")]])
+
+    body = b"".join([
+        chunk async for chunk in encode_users(source.stream(), ExportFormat.CSV)
+    ])
+
+    assert body.decode().splitlines() == [
+        "id,username,role,is_active",
+        f"{USER_ID},alice,{UserRole.ADMIN.value},True",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_releases_source_when_client_stops_reading() -> None:
+    source = ChunkSource([[create_user_query_model()]] * 3)
+    sut = encode_users(source.stream(), ExportFormat.NDJSON)
+
+    await anext(sut)
+    await sut.aclose()
+
+    assert source.is_closed
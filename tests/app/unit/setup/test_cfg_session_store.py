@@ -0,0 +1,27 @@
+import pytest
+from pydantic import ValidationError
+
+from app.setup.config.session_store import (
+    AuthSessionBackend,
+    AuthSessionStoreSettings,
+)
+
+
+def test_session_store_defaults_to_sqla() -> None:
+    sut = AuthSessionStoreSettings.model_validate({})
+
+    assert sut.backend == AuthSessionBackend.SQLA
+
+
+def test_session_store_requires_redis_url_for_redis_backend() -> None:
+    with pytest.raises(ValidationError):
+        AuthSessionStoreSettings.model_validate({"BACKEND": "redis"})
+
+
+def test_session_store_accepts_redis_backend_with_url() -> None:
+    sut = AuthSessionStoreSettings.model_validate({
+        "BACKEND": "redis",
+        "REDIS_URL": "redis://localhost:6379/0",
+    })
+
+    assert sut.redis_url == "redis://localhost:6379/0"
@@ -0,0 +1,93 @@
+from typing import Any
+
+import pytest
+from dishka import make_async_container
+
+from app.domain.ports.password_hasher import PasswordHasher
+from app.infrastructure.adapters.password_hasher_pooled import (
+    PasswordHasherExecutor,
+    PasswordHasherPool,
+    PasswordHasherPoolConfig,
+)
+from app.setup.config.settings import AppSettings
+from app.setup.ioc.domain import DomainProvider
+from app.setup.ioc.settings import SettingsProvider
+from tests.app.unit.factories.settings_data import (
+    create_auth_settings_data,
+    create_postgres_settings_data,
+)
+from tests.app.unit.factories.value_objects import create_raw_password
+
+
+def create_app_settings(**password: Any) -> AppSettings:
+    return AppSettings.model_validate({
+        "postgres": create_postgres_settings_data(),
+        "sqla": {"ECHO": False, "ECHO_POOL": False, "POOL_SIZE": 1, "MAX_OVERFLOW": 0},
+        "security": {
+            "auth": create_auth_settings_data(),
+            "cookies": {"SECURE": False},
+            "password": {"PEPPER": "pepper", "BCRYPT_ROUNDS": 4, **password},
+        },
+        "logs": {"LEVEL": "INFO"},
+    })
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", list(PasswordHasherExecutor))
+async def test_resolves_password_hasher_pool_with_configured_executor(
+    executor: PasswordHasherExecutor,
+) -> None:
+    container = make_async_container(
+        DomainProvider(),
+        SettingsProvider(),
+        context={AppSettings: create_app_settings(HASHER_EXECUTOR=executor.value)},
+    )
+    try:
+        assert isinstance(await container.get(PasswordHasherPool), PasswordHasherPool)
+        config = await container.get(PasswordHasherPoolConfig)
+        assert config.executor == executor
+    finally:
+        await container.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm", ["bcrypt", "scrypt"])
+async def test_resolves_password_hasher_that_hashes_and_verifies(
+    algorithm: str,
+) -> None:
+    container = make_async_container(
+        DomainProvider(),
+        SettingsProvider(),
+        context={AppSettings: create_app_settings(ALGORITHM=algorithm)},
+    )
+    try:
+        async with container() as request_container:
+            sut = await request_container.get(PasswordHasher)
+            hashed = await sut.hash(create_raw_password())
+            assert await sut.verify(
+                raw_password=create_raw_password(),
+                hashed_password=hashed,
+            )
+    finally:
+        await container.close()
+
+
+@pytest.mark.asyncio
+async def test_resolves_background_workers_from_the_app_container() -> None:
+    # The app's requests and responses need the diator fork, not the PyPI release.
+    pytest.importorskip("diator.responses")
+    from app.infrastructure.background.worker import (  # noqa: PLC0415
+        BackgroundWorkers,
+    )
+    from app.setup.ioc.provider_registry import get_providers  # noqa: PLC0415
+
+    settings = create_app_settings()
+    container = make_async_container(
+        *get_providers(settings),
+        context={AppSettings: settings},
+    )
+    try:
+        workers = await container.get(BackgroundWorkers)
+        assert await container.get(PasswordHasherPool) in workers
+    finally:
+        await container.close()